@@ -28,113 +28,129 @@ subagents = [
 toolset = create_subagent_toolset(subagents=subagents)
 agent = Agent("openai:gpt-4.1", toolsets=[toolset])
 ```
+
+Public symbols are loaded lazily (PEP 562): importing the package does not
+pull in pydantic_ai or the submodules until a symbol is actually accessed,
+which keeps cold-start time and baseline memory low for consumers that only
+need part of the API.
 """
 
-from subagents_pydantic_ai.capability import (
-    SubAgentCapability as SubAgentCapability,
-)
-from subagents_pydantic_ai.factory import (
-    create_agent_factory_toolset as create_agent_factory_toolset,
-)
-from subagents_pydantic_ai.message_bus import (
-    InMemoryMessageBus as InMemoryMessageBus,
-)
-from subagents_pydantic_ai.message_bus import (
-    TaskManager as TaskManager,
-)
-from subagents_pydantic_ai.message_bus import (
-    create_message_bus as create_message_bus,
-)
-from subagents_pydantic_ai.prompts import (
-    ANSWER_SUBAGENT_DESCRIPTION as ANSWER_SUBAGENT_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    CHECK_TASK_DESCRIPTION as CHECK_TASK_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    DEFAULT_GENERAL_PURPOSE_DESCRIPTION as DEFAULT_GENERAL_PURPOSE_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    DUAL_MODE_SYSTEM_PROMPT as DUAL_MODE_SYSTEM_PROMPT,
-)
-from subagents_pydantic_ai.prompts import (
-    HARD_CANCEL_TASK_DESCRIPTION as HARD_CANCEL_TASK_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    LIST_ACTIVE_TASKS_DESCRIPTION as LIST_ACTIVE_TASKS_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    SOFT_CANCEL_TASK_DESCRIPTION as SOFT_CANCEL_TASK_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    SUBAGENT_SYSTEM_PROMPT as SUBAGENT_SYSTEM_PROMPT,
-)
-from subagents_pydantic_ai.prompts import (
-    TASK_TOOL_DESCRIPTION as TASK_TOOL_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    WAIT_TASKS_DESCRIPTION as WAIT_TASKS_DESCRIPTION,
-)
-from subagents_pydantic_ai.prompts import (
-    get_subagent_system_prompt as get_subagent_system_prompt,
-)
-from subagents_pydantic_ai.prompts import (
-    get_task_instructions_prompt as get_task_instructions_prompt,
-)
-from subagents_pydantic_ai.protocols import (
-    MessageBusProtocol as MessageBusProtocol,
-)
-from subagents_pydantic_ai.protocols import (
-    SubAgentDepsProtocol as SubAgentDepsProtocol,
-)
-from subagents_pydantic_ai.registry import (
-    DynamicAgentRegistry as DynamicAgentRegistry,
-)
-from subagents_pydantic_ai.spec import (
-    SubAgentSpec as SubAgentSpec,
-)
-from subagents_pydantic_ai.toolset import (
-    SubAgentToolset as SubAgentToolset,
-)
-from subagents_pydantic_ai.toolset import (
-    create_subagent_toolset as create_subagent_toolset,
-)
-from subagents_pydantic_ai.types import (
-    AgentMessage as AgentMessage,
-)
-from subagents_pydantic_ai.types import (
-    AskUserCallback as AskUserCallback,
-)
-from subagents_pydantic_ai.types import (
-    CompiledSubAgent as CompiledSubAgent,
-)
-from subagents_pydantic_ai.types import (
-    ExecutionMode as ExecutionMode,
-)
-from subagents_pydantic_ai.types import (
-    MessageType as MessageType,
-)
-from subagents_pydantic_ai.types import (
-    SubAgentConfig as SubAgentConfig,
-)
-from subagents_pydantic_ai.types import (
-    TaskCharacteristics as TaskCharacteristics,
-)
-from subagents_pydantic_ai.types import (
-    TaskHandle as TaskHandle,
-)
-from subagents_pydantic_ai.types import (
-    TaskPriority as TaskPriority,
-)
-from subagents_pydantic_ai.types import (
-    TaskStatus as TaskStatus,
-)
-from subagents_pydantic_ai.types import (
-    ToolsetFactory as ToolsetFactory,
-)
-from subagents_pydantic_ai.types import (
-    decide_execution_mode as decide_execution_mode,
-)
+from importlib import import_module
+from importlib.metadata import version
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from subagents_pydantic_ai.capability import (
+        SubAgentCapability as SubAgentCapability,
+    )
+    from subagents_pydantic_ai.factory import (
+        create_agent_factory_toolset as create_agent_factory_toolset,
+    )
+    from subagents_pydantic_ai.message_bus import (
+        InMemoryMessageBus as InMemoryMessageBus,
+    )
+    from subagents_pydantic_ai.message_bus import (
+        TaskManager as TaskManager,
+    )
+    from subagents_pydantic_ai.message_bus import (
+        build_message as build_message,
+    )
+    from subagents_pydantic_ai.message_bus import (
+        create_message_bus as create_message_bus,
+    )
+    from subagents_pydantic_ai.prompts import (
+        ANSWER_SUBAGENT_DESCRIPTION as ANSWER_SUBAGENT_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        CHECK_TASK_DESCRIPTION as CHECK_TASK_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        DEFAULT_GENERAL_PURPOSE_DESCRIPTION as DEFAULT_GENERAL_PURPOSE_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        DUAL_MODE_SYSTEM_PROMPT as DUAL_MODE_SYSTEM_PROMPT,
+    )
+    from subagents_pydantic_ai.prompts import (
+        HARD_CANCEL_TASK_DESCRIPTION as HARD_CANCEL_TASK_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        LIST_ACTIVE_TASKS_DESCRIPTION as LIST_ACTIVE_TASKS_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        SOFT_CANCEL_TASK_DESCRIPTION as SOFT_CANCEL_TASK_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        SUBAGENT_SYSTEM_PROMPT as SUBAGENT_SYSTEM_PROMPT,
+    )
+    from subagents_pydantic_ai.prompts import (
+        TASK_TOOL_DESCRIPTION as TASK_TOOL_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        WAIT_TASKS_DESCRIPTION as WAIT_TASKS_DESCRIPTION,
+    )
+    from subagents_pydantic_ai.prompts import (
+        get_subagent_system_prompt as get_subagent_system_prompt,
+    )
+    from subagents_pydantic_ai.prompts import (
+        get_task_instructions_prompt as get_task_instructions_prompt,
+    )
+    from subagents_pydantic_ai.protocols import (
+        MessageBusProtocol as MessageBusProtocol,
+    )
+    from subagents_pydantic_ai.protocols import (
+        SubAgentDepsProtocol as SubAgentDepsProtocol,
+    )
+    from subagents_pydantic_ai.redis_bus import (
+        RedisMessageBus as RedisMessageBus,
+    )
+    from subagents_pydantic_ai.registry import (
+        DynamicAgentRegistry as DynamicAgentRegistry,
+    )
+    from subagents_pydantic_ai.spec import (
+        SubAgentSpec as SubAgentSpec,
+    )
+    from subagents_pydantic_ai.toolset import (
+        SubAgentToolset as SubAgentToolset,
+    )
+    from subagents_pydantic_ai.toolset import (
+        create_subagent_toolset as create_subagent_toolset,
+    )
+    from subagents_pydantic_ai.types import (
+        AgentMessage as AgentMessage,
+    )
+    from subagents_pydantic_ai.types import (
+        AskUserCallback as AskUserCallback,
+    )
+    from subagents_pydantic_ai.types import (
+        CompiledSubAgent as CompiledSubAgent,
+    )
+    from subagents_pydantic_ai.types import (
+        ExecutionMode as ExecutionMode,
+    )
+    from subagents_pydantic_ai.types import (
+        MessageType as MessageType,
+    )
+    from subagents_pydantic_ai.types import (
+        SubAgentConfig as SubAgentConfig,
+    )
+    from subagents_pydantic_ai.types import (
+        TaskCharacteristics as TaskCharacteristics,
+    )
+    from subagents_pydantic_ai.types import (
+        TaskHandle as TaskHandle,
+    )
+    from subagents_pydantic_ai.types import (
+        TaskPriority as TaskPriority,
+    )
+    from subagents_pydantic_ai.types import (
+        TaskStatus as TaskStatus,
+    )
+    from subagents_pydantic_ai.types import (
+        ToolsetFactory as ToolsetFactory,
+    )
+    from subagents_pydantic_ai.types import (
+        decide_execution_mode as decide_execution_mode,
+    )
 
 __all__ = [
     # Capability
@@ -163,6 +179,8 @@ __all__ = [
     "create_agent_factory_toolset",
     # Message Bus
     "InMemoryMessageBus",
+    "RedisMessageBus",
+    "build_message",
     "create_message_bus",
     "TaskManager",
     # Registry
@@ -185,6 +203,62 @@ __all__ = [
     "__version__",
 ]
 
-from importlib.metadata import version
+# Maps each public symbol to its defining submodule for lazy loading.
+_LAZY = {
+    "SubAgentCapability": "subagents_pydantic_ai.capability",
+    "create_agent_factory_toolset": "subagents_pydantic_ai.factory",
+    "InMemoryMessageBus": "subagents_pydantic_ai.message_bus",
+    "TaskManager": "subagents_pydantic_ai.message_bus",
+    "build_message": "subagents_pydantic_ai.message_bus",
+    "create_message_bus": "subagents_pydantic_ai.message_bus",
+    "ANSWER_SUBAGENT_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "CHECK_TASK_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "DEFAULT_GENERAL_PURPOSE_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "DUAL_MODE_SYSTEM_PROMPT": "subagents_pydantic_ai.prompts",
+    "HARD_CANCEL_TASK_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "LIST_ACTIVE_TASKS_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "SOFT_CANCEL_TASK_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "SUBAGENT_SYSTEM_PROMPT": "subagents_pydantic_ai.prompts",
+    "TASK_TOOL_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "WAIT_TASKS_DESCRIPTION": "subagents_pydantic_ai.prompts",
+    "get_subagent_system_prompt": "subagents_pydantic_ai.prompts",
+    "get_task_instructions_prompt": "subagents_pydantic_ai.prompts",
+    "MessageBusProtocol": "subagents_pydantic_ai.protocols",
+    "SubAgentDepsProtocol": "subagents_pydantic_ai.protocols",
+    "RedisMessageBus": "subagents_pydantic_ai.redis_bus",
+    "DynamicAgentRegistry": "subagents_pydantic_ai.registry",
+    "SubAgentSpec": "subagents_pydantic_ai.spec",
+    "SubAgentToolset": "subagents_pydantic_ai.toolset",
+    "create_subagent_toolset": "subagents_pydantic_ai.toolset",
+    "AgentMessage": "subagents_pydantic_ai.types",
+    "AskUserCallback": "subagents_pydantic_ai.types",
+    "CompiledSubAgent": "subagents_pydantic_ai.types",
+    "ExecutionMode": "subagents_pydantic_ai.types",
+    "MessageType": "subagents_pydantic_ai.types",
+    "SubAgentConfig": "subagents_pydantic_ai.types",
+    "TaskCharacteristics": "subagents_pydantic_ai.types",
+    "TaskHandle": "subagents_pydantic_ai.types",
+    "TaskPriority": "subagents_pydantic_ai.types",
+    "TaskStatus": "subagents_pydantic_ai.types",
+    "ToolsetFactory": "subagents_pydantic_ai.types",
+    "decide_execution_mode": "subagents_pydantic_ai.types",
+}
+
+
+def __getattr__(name: str) -> object:
+    """Load public symbols on first access (PEP 562)."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    attr = getattr(import_module(module_name), name)
+    # Cache so subsequent accesses skip __getattr__ entirely
+    globals()[name] = attr
+    return attr
+
+
+def __dir__() -> list[str]:
+    """Expose the lazy symbols for introspection and completion."""
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __version__ = version("subagents-pydantic-ai")
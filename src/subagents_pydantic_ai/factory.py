@@ -6,6 +6,7 @@ new specialized agents at runtime.
 
 from __future__ import annotations
 
+import re
 from typing import Any
 
 from pydantic_ai import Agent, RunContext
@@ -19,6 +20,19 @@ from subagents_pydantic_ai.types import SubAgentConfig, ToolsetFactory
 # Type alias for capability factory functions
 CapabilityFactory = ToolsetFactory
 
+# Valid agent names: ASCII letters, digits, and hyphens. Deliberately
+# stricter than str.isalnum(), which is Unicode-aware and would accept
+# names like "café".
+_NAME_RE = re.compile(r"[A-Za-z0-9-]+")
+
+# Success message built once; create_agent fills it with a single format call.
+_CREATE_SUCCESS_TPL = (
+    "Agent '{name}' created successfully.\n"
+    "Model: {model}\n"
+    "Description: {description}{caps_info}\n"
+    "Use task(description, '{name}') to delegate tasks."
+)
+
 
 def create_agent_factory_toolset(
     registry: DynamicAgentRegistry,
@@ -79,14 +93,22 @@ def create_agent_factory_toolset(
     # Update registry max_agents
     registry.max_agents = max_agents
 
+    # Pre-compile validation sets and error strings once — allowed_models and
+    # capabilities_map are fixed for the lifetime of the toolset, so each
+    # create_agent call only pays hash lookups.
+    allowed_models_set = frozenset(allowed_models) if allowed_models else None
+    allowed_models_str = ", ".join(allowed_models) if allowed_models else ""
+    caps_set = frozenset(capabilities_map) if capabilities_map else None
+    caps_str = ", ".join(capabilities_map) if capabilities_map else ""
+
     # Format allowed models for docstring
     models_desc = (
-        f"Allowed models: {', '.join(allowed_models)}" if allowed_models else "Any model is allowed"
+        f"Allowed models: {allowed_models_str}" if allowed_models else "Any model is allowed"
     )
 
     # Format available capabilities for docstring
     caps_desc = (
-        f"Available capabilities: {', '.join(capabilities_map.keys())}"
+        f"Available capabilities: {caps_str}"
         if capabilities_map
         else "No predefined capabilities available"
     )
@@ -124,25 +146,23 @@ def create_agent_factory_toolset(
             Confirmation message or error.
         """
         # Validate name
-        if not name or not all(c.isalnum() or c == "-" for c in name):
+        if not name or not _NAME_RE.fullmatch(name):
             return "Error: Name must contain only letters, numbers, and hyphens"
 
-        if registry.exists(name):
+        if name in registry:
             return f"Error: Agent '{name}' already exists"
 
         # Validate model
         actual_model = model or default_model
-        if allowed_models and actual_model not in allowed_models:
-            allowed = ", ".join(allowed_models)
-            return f"Error: Model '{actual_model}' is not allowed. Use one of: {allowed}"
+        if allowed_models_set and actual_model not in allowed_models_set:
+            return f"Error: Model '{actual_model}' is not allowed. Use one of: {allowed_models_str}"
 
         # Validate capabilities
-        if capabilities and capabilities_map:
-            invalid_caps = [c for c in capabilities if c not in capabilities_map]
+        if capabilities and caps_set:
+            invalid_caps = [c for c in capabilities if c not in caps_set]
             if invalid_caps:
-                available = ", ".join(capabilities_map.keys())
                 invalid = ", ".join(invalid_caps)
-                return f"Error: Unknown capabilities: {invalid}. Available: {available}"
+                return f"Error: Unknown capabilities: {invalid}. Available: {caps_str}"
 
         # Create config
         config = SubAgentConfig(
@@ -175,12 +195,12 @@ def create_agent_factory_toolset(
 
             registry.register(config, agent)
 
-            caps_info = f"\nCapabilities: {', '.join(capabilities)}" if capabilities else ""
-            return (
-                f"Agent '{name}' created successfully.\n"
-                f"Model: {actual_model}\n"
-                f"Description: {description}{caps_info}\n"
-                f"Use task(description, '{name}') to delegate tasks."
+            caps_info = "\nCapabilities: " + ", ".join(capabilities) if capabilities else ""
+            return _CREATE_SUCCESS_TPL.format(
+                name=name,
+                model=actual_model,
+                description=description,
+                caps_info=caps_info,
             )
 
         except ValueError as e:
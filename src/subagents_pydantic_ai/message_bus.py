@@ -3,23 +3,251 @@
 This module provides message bus implementations that enable communication
 between parent agents and subagents. The default implementation uses
 asyncio queues for in-memory communication.
+
+Note on queue internals: `_drain_queue_fast` drains our own
+`SingleConsumerQueue` by swapping out its internal deque, letting
+`get_messages` empty a full queue in one C-level operation instead of
+one `get_nowait()` call per message. Any other queue type (e.g. an
+asyncio.Queue supplied by a custom bus) takes the per-message loop so
+its own bookkeeping stays intact.
 """
 
 from __future__ import annotations
 
 import asyncio
-import uuid
-from collections.abc import Awaitable, Callable
+import collections
+import contextlib
+import contextvars
+import functools
+import heapq
+import itertools
+import os
+import sys
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterator, MutableMapping
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from subagents_pydantic_ai.redis_bus import RedisMessageBus
+
+from subagents_pydantic_ai.types import (
+    AgentMessage,
+    MessageType,
+    TaskPriority,
+    TaskStatus,
+    _generate_message_id,
+)
+
+_current_task_id: contextvars.ContextVar[str | None] = contextvars.ContextVar(
+    "_current_task_id", default=None
+)
+"""Task ID of the task whose coroutine is currently executing.
+
+`TaskManager.create_task` binds this in the context each background task
+runs in, so code called from inside a task can build correlated messages
+without threading the ID through every function signature (see
+`build_message`)."""
+
+# Opt-in AgentMessage freelist. Enabled via SUBAGENTS_MSG_POOL=1: recycled
+# instances are reused by the bus's internal message construction, cutting
+# young-gen GC pressure on burst traffic (e.g. broadcast cancellations).
+# Only safe when consumers don't retain message references after handing
+# them back via `_release_message` — hence off by default.
+_POOL_ENABLED = os.environ.get("SUBAGENTS_MSG_POOL", "").lower() in ("1", "true", "yes")
+_MSG_POOL: collections.deque[AgentMessage] = collections.deque(maxlen=1024)
+
+# asyncio.timeout (3.11+) arms a timer handle on the current task instead of
+# wrapping the awaited coroutine in an extra Task with callback bookkeeping
+# the way wait_for does. The project floor is 3.10, so fall back to wait_for
+# where it's missing. Used on the get_messages waiter path.
+_asyncio_timeout = getattr(asyncio, "timeout", None)
+
+# asyncio.Task grew eager_start in 3.12: the coroutine runs synchronously up
+# to its first suspension, so tasks that never await (or hit a cached fast
+# path) finish without a scheduling round-trip through the event loop.
+_EAGER_TASKS = sys.version_info >= (3, 12)
+
+
+def _acquire_message(
+    type: MessageType,
+    sender: str,
+    receiver: str,
+    payload: Any,
+    task_id: str,
+    correlation_id: int | str | None = None,
+) -> AgentMessage:
+    """Construct an AgentMessage, reusing a pooled instance when enabled.
+
+    Recycled messages get a fresh id and timestamp, so they are
+    indistinguishable from newly allocated ones.
+    """
+    if _POOL_ENABLED and _MSG_POOL:
+        from datetime import datetime
+
+        message = _MSG_POOL.pop()
+        message.type = type
+        message.sender = sender
+        message.receiver = receiver
+        message.payload = payload
+        message.task_id = task_id
+        message.id = _generate_message_id()
+        message.timestamp = datetime.now()
+        message.correlation_id = correlation_id
+        return message
+
+    return AgentMessage(
+        type=type,
+        sender=sender,
+        receiver=receiver,
+        payload=payload,
+        task_id=task_id,
+        correlation_id=correlation_id,
+    )
+
+
+def _release_message(message: AgentMessage) -> None:
+    """Return a consumed message to the freelist (no-op when pooling is off).
+
+    Callers must not retain any reference to the message afterwards.
+    """
+    if _POOL_ENABLED:
+        _MSG_POOL.append(message)
+
+
+def build_message(
+    type: MessageType,
+    sender: str,
+    receiver: str,
+    payload: Any,
+    *,
+    task_id: str | None = None,
+    correlation_id: int | str | None = None,
+) -> AgentMessage:
+    """Build an AgentMessage, defaulting `task_id` from the ambient context.
 
-from subagents_pydantic_ai.types import AgentMessage, MessageType
+    When called from inside a coroutine started via `TaskManager.create_task`,
+    the task's ID is picked up automatically, so per-task code does not need
+    to thread the ID through every call just to stamp messages with it.
+
+    Args:
+        type: The message type.
+        sender: ID of the sending agent.
+        receiver: ID of the receiving agent.
+        payload: Message-specific data.
+        task_id: Explicit task ID; overrides the ambient one when given.
+        correlation_id: Optional request-response correlation ID.
+
+    Returns:
+        The constructed message.
+    """
+    if task_id is None:
+        task_id = _current_task_id.get() or ""
+    return _acquire_message(
+        type=type,
+        sender=sender,
+        receiver=receiver,
+        payload=payload,
+        task_id=task_id,
+        correlation_id=correlation_id,
+    )
+
+
+class SingleConsumerQueue:
+    """Minimal deque-backed queue for one consumer per agent.
+
+    asyncio.Queue pays for getter/putter wakeup bookkeeping and an
+    unfinished-task counter on every operation; with exactly one
+    consumer per agent queue none of that is needed. This class keeps
+    just a deque and one Event, roughly halving per-message overhead on
+    bursty traffic. `_drain_queue_fast` bulk-drains the internal deque
+    directly.
+    """
+
+    __slots__ = ("_queue", "_event")
+
+    def __init__(self) -> None:
+        self._queue: collections.deque[AgentMessage] = collections.deque()
+        self._event = asyncio.Event()
+
+    def put_nowait(self, message: AgentMessage) -> None:
+        """Append a message and wake the consumer (never blocks).
+
+        The event is set only on the empty-to-non-empty transition: every
+        drain path clears it when the deque empties, so a non-empty deque
+        already has it set and burst producers skip the wakeup call.
+        """
+        queue = self._queue
+        was_empty = not queue
+        queue.append(message)
+        if was_empty:
+            self._event.set()
+
+    def get_nowait(self) -> AgentMessage:
+        """Pop the oldest message.
+
+        Raises:
+            asyncio.QueueEmpty: If the queue is empty.
+        """
+        if not self._queue:
+            raise asyncio.QueueEmpty
+        message = self._queue.popleft()
+        if not self._queue:
+            self._event.clear()
+        return message
+
+    async def get(self) -> AgentMessage:
+        """Wait for and pop the oldest message."""
+        while not self._queue:
+            self._event.clear()
+            await self._event.wait()
+        return self.get_nowait()
+
+    def empty(self) -> bool:
+        """Whether the queue has no buffered messages."""
+        return not self._queue
+
+    def qsize(self) -> int:
+        """Number of buffered messages."""
+        return len(self._queue)
+
+
+def _drain_queue_fast(
+    queue: SingleConsumerQueue | asyncio.Queue[AgentMessage],
+    messages: list[AgentMessage],
+) -> None:
+    """Drain all buffered messages from `queue` into `messages`.
+
+    Fast path (`SingleConsumerQueue` only): swap the queue's internal
+    deque contents out in bulk, avoiding a Python-level `get_nowait()`
+    dispatch per message. The queue is unbounded and fully owned by this
+    module, so clearing the deque plus the wakeup event is equivalent to
+    N `get_nowait()` calls.
+
+    Other queue types (e.g. an asyncio.Queue from a custom bus) take the
+    per-message loop: bulk-clearing an asyncio.Queue's buffer would
+    bypass its join()/task_done() bookkeeping.
+    """
+    if isinstance(queue, SingleConsumerQueue):
+        internal = queue._queue
+        messages.extend(internal)
+        internal.clear()
+        queue._event.clear()
+        return
+
+    # Fallback: drain one message at a time
+    while not queue.empty():
+        try:
+            messages.append(queue.get_nowait())
+        except asyncio.QueueEmpty:  # pragma: no cover
+            break  # Race condition - queue was emptied between empty() check and get_nowait()
 
 
-@dataclass
+@dataclass(slots=True)
 class InMemoryMessageBus:
-    """In-memory message bus using asyncio queues.
+    """In-memory message bus with one single-consumer mailbox per agent.
 
     This is the default message bus implementation, suitable for
     single-process applications. For distributed systems, consider
@@ -47,9 +275,24 @@ class InMemoryMessageBus:
         ```
     """
 
-    _queues: dict[str, asyncio.Queue[AgentMessage]] = field(default_factory=dict)
-    _pending_questions: dict[str, asyncio.Future[AgentMessage]] = field(default_factory=dict)
-    _handlers: list[Callable[[AgentMessage], Awaitable[None]]] = field(default_factory=list)
+    _queues: dict[str, SingleConsumerQueue] = field(default_factory=dict)
+    _pending_questions: dict[int | str, asyncio.Future[AgentMessage]] = field(default_factory=dict)
+    _asks_by_receiver: dict[str, set[asyncio.Future[AgentMessage]]] = field(default_factory=dict)
+    """Receiver -> response futures of in-flight asks aimed at it, so
+    `unregister_agent` can fail those asks immediately instead of leaving
+    each caller to sit out its full timeout."""
+    _id_counter: Iterator[int] = field(default_factory=lambda: itertools.count(1))
+    """Correlation-ID source for `ask`. Monotonic integers are an order of
+    magnitude cheaper to generate and hash than UUID strings; a distributed
+    backend can swap in e.g. a Redis INCR-backed iterator."""
+    # Registry keyed by id(handler) for O(1) add/remove, plus an immutable
+    # snapshot re-bound on every mutation — the send hot path iterates the
+    # snapshot without worrying about concurrent mutation, and removal
+    # never does an equality scan over the handlers.
+    _handlers_by_id: dict[int, Callable[[AgentMessage], Awaitable[None]]] = field(
+        default_factory=dict
+    )
+    _handlers: tuple[Callable[[AgentMessage], Awaitable[None]], ...] = ()
 
     async def send(self, message: AgentMessage) -> None:
         """Send a message to a specific agent.
@@ -60,15 +303,66 @@ class InMemoryMessageBus:
         Raises:
             KeyError: If the receiver is not registered.
         """
-        if message.receiver not in self._queues:
+        queue = self._queues.get(message.receiver)
+        if queue is None:
             raise KeyError(f"Agent '{message.receiver}' is not registered")
 
-        await self._queues[message.receiver].put(message)
+        # Queues are unbounded, so put never blocks — skip the coroutine
+        # round-trip that `await queue.put(...)` would cost per message.
+        queue.put_nowait(message)
+
+        handlers = self._handlers
+        if not handlers:
+            return
+
+        if len(handlers) == 1:
+            # Common case: one debug/logging handler. Await it directly and
+            # skip gather's per-call Task wrapping.
+            with contextlib.suppress(Exception):
+                await handlers[0](message)
+            return
+
+        # Notify handlers concurrently; return_exceptions keeps handler
+        # errors from breaking message delivery without per-call try/except.
+        await asyncio.gather(*(h(message) for h in handlers), return_exceptions=True)
+
+    async def send_many(self, messages: list[AgentMessage]) -> None:
+        """Send a batch of messages, amortizing handler dispatch.
+
+        Equivalent to calling `send` for each message, but queues all
+        messages first and then notifies each handler once with the full
+        batch (when the handler opts in via a truthy ``__batch__``
+        attribute) instead of once per message. Use this for burst
+        traffic such as fan-out cancellations or broadcast updates.
+
+        Args:
+            messages: The messages to send.
 
-        # Notify handlers
+        Raises:
+            KeyError: If any receiver is not registered. No messages are
+                delivered in that case (receivers are validated up front).
+        """
+        # Validate all receivers before delivering anything (fail fast)
+        grouped: dict[str, list[AgentMessage]] = collections.defaultdict(list)
+        for message in messages:
+            if message.receiver not in self._queues:
+                raise KeyError(f"Agent '{message.receiver}' is not registered")
+            grouped[message.receiver].append(message)
+
+        # Queues are unbounded, so put_nowait never blocks
+        for receiver, group in grouped.items():
+            queue = self._queues[receiver]
+            for message in group:
+                queue.put_nowait(message)
+
+        # Notify handlers: once per batch if supported, else per message
         for handler in self._handlers:
             try:
-                await handler(message)
+                if getattr(handler, "__batch__", False):
+                    await handler(messages)  # type: ignore[arg-type]
+                else:
+                    for message in messages:
+                        await handler(message)
             except Exception:  # pragma: no cover
                 pass  # Don't let handler errors break message delivery
 
@@ -94,21 +388,42 @@ class InMemoryMessageBus:
 
         Raises:
             asyncio.TimeoutError: If no response within timeout.
+            asyncio.CancelledError: If the receiver is unregistered while
+                the question is still outstanding.
             KeyError: If the receiver is not registered.
         """
         if receiver not in self._queues:
             raise KeyError(f"Agent '{receiver}' is not registered")
 
-        correlation_id = str(uuid.uuid4())
+        correlation_id = next(self._id_counter)
 
         # Create future for the response
-        loop = asyncio.get_event_loop()
+        loop = asyncio.get_running_loop()
         response_future: asyncio.Future[AgentMessage] = loop.create_future()
         self._pending_questions[correlation_id] = response_future
+        self._asks_by_receiver.setdefault(receiver, set()).add(response_future)
+
+        # Arm a bare timer instead of wait_for (which wraps the future in
+        # an extra Task) or asyncio.timeout (which allocates and reschedules
+        # a Timeout context per call): one TimerHandle, nothing else. The
+        # flag records whether the timer fired, so a timeout cancellation
+        # can be told apart from a real one (outer task cancelled, or the
+        # receiver unregistered) — only the former becomes TimeoutError.
+        timed_out = False
+
+        def _on_timeout() -> None:
+            nonlocal timed_out
+            # Done-future race: the answer can land on the same tick the
+            # timer fires, before `finally` cancels the handle.
+            if not response_future.done():  # pragma: no branch
+                timed_out = True
+                response_future.cancel()
+
+        timeout_handle = loop.call_later(timeout, _on_timeout)
 
         try:
             # Send the question
-            message = AgentMessage(
+            message = _acquire_message(
                 type=MessageType.QUESTION,
                 sender=sender,
                 receiver=receiver,
@@ -118,27 +433,52 @@ class InMemoryMessageBus:
             )
             await self.send(message)
 
-            # Wait for response
-            return await asyncio.wait_for(response_future, timeout=timeout)
+            try:
+                return await response_future
+            except asyncio.CancelledError:
+                if timed_out:
+                    raise asyncio.TimeoutError from None
+                raise
         finally:
             # Clean up
+            timeout_handle.cancel()
             self._pending_questions.pop(correlation_id, None)
+            bucket = self._asks_by_receiver.get(receiver)
+            if bucket is not None:
+                bucket.discard(response_future)
+                if not bucket:
+                    del self._asks_by_receiver[receiver]
 
     async def answer(self, original: AgentMessage, answer: Any) -> None:
         """Answer a previously received question.
 
+        When an `ask` is still waiting on the question's correlation ID,
+        the answer resolves its future synchronously — no queue round-trip
+        and no registration requirement on the asker. Only answers that
+        must be queued (no correlation, or the asker already gave up)
+        require the original sender to be registered.
+
         Args:
             original: The original question message.
             answer: The answer payload.
 
         Raises:
-            KeyError: If the original sender is not registered or
-                     if there's no pending question with the correlation_id.
+            KeyError: If the answer must be queued and the original
+                     sender is not registered.
         """
-        if original.sender not in self._queues:
+        # Correlated answers pop the pending future in one dict operation,
+        # so ask()'s finally-cleanup becomes an idempotent no-op and a late
+        # duplicate answer can never find a stale entry. Uncorrelated
+        # answers never touch the map at all.
+        future = (
+            self._pending_questions.pop(original.correlation_id, None)
+            if original.correlation_id is not None
+            else None
+        )
+        if future is None and original.sender not in self._queues:
             raise KeyError(f"Agent '{original.sender}' is not registered")
 
-        response = AgentMessage(
+        response = _acquire_message(
             type=MessageType.ANSWER,
             sender=original.receiver,  # We are the original receiver
             receiver=original.sender,  # Send back to original sender
@@ -147,18 +487,22 @@ class InMemoryMessageBus:
             correlation_id=original.correlation_id,
         )
 
-        # If there's a pending future for this correlation_id, resolve it
-        if original.correlation_id and original.correlation_id in self._pending_questions:
-            future = self._pending_questions[original.correlation_id]
+        if future is not None:
+            # Fast path: hand the response straight to the waiting ask.
             if not future.done():
                 future.set_result(response)
-        else:
-            # Otherwise, put in queue
-            await self.send(response)
+            return
 
-    def register_agent(self, agent_id: str) -> asyncio.Queue[AgentMessage]:
+        # Otherwise, put in queue
+        await self.send(response)
+
+    def register_agent(self, agent_id: str) -> SingleConsumerQueue:
         """Register an agent to receive messages.
 
+        Each agent's mailbox has exactly one consumer (the agent itself),
+        so it gets a `SingleConsumerQueue` — a deque plus one wakeup
+        Event — instead of a full asyncio.Queue.
+
         Args:
             agent_id: Unique identifier for the agent.
 
@@ -171,18 +515,38 @@ class InMemoryMessageBus:
         if agent_id in self._queues:
             raise ValueError(f"Agent '{agent_id}' is already registered")
 
-        queue: asyncio.Queue[AgentMessage] = asyncio.Queue()
-        self._queues[agent_id] = queue
+        # Intern the stored key: runtime-built IDs (f-strings) become the
+        # canonical object, so later lookups with literal or interned IDs
+        # hit the dict's pointer-compare fast path.
+        queue = SingleConsumerQueue()
+        self._queues[sys.intern(agent_id)] = queue
         return queue
 
     def unregister_agent(self, agent_id: str) -> None:
         """Unregister an agent from the message bus.
 
+        Any asks still waiting on this agent are cancelled so their
+        callers fail fast instead of sitting out the full ask timeout.
+
         Args:
             agent_id: The agent to unregister.
         """
         self._queues.pop(agent_id, None)
 
+        dead = self._asks_by_receiver.pop(agent_id, None)
+        if not dead:
+            return
+        # Batch the cancellations into one loop callback — one scheduler
+        # hop for the whole fan-out instead of one per pending ask. When
+        # called outside a running loop, cancel inline.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            for future in dead:
+                future.cancel()
+            return
+        loop.call_soon(lambda: [future.cancel() for future in dead if not future.done()])
+
     def add_handler(self, handler: Callable[[AgentMessage], Awaitable[None]]) -> None:
         """Add a message handler for debugging/logging.
 
@@ -191,7 +555,8 @@ class InMemoryMessageBus:
         Args:
             handler: Async function that receives messages.
         """
-        self._handlers.append(handler)
+        self._handlers_by_id[id(handler)] = handler
+        self._handlers = tuple(self._handlers_by_id.values())
 
     def remove_handler(self, handler: Callable[[AgentMessage], Awaitable[None]]) -> None:
         """Remove a previously added handler.
@@ -199,8 +564,8 @@ class InMemoryMessageBus:
         Args:
             handler: The handler to remove.
         """
-        if handler in self._handlers:
-            self._handlers.remove(handler)
+        if self._handlers_by_id.pop(id(handler), None) is not None:
+            self._handlers = tuple(self._handlers_by_id.values())
 
     def is_registered(self, agent_id: str) -> bool:
         """Check if an agent is registered.
@@ -221,6 +586,51 @@ class InMemoryMessageBus:
         """
         return list(self._queues.keys())
 
+    def reset(self) -> None:
+        """Restore the bus to its freshly constructed state.
+
+        Drops all registrations, handlers, and pending questions, cancelling
+        any still-outstanding ask futures first so they don't log "exception
+        never retrieved" warnings. Lets a single bus instance be reused
+        (object-pool style) instead of reallocated — e.g. by test fixtures
+        or embedding applications that recycle buses between sessions.
+        """
+        for future in self._pending_questions.values():
+            if not future.done():
+                # The owning loop may already be closed (e.g. a previous
+                # test's loop); a reset must still leave clean state.
+                with contextlib.suppress(RuntimeError):
+                    future.cancel()
+        self._pending_questions.clear()
+        self._asks_by_receiver.clear()
+        self._queues.clear()
+        self._handlers_by_id.clear()
+        self._handlers = ()
+
+    @contextlib.asynccontextmanager
+    async def receive(self, agent_id: str) -> AsyncIterator[AgentMessage]:
+        """Wait for one message and recycle it when the block exits.
+
+        The pooled-message counterpart to `queue.get()`: the message is
+        handed back to the freelist on exit, so don't keep references to
+        it (or its payload) beyond the block. With pooling disabled this
+        is equivalent to a plain `get`.
+
+        Args:
+            agent_id: The agent to receive a message for.
+
+        Raises:
+            KeyError: If the agent is not registered.
+        """
+        queue = self._queues.get(agent_id)
+        if queue is None:
+            raise KeyError(f"Agent '{agent_id}' is not registered")
+        message = await queue.get()
+        try:
+            yield message
+        finally:
+            _release_message(message)
+
     async def get_messages(
         self,
         agent_id: str,
@@ -241,63 +651,298 @@ class InMemoryMessageBus:
         Raises:
             KeyError: If the agent is not registered.
         """
-        if agent_id not in self._queues:
+        queue = self._queues.get(agent_id)
+        if queue is None:
             raise KeyError(f"Agent '{agent_id}' is not registered")
 
-        queue = self._queues[agent_id]
         messages: list[AgentMessage] = []
 
-        # If timeout > 0 and queue is empty, wait for first message
-        if timeout > 0 and queue.empty():
+        # Non-blocking poll (the common tool-handler shape): drain whatever
+        # is buffered and return without touching the timeout machinery.
+        if timeout == 0.0:
+            _drain_queue_fast(queue, messages)
+            return messages
+
+        # If the queue is empty, wait for the first message. asyncio.timeout
+        # is one timer handle on the current task; wait_for (the 3.10
+        # fallback) would wrap the get in a whole extra Task per call.
+        if queue.empty():
             try:
-                msg = await asyncio.wait_for(queue.get(), timeout=timeout)
-                messages.append(msg)
+                if _asyncio_timeout is not None:
+                    async with _asyncio_timeout(timeout):
+                        messages.append(await queue.get())
+                else:  # pragma: no cover - Python 3.10 fallback
+                    messages.append(await asyncio.wait_for(queue.get(), timeout=timeout))
             except asyncio.TimeoutError:
                 return messages
 
-        # Drain all available messages
-        while not queue.empty():
-            try:
-                msg = queue.get_nowait()
-                messages.append(msg)
-            except asyncio.QueueEmpty:  # pragma: no cover
-                break  # Race condition - queue was emptied between empty() check and get_nowait()
+        # Drain all available messages in one bulk operation
+        _drain_queue_fast(queue, messages)
 
         return messages
 
 
-def create_message_bus(backend: str = "memory", **kwargs: Any) -> InMemoryMessageBus:
+def create_message_bus(
+    backend: str = "memory", **kwargs: Any
+) -> InMemoryMessageBus | RedisMessageBus:
     """Create a message bus instance.
 
     Factory function for creating message bus implementations.
-    Currently only supports in-memory backend.
 
     Args:
-        backend: The backend type ("memory" is currently supported).
-        **kwargs: Backend-specific configuration.
+        backend: The backend type ("memory" or "redis").
+        **kwargs: Backend-specific configuration. For "redis", see
+            `RedisMessageBus` (url, key_prefix, batch_size, batch_timeout).
 
     Returns:
         A message bus instance.
 
     Raises:
         ValueError: If the backend is not supported.
+        ImportError: If backend is "redis" and the optional `redis`
+            package is not installed.
 
     Example:
         ```python
         # Create in-memory bus (default)
         bus = create_message_bus()
 
-        # Future: Redis bus
-        # bus = create_message_bus("redis", url="redis://localhost")
+        # Redis bus (requires `pip install redis`)
+        bus = create_message_bus("redis", url="redis://localhost")
         ```
     """
     if backend == "memory":
         return InMemoryMessageBus()
 
+    if backend == "redis":
+        from subagents_pydantic_ai.redis_bus import RedisMessageBus
+
+        return RedisMessageBus(**kwargs)
+
     raise ValueError(f"Unknown message bus backend: {backend}")
 
 
-@dataclass
+class AskBatcher:
+    """Coalesces concurrent `ask` round-trips to one receiver.
+
+    When many subagents question the same parent at once, each `ask`
+    pays its own bus send, future, and wakeup. The batcher collects
+    questions submitted within `max_wait` seconds of each other (up to
+    `max_batch_size`) and sends them as ONE question message whose
+    payload is the list of questions; the receiver answers with a list
+    of answers in the same order, and each caller gets its own slice.
+    A batch of one falls back to a plain `ask` round-trip, so solitary
+    questions keep their original payload shape.
+
+    Example:
+        ```python
+        batcher = AskBatcher(bus, sender="parent", receiver="worker")
+        answers = await asyncio.gather(
+            batcher.ask("first?", "task-1"),
+            batcher.ask("second?", "task-2"),
+        )
+        ```
+    """
+
+    def __init__(
+        self,
+        bus: InMemoryMessageBus,
+        sender: str,
+        receiver: str,
+        *,
+        max_batch_size: int = 16,
+        max_wait: float = 0.05,
+        timeout: float = 30.0,
+    ) -> None:
+        self._bus = bus
+        self._sender = sender
+        self._receiver = receiver
+        self._max_batch_size = max_batch_size
+        self._max_wait = max_wait
+        self._timeout = timeout
+        self._pending: list[tuple[str, str, asyncio.Future[Any]]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+
+    async def ask(self, question: str, task_id: str) -> Any:
+        """Submit a question and wait for its answer.
+
+        Args:
+            question: The question payload.
+            task_id: Task ID for correlation.
+
+        Returns:
+            This caller's answer from the batched response.
+
+        Raises:
+            asyncio.TimeoutError: If the receiver does not answer in time.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[Any] = loop.create_future()
+        self._pending.append((question, task_id, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._cancel_timer()
+            loop.create_task(self._flush())
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(
+                self._max_wait,
+                lambda: asyncio.ensure_future(self._flush()),
+            )
+
+        return await future
+
+    def _cancel_timer(self) -> None:
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+    async def _flush(self) -> None:
+        """Send everything collected so far as one round-trip."""
+        self._cancel_timer()
+        batch = self._pending
+        if not batch:
+            return
+        self._pending = []
+
+        try:
+            if len(batch) == 1:
+                question, task_id, future = batch[0]
+                response = await self._bus.ask(
+                    self._sender, self._receiver, question, task_id, timeout=self._timeout
+                )
+                if not future.done():
+                    future.set_result(response.payload)
+                return
+
+            response = await self._bus.ask(
+                self._sender,
+                self._receiver,
+                [question for question, _, _ in batch],
+                batch[0][1],
+                timeout=self._timeout,
+            )
+            answers = response.payload
+            for index, (_, _, future) in enumerate(batch):
+                if not future.done():
+                    future.set_result(answers[index])
+        except Exception as exc:
+            for _, _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+
+
+class _CachedClock:
+    """Coarse wall-clock cache for task bookkeeping timestamps.
+
+    `datetime.now()` resolves a syscall plus object construction on every
+    call. Task handles only need millisecond-grade timestamps, so this
+    clock reuses the last datetime as long as less than 1ms of monotonic
+    time has elapsed — a burst of task creations (parent fanning out many
+    subtasks) pays for a single datetime instead of one per task.
+    """
+
+    _GRANULARITY_NS = 1_000_000  # 1 ms
+
+    __slots__ = ("_cached", "_stamp_ns")
+
+    def __init__(self) -> None:
+        self._cached: datetime | None = None
+        self._stamp_ns = 0
+
+    def now(self) -> datetime:
+        """Return the current wall-clock time, at most 1ms stale."""
+        # Imported lazily so parent-only agents that import the bus but never
+        # track tasks don't pay the datetime module's import cost.
+        from datetime import datetime
+
+        stamp = time.monotonic_ns()
+        if self._cached is None or stamp - self._stamp_ns >= self._GRANULARITY_NS:
+            self._cached = datetime.now()
+            self._stamp_ns = stamp
+        return self._cached
+
+
+_clock = _CachedClock()
+
+
+@dataclass(slots=True)
+class _TaskRecord:
+    """Per-task state kept in a single `TaskManager.records` entry.
+
+    Grouping task, handle, and cancel event into one record means task
+    creation does one dict insertion (instead of three) and lookups hash
+    the task_id once. Fields are optional because they have different
+    lifetimes: the handle outlives cleanup for status queries, and
+    handles can be registered without a live task.
+    """
+
+    task: asyncio.Task[Any] | None = None
+    handle: Any = None  # TaskHandle
+    cancel_event: asyncio.Event | None = None
+
+    def is_empty(self) -> bool:
+        """True when no field is populated and the record can be dropped."""
+        return self.task is None and self.handle is None and self.cancel_event is None
+
+
+class _RecordFieldView(MutableMapping[str, Any]):
+    """Dict-like projection of one `_TaskRecord` field.
+
+    Backs the legacy `TaskManager.tasks` / `handles` / `_cancel_events`
+    mappings on top of the consolidated `records` dict, so existing
+    callers that read or write those dicts keep working.
+    """
+
+    __slots__ = ("_records", "_field")
+
+    def __init__(self, records: dict[str, _TaskRecord], field_name: str) -> None:
+        self._records = records
+        self._field = field_name
+
+    def __getitem__(self, task_id: str) -> Any:
+        record = self._records.get(task_id)
+        if record is None:
+            raise KeyError(task_id)
+        value = getattr(record, self._field)
+        if value is None:
+            raise KeyError(task_id)
+        return value
+
+    def __setitem__(self, task_id: str, value: Any) -> None:
+        record = self._records.get(task_id)
+        if record is None:
+            record = self._records[task_id] = _TaskRecord()
+        setattr(record, self._field, value)
+
+    def __delitem__(self, task_id: str) -> None:
+        record = self._records.get(task_id)
+        if record is None or getattr(record, self._field) is None:
+            raise KeyError(task_id)
+        setattr(record, self._field, None)
+        if record.is_empty():
+            del self._records[task_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return (
+            task_id
+            for task_id, record in self._records.items()
+            if getattr(record, self._field) is not None
+        )
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+# Heap ordering for queued tasks: higher-priority entries pop first.
+_PRIORITY_RANK: dict[TaskPriority, int] = {
+    TaskPriority.CRITICAL: 3,
+    TaskPriority.HIGH: 2,
+    TaskPriority.NORMAL: 1,
+    TaskPriority.LOW: 0,
+}
+
+
+@dataclass(slots=True)
 class TaskManager:
     """Manages background tasks and their lifecycle.
 
@@ -305,44 +950,161 @@ class TaskManager:
     status querying capabilities.
 
     Attributes:
-        tasks: Dictionary of task_id -> asyncio.Task
-        handles: Dictionary of task_id -> TaskHandle
+        records: Dictionary of task_id -> _TaskRecord holding the task,
+            its handle, and its cancellation event in one entry.
         message_bus: Message bus for communication
     """
 
-    tasks: dict[str, asyncio.Task[Any]] = field(default_factory=dict)
-    handles: dict[str, Any] = field(default_factory=dict)  # TaskHandle
+    records: dict[str, _TaskRecord] = field(default_factory=dict)
     message_bus: InMemoryMessageBus = field(default_factory=InMemoryMessageBus)
-    _cancel_events: dict[str, asyncio.Event] = field(default_factory=dict)
     _answer_futures: dict[str, asyncio.Future[str]] = field(default_factory=dict)
+    _active: set[str] = field(default_factory=set)
+    """Task IDs with a live (not yet done) asyncio.Task. Maintained via
+    done-callbacks so `list_active_tasks` is O(active) instead of scanning
+    every record accumulated over the session."""
+    status_ttl_seconds: float | None = None
+    """When set, completed tasks are cleaned up automatically: the task and
+    cancel event are released as soon as the task finishes, and the handle
+    is evicted this many seconds later. Bounds memory for long-running
+    orchestrators where nobody calls `cleanup_task` explicitly. Defaults to
+    None (manual cleanup, handles kept indefinitely)."""
+    max_concurrency: int | None = None
+    """Bound on tasks running at once. When set, `create_task` starts at
+    most this many tasks immediately and parks the overflow on a priority
+    heap; each finished task pulls the highest-priority queued one next,
+    so CRITICAL work never waits behind a backlog of LOW tasks. Defaults
+    to None — every task starts immediately and priority is advisory."""
+    _pending: list[tuple[int, int, str, Any, Any]] = field(default_factory=list)
+    """Min-heap of (-priority_rank, seq, task_id, coro, handle) for tasks
+    waiting on a concurrency slot. The seq tiebreaker keeps FIFO order
+    within a priority level."""
+    _pending_seq: Iterator[int] = field(default_factory=itertools.count)
+    _running: int = 0
+    _generation: int = 0
+    """Bumped by `reset()`. Done-callbacks carry the generation they were
+    registered under and are ignored when it is stale, so tasks cancelled
+    by a reset can't decrement `_running` on a recycled manager and
+    silently loosen the `max_concurrency` bound."""
+    _event_pool: collections.deque[asyncio.Event] = field(
+        default_factory=lambda: collections.deque(maxlen=256)
+    )
+    """Free-list of cancel events. Bulk-task workloads allocate and drop
+    one Event per soft-cancellable task; recycling them through
+    `cleanup_task` turns that churn into reuse. Safe because cleanup only
+    runs after the task has finished, so no coroutine still awaits the
+    event when it is cleared and pooled."""
+
+    @property
+    def tasks(self) -> MutableMapping[str, asyncio.Task[Any]]:
+        """Live task_id -> asyncio.Task view over `records`."""
+        return _RecordFieldView(self.records, "task")
+
+    @property
+    def handles(self) -> MutableMapping[str, Any]:
+        """Live task_id -> TaskHandle view over `records`."""
+        return _RecordFieldView(self.records, "handle")
+
+    @property
+    def _cancel_events(self) -> MutableMapping[str, asyncio.Event]:
+        """Live task_id -> cancel event view over `records`."""
+        return _RecordFieldView(self.records, "cancel_event")
 
     def create_task(
         self,
         task_id: str,
         coro: Any,  # Coroutine
         handle: Any,  # TaskHandle
-    ) -> asyncio.Task[Any]:
+    ) -> asyncio.Task[Any] | None:
         """Create and track a new background task.
 
+        With `max_concurrency` unset (the default) the coroutine starts
+        immediately. When the bound is set and saturated, the task is
+        queued instead: its handle stays PENDING and it starts when a
+        running task finishes, highest `handle.priority` first.
+
         Args:
             task_id: Unique identifier for the task.
             coro: The coroutine to run.
             handle: TaskHandle for status tracking.
 
         Returns:
-            The created asyncio.Task.
+            The created asyncio.Task, or None if the task was queued
+            behind the concurrency bound.
         """
-        task = asyncio.create_task(coro)
-        self.tasks[task_id] = task
-        self.handles[task_id] = handle
-        self._cancel_events[task_id] = asyncio.Event()
-
-        # Update handle when task starts
-        handle.status = "running"
-        handle.started_at = datetime.now()
+        if self.max_concurrency is not None and self._running >= self.max_concurrency:
+            # Track the record now so get_handle/check_task see the
+            # pending task; the asyncio.Task slot fills on dispatch.
+            self.records[task_id] = _TaskRecord(task=None, handle=handle)
+            rank = _PRIORITY_RANK.get(handle.priority, 1)
+            heapq.heappush(self._pending, (-rank, next(self._pending_seq), task_id, coro, handle))
+            return None
+        return self._start_task(task_id, coro, handle)
+
+    def _start_task(self, task_id: str, coro: Any, handle: Any) -> asyncio.Task[Any]:
+        """Start a coroutine and wire up tracking (no concurrency check)."""
+        # All bookkeeping happens BEFORE the task object is built: with
+        # eager start the coroutine runs synchronously during construction
+        # and may look up its own record, or even finish and set a terminal
+        # handle status — which must not be clobbered afterwards.
+        # The cancel event is allocated lazily (see get_cancel_event) —
+        # most tasks are never soft-cancelled, and asyncio.Event carries a
+        # waiters list plus loop reference per instance.
+        record = self.records[task_id] = _TaskRecord(task=None, handle=handle)
+        self._active.add(task_id)
+        self._running += 1
+        handle.status = TaskStatus.RUNNING
+        handle.started_at = _clock.now()
+        handle.monotonic_started_at = time.monotonic()
+
+        # Bind the task ID in the context the task will run in: the Task
+        # snapshots the current context at construction, so the value is
+        # visible to build_message calls inside the coroutine without
+        # leaking into the caller's context.
+        token = _current_task_id.set(task_id)
+        try:
+            if not _EAGER_TASKS:
+                task = asyncio.create_task(coro)
+            else:  # pragma: no cover - requires Python 3.12+
+                # Skip the create_task scheduling hop: the coroutine runs
+                # now until its first await. Still a normal Task, so
+                # hard_cancel and done-callbacks behave identically.
+                task = asyncio.Task(coro, eager_start=True)  # type: ignore[call-arg]
+        finally:
+            _current_task_id.reset(token)
+        record.task = task
+        # Done-callbacks on an already-done (eagerly finished) task are
+        # scheduled via call_soon, so the slot accounting still runs.
+        task.add_done_callback(functools.partial(self._on_task_done, task_id, self._generation))
+        if self.status_ttl_seconds is not None:
+            task.add_done_callback(functools.partial(self._auto_cleanup, task_id))
 
         return task
 
+    def _on_task_done(self, task_id: str, generation: int, _task: asyncio.Task[Any]) -> None:
+        """Done-callback: free the concurrency slot and dispatch queued work.
+
+        Callbacks from tasks that predate a `reset()` are stale — their
+        slots were already zeroed — and must not touch the counters.
+        """
+        if generation != self._generation:
+            return
+        self._active.discard(task_id)
+        self._running -= 1
+        if self._pending:
+            self._dispatch_pending()
+
+    def _dispatch_pending(self) -> None:
+        """Start queued tasks while concurrency slots are available."""
+        while self._pending and (
+            self.max_concurrency is None or self._running < self.max_concurrency
+        ):
+            _, _, task_id, coro, handle = heapq.heappop(self._pending)
+            if task_id not in self.records or handle.status is not TaskStatus.PENDING:
+                # Cancelled or cleaned up while queued — drop it.
+                coro.close()
+                continue
+            self._start_task(task_id, coro, handle)
+
     def get_handle(self, task_id: str) -> Any | None:
         """Get the handle for a task.
 
@@ -352,18 +1114,28 @@ class TaskManager:
         Returns:
             The TaskHandle if found, None otherwise.
         """
-        return self.handles.get(task_id)
+        record = self.records.get(task_id)
+        return record.handle if record is not None else None
 
     def get_cancel_event(self, task_id: str) -> asyncio.Event | None:
         """Get the cancellation event for a task.
 
+        The event is created on first access for tasks that are still
+        tracked — `create_task` does not allocate one up front because
+        most tasks are never soft-cancelled.
+
         Args:
             task_id: The task ID.
 
         Returns:
-            The cancellation event if found, None otherwise.
+            The cancellation event if the task is tracked, None otherwise.
         """
-        return self._cancel_events.get(task_id)
+        record = self.records.get(task_id)
+        if record is None:
+            return None
+        if record.cancel_event is None and record.task is not None:
+            record.cancel_event = self._acquire_event()
+        return record.cancel_event
 
     def set_answer_future(self, task_id: str, future: asyncio.Future[str]) -> None:
         """Set an answer future for a task waiting for parent response.
@@ -393,11 +1165,29 @@ class TaskManager:
         """
         self._answer_futures.pop(task_id, None)
 
+    def _cancel_queued(self, record: _TaskRecord) -> bool:
+        """Cancel a task still queued behind the concurrency bound.
+
+        Queued records have no asyncio.Task and no cancel event; marking
+        the handle CANCELLED makes `_dispatch_pending` drop the entry
+        before it ever starts. Records in this shape whose handle is not
+        PENDING are finished tasks kept for status queries — those are
+        not cancellable and report False.
+        """
+        handle = record.handle
+        if handle is not None and handle.status is TaskStatus.PENDING:
+            handle.status = TaskStatus.CANCELLED
+            handle.completed_at = _clock.now()
+            return True
+        return False
+
     async def soft_cancel(self, task_id: str) -> bool:
         """Request cooperative cancellation of a task.
 
         Sets a cancellation event that the task can check periodically.
-        The task is expected to clean up and exit gracefully.
+        The task is expected to clean up and exit gracefully. A task
+        still queued behind `max_concurrency` has no coroutine to
+        cooperate yet, so it is cancelled outright and never starts.
 
         Args:
             task_id: The task to cancel.
@@ -405,17 +1195,70 @@ class TaskManager:
         Returns:
             True if cancellation was requested, False if task not found.
         """
-        if task_id not in self._cancel_events:
+        record = self.records.get(task_id)
+        if record is None:
             return False
+        if record.cancel_event is None and record.task is None:
+            return self._cancel_queued(record)
+
+        if record.cancel_event is None:
+            record.cancel_event = self._acquire_event()
+        record.cancel_event.set()
+
+        # Send cancel request message. Guard with is_registered (as
+        # soft_cancel_many does) instead of catching KeyError — no
+        # message or exception is built for unregistered receivers.
+        handle = record.handle
+        if handle is not None and self.message_bus.is_registered(handle.subagent_name):
+            await self.message_bus.send(
+                _acquire_message(
+                    type=MessageType.CANCEL_REQUEST,
+                    sender="task_manager",
+                    receiver=handle.subagent_name,
+                    payload={"reason": "soft_cancel"},
+                    task_id=task_id,
+                )
+            )
 
-        self._cancel_events[task_id].set()
+        return True
 
-        # Send cancel request message
-        if task_id in self.handles:
-            handle = self.handles[task_id]
-            try:
-                await self.message_bus.send(
-                    AgentMessage(
+    async def soft_cancel_many(self, task_ids: list[str]) -> dict[str, bool]:
+        """Request cooperative cancellation of several tasks at once.
+
+        Sets each task's cancellation event, then delivers all
+        CANCEL_REQUEST messages in one `send_many` batch so handler
+        dispatch is amortized across the whole fan-out. Tasks still
+        queued behind `max_concurrency` are cancelled outright, as in
+        `soft_cancel`.
+
+        Args:
+            task_ids: The tasks to cancel.
+
+        Returns:
+            Mapping of task_id -> True if cancellation was requested,
+            False if the task was not found.
+        """
+        results: dict[str, bool] = {}
+        messages: list[AgentMessage] = []
+
+        for task_id in task_ids:
+            record = self.records.get(task_id)
+            if record is None:
+                results[task_id] = False
+                continue
+            if record.cancel_event is None and record.task is None:
+                results[task_id] = self._cancel_queued(record)
+                continue
+
+            if record.cancel_event is None:
+                record.cancel_event = self._acquire_event()
+            record.cancel_event.set()
+            results[task_id] = True
+
+            handle = record.handle
+            if handle is not None and self.message_bus.is_registered(handle.subagent_name):
+                messages.append(
+                    _acquire_message(
                         type=MessageType.CANCEL_REQUEST,
                         sender="task_manager",
                         receiver=handle.subagent_name,
@@ -423,10 +1266,11 @@ class TaskManager:
                         task_id=task_id,
                     )
                 )
-            except KeyError:
-                pass  # Agent not registered, that's OK
 
-        return True
+        if messages:
+            await self.message_bus.send_many(messages)
+
+        return results
 
     async def hard_cancel(self, task_id: str) -> bool:
         """Immediately cancel a task.
@@ -440,38 +1284,143 @@ class TaskManager:
         Returns:
             True if task was cancelled, False if task not found.
         """
-        if task_id not in self.tasks:
+        record = self.records.get(task_id)
+        if record is None:
             return False
 
-        task = self.tasks[task_id]
-        if not task.done():
-            task.cancel()
+        if record.task is None:
+            # Still queued behind the concurrency bound.
+            return self._cancel_queued(record)
+
+        if not record.task.done():
+            # The message shows up in the CancelledError for debugging.
+            record.task.cancel("hard cancel requested")
+        self._active.discard(task_id)
 
         # Update handle
-        if task_id in self.handles:
-            handle = self.handles[task_id]
-            handle.status = "cancelled"
-            handle.completed_at = datetime.now()
+        if record.handle is not None:
+            record.handle.status = TaskStatus.CANCELLED
+            record.handle.completed_at = _clock.now()
 
         return True
 
+    async def shutdown(self) -> None:
+        """Cancel and await every live task (structured teardown).
+
+        Queued tasks are dropped without ever starting; running tasks are
+        cancelled and awaited, so their cleanup (finally blocks, bus
+        unregistration) finishes before this returns — the one TaskGroup
+        property worth having here. The manager stays usable afterwards.
+        """
+        while self._pending:
+            _, _, _task_id, coro, handle = heapq.heappop(self._pending)
+            coro.close()
+            if handle.status is TaskStatus.PENDING:
+                handle.status = TaskStatus.CANCELLED
+                handle.completed_at = _clock.now()
+
+        live = [
+            record.task
+            for record in self.records.values()
+            if record.task is not None and not record.task.done()
+        ]
+        for task in live:
+            task.cancel("task manager shutdown")
+        if live:
+            await asyncio.gather(*live, return_exceptions=True)
+
+    def reset(self) -> None:
+        """Restore the manager to its freshly constructed state.
+
+        Closes queued coroutines, cancels still-running tasks, and clears
+        all tracking state. Unlike `shutdown` this is synchronous and does
+        not await the cancelled tasks — it is for recycling a manager
+        instance (test fixtures, pooled infrastructure), possibly after
+        the event loop the tasks ran on is already gone.
+        """
+        while self._pending:
+            _, _, _task_id, coro, _handle = heapq.heappop(self._pending)
+            coro.close()
+        for record in self.records.values():
+            if record.task is not None and not record.task.done():
+                with contextlib.suppress(RuntimeError):
+                    record.task.cancel()
+        self.records.clear()
+        self._active.clear()
+        self._running = 0
+        # Invalidate done-callbacks of the tasks cancelled above: they
+        # fire on a later loop tick and would otherwise double-decrement
+        # the already-zeroed running count.
+        self._generation += 1
+        for future in self._answer_futures.values():
+            if not future.done():
+                with contextlib.suppress(RuntimeError):
+                    future.cancel()
+        self._answer_futures.clear()
+        self._event_pool.clear()
+
+    def _auto_cleanup(self, task_id: str, _task: asyncio.Task[Any]) -> None:
+        """Done-callback cleanup when `status_ttl_seconds` is enabled.
+
+        Releases the task and cancel event immediately (they are useless
+        once the task is done) and schedules handle eviction after the TTL
+        so status queries still work for a while.
+        """
+        self.cleanup_task(task_id)
+        if task_id in self.records:  # handle kept for status queries
+            loop = asyncio.get_running_loop()
+            loop.call_later(self.status_ttl_seconds or 0.0, self._evict_handle, task_id)
+
+    def _evict_handle(self, task_id: str) -> None:
+        """Drop a completed task's record once its status TTL has expired."""
+        record = self.records.get(task_id)
+        if record is not None and record.task is None:
+            del self.records[task_id]
+
+    def _acquire_event(self) -> asyncio.Event:
+        """Take a cancel event from the pool, or allocate a fresh one."""
+        return self._event_pool.pop() if self._event_pool else asyncio.Event()
+
     def cleanup_task(self, task_id: str) -> None:
         """Clean up resources for a completed task.
 
         Args:
             task_id: The task to clean up.
         """
-        self.tasks.pop(task_id, None)
-        self._cancel_events.pop(task_id, None)
-        # Keep handle for status queries
+        record = self.records.get(task_id)
+        if record is not None:
+            record.task = None
+            if record.cancel_event is not None:
+                record.cancel_event.clear()
+                self._event_pool.append(record.cancel_event)
+                record.cancel_event = None
+            # Keep handle for status queries
+            if record.is_empty():
+                del self.records[task_id]
+
+    def mark_inactive(self, task_id: str) -> None:
+        """Drop a task from the active set ahead of its done-callback.
+
+        The set is normally maintained automatically, but runners that
+        treat a task as finished before its asyncio.Task unwinds (e.g.
+        after handing off the result) can retire it explicitly.
+
+        Args:
+            task_id: The task to retire from active listings.
+        """
+        self._active.discard(task_id)
 
     def list_active_tasks(self) -> list[str]:
         """Get list of active (non-completed) task IDs.
 
+        The active set is maintained incrementally by create_task's
+        done-callbacks, so this is O(active) regardless of how much
+        completed-task history the manager has accumulated.
+
         Returns:
             List of task IDs for tasks that haven't completed.
         """
-        return [task_id for task_id, task in self.tasks.items() if not task.done()]
+        return list(self._active)
 
     def list_handles(self) -> list[Any]:
         """Get all task handles (completed and active).
@@ -479,4 +1428,4 @@ class TaskManager:
         Returns:
             List of TaskHandle objects.
         """
-        return list(self.handles.values())
+        return [record.handle for record in self.records.values() if record.handle is not None]
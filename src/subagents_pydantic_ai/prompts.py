@@ -6,12 +6,30 @@ and explain the task delegation system to the parent agent.
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import sys
+from functools import lru_cache
+from typing import TYPE_CHECKING, Final
 
 if TYPE_CHECKING:
     from subagents_pydantic_ai.types import SubAgentConfig
 
-SUBAGENT_SYSTEM_PROMPT = """You are a specialized subagent working on a delegated task.
+__all__ = [
+    "ANSWER_SUBAGENT_DESCRIPTION",
+    "CHECK_TASK_DESCRIPTION",
+    "DEFAULT_GENERAL_PURPOSE_DESCRIPTION",
+    "DUAL_MODE_SYSTEM_PROMPT",
+    "HARD_CANCEL_TASK_DESCRIPTION",
+    "LIST_ACTIVE_TASKS_DESCRIPTION",
+    "SOFT_CANCEL_TASK_DESCRIPTION",
+    "SUBAGENT_SYSTEM_PROMPT",
+    "TASK_TOOL_DESCRIPTION",
+    "WAIT_TASKS_DESCRIPTION",
+    "get_subagent_system_prompt",
+    "get_task_instructions_prompt",
+]
+
+SUBAGENT_SYSTEM_PROMPT: Final[str] = sys.intern(
+    """You are a specialized subagent working on a delegated task.
 
 ## Your Role
 You have been spawned by a parent agent to handle a specific task. Focus entirely
@@ -28,8 +46,9 @@ on completing the assigned task to the best of your ability.
 - Provide clear, structured results
 - If the task cannot be completed, explain what was attempted and why it failed
 """
+)
 
-DUAL_MODE_SYSTEM_PROMPT = """## Subagent Execution Modes
+DUAL_MODE_SYSTEM_PROMPT: Final[str] = sys.intern("""## Subagent Execution Modes
 
 You can delegate tasks to subagents in two modes:
 
@@ -44,13 +63,15 @@ You can delegate tasks to subagents in two modes:
 - Use when you can continue with other work while waiting
 - Use for tasks that can run independently
 - Returns a task handle immediately - check status later
-"""
+""")
 
-DEFAULT_GENERAL_PURPOSE_DESCRIPTION = """A general-purpose agent for a wide variety of tasks.
+DEFAULT_GENERAL_PURPOSE_DESCRIPTION: Final[str] = sys.intern(
+    """A general-purpose agent for a wide variety of tasks.
 Use this when no specialized subagent matches the task requirements.
 Capable of research, analysis, writing, and problem-solving."""
+)
 
-TASK_TOOL_DESCRIPTION = """\
+TASK_TOOL_DESCRIPTION: Final[str] = sys.intern("""\
 Delegate a task to a specialized subagent. The subagent runs independently \
 with its own context and tools, and returns a result when done.
 
@@ -90,54 +111,60 @@ wait with `wait_tasks()`.
 Returns:
 - In sync mode: The subagent's response as a string.
 - In async mode: A task handle with task_id for status checking.
-"""
+""")
 
-CHECK_TASK_DESCRIPTION = """\
+CHECK_TASK_DESCRIPTION: Final[str] = sys.intern("""\
 Check the status of a background (async) task and get its result if completed.
 
 Use this after launching async tasks to see if they're done. Returns the \
 task status (running, completed, failed, waiting_for_answer) and the result \
-if available."""
+if available.""")
 
-ANSWER_SUBAGENT_DESCRIPTION = """\
+ANSWER_SUBAGENT_DESCRIPTION: Final[str] = sys.intern("""\
 Answer a question from a background subagent that is waiting for clarification.
 
 When a task has status WAITING_FOR_ANSWER, the subagent needs information \
-from you before it can continue. Provide a clear, specific answer."""
+from you before it can continue. Provide a clear, specific answer.""")
 
-LIST_ACTIVE_TASKS_DESCRIPTION = """\
+LIST_ACTIVE_TASKS_DESCRIPTION: Final[str] = sys.intern("""\
 List all currently active background tasks with their status.
 
-Use this to see what async tasks are running and their current state."""
+Use this to see what async tasks are running and their current state.""")
 
-WAIT_TASKS_DESCRIPTION = """\
+WAIT_TASKS_DESCRIPTION: Final[str] = sys.intern("""\
 Wait for multiple background tasks to complete before continuing.
 
 Blocks until ALL specified tasks are done (completed, failed, or cancelled), \
 or until the timeout is reached. Use after dispatching multiple async tasks \
-when you need all results before proceeding."""
+when you need all results before proceeding.""")
 
-SOFT_CANCEL_TASK_DESCRIPTION = """\
+SOFT_CANCEL_TASK_DESCRIPTION: Final[str] = sys.intern("""\
 Request cooperative cancellation of a background task. The subagent will be \
-notified and can clean up before stopping. Use this for graceful cancellation."""
+notified and can clean up before stopping. Use this for graceful cancellation.""")
 
-HARD_CANCEL_TASK_DESCRIPTION = """\
+HARD_CANCEL_TASK_DESCRIPTION: Final[str] = sys.intern("""\
 Immediately cancel a background task. The task will be forcefully stopped. \
-Use only when soft cancellation doesn't work or immediate stopping is required."""
+Use only when soft cancellation doesn't work or immediate stopping is required.""")
 
 
 def get_subagent_system_prompt(
     configs: list[SubAgentConfig],
     include_dual_mode: bool = True,
+    rendered_sections: set[str] | None = None,
 ) -> str:
     """Generate system prompt section describing available subagents.
 
     Args:
         configs: List of subagent configurations.
         include_dual_mode: Whether to include dual-mode execution explanation.
+        rendered_sections: Optional section-name tracker for callers that
+            assemble multi-section prompts. When given, the section name is
+            recorded on first render and subsequent calls with the same set
+            return "" — each section is emitted (and billed) at most once
+            per assembled prompt.
 
     Returns:
-        Formatted system prompt section.
+        Formatted system prompt section, or "" if already rendered.
 
     Example:
         ```python
@@ -151,22 +178,87 @@ def get_subagent_system_prompt(
         prompt = get_subagent_system_prompt(configs)
         ```
     """
-    lines = ["## Available Subagents", ""]
-    lines.append("Use the `task` tool to delegate work to these subagents:")
-    lines.append("")
-
-    for config in configs:
-        name = config["name"]
-        description = config["description"]
-        lines.append(f"- **{name}**: {description}")
-
-        # Add hint if agent cannot ask questions
-        if config.get("can_ask_questions") is False:
-            lines[-1] += " *(cannot ask clarifying questions)*"
+    if rendered_sections is not None:
+        if "available_subagents" in rendered_sections:
+            return ""
+        rendered_sections.add("available_subagents")
+
+    # Key the cache by the fields the prompt actually depends on, so two
+    # distinct-but-equal config lists share one cached string. Keying by
+    # content (rather than invalidating on registry changes) keeps the
+    # cache correct even when configs are rebuilt between calls. Sorting
+    # by name makes the rendered prompt (and the cache key) stable across
+    # calls that pass the same agents in a different order, so LLM-side
+    # prompt/KV caches see identical prefixes.
+    key = tuple(
+        sorted(
+            (config["name"], config["description"], config.get("can_ask_questions", True))
+            for config in configs
+        )
+    )
+    return _build_subagent_system_prompt(key, include_dual_mode)
+
+
+@lru_cache(maxsize=128)
+def _build_subagent_system_prompt(
+    key: tuple[tuple[str, str, bool], ...],
+    include_dual_mode: bool,
+) -> str:
+    """Assemble the subagent listing prompt for a config key tuple."""
+    # A single literal + comprehension + one join instead of repeated
+    # list.append calls: each subagent becomes one f-string fragment with
+    # the cannot-ask hint folded in conditionally. The invariant header
+    # comes first, separated from the dynamic listing by a `---` rule, so
+    # LLM backends can KV-cache the shared prefix across launches and
+    # boundary-detect where the variable part starts.
+    return "\n".join(
+        [
+            "## Available Subagents",
+            "",
+            "Use the `task` tool to delegate work to these subagents:",
+            "",
+            "---",
+            "",
+            *(
+                f"- **{name}**: {description}"
+                f"{'' if can_ask_questions else ' *(cannot ask clarifying questions)*'}"
+                for name, description, can_ask_questions in key
+            ),
+        ]
+    )
 
-    return "\n".join(lines)
 
+@lru_cache(maxsize=64)
+def _task_instructions_suffix(
+    can_ask_questions: bool,
+    max_questions: int | None,
+) -> str:
+    """Build the static tail of the task instructions.
 
+    Only (can_ask_questions, max_questions) — constant per subagent
+    config — feed into this part, so it is cached independently of the
+    per-task description: every dispatch after the first for a given
+    config skips the template build entirely.
+    """
+    # Both branches collapse to a single f-string suffix, so a miss is
+    # one concatenation instead of a list build plus join.
+    if can_ask_questions:
+        limit = (
+            f"You may ask up to {max_questions} questions.\n" if max_questions is not None else ""
+        )
+        return (
+            "## Asking Questions\n"
+            "If you need clarification, use the `ask_parent` tool.\n"
+            f"{limit}Keep questions specific and essential."
+        )
+    return (
+        "## Note\n"
+        "Complete this task using your best judgment.\n"
+        "You cannot ask the parent for clarification."
+    )
+
+
+@lru_cache(maxsize=256)
 def get_task_instructions_prompt(
     task_description: str,
     can_ask_questions: bool = True,
@@ -174,6 +266,11 @@ def get_task_instructions_prompt(
 ) -> str:
     """Generate the task instructions for a subagent.
 
+    Results are memoized — retried or repeated tasks reuse the assembled
+    string, and even a fresh description costs only one concatenation
+    because the static tail is cached per config (see
+    `_task_instructions_suffix`).
+
     Args:
         task_description: The task to perform.
         can_ask_questions: Whether the subagent can ask the parent questions.
@@ -182,17 +279,5 @@ def get_task_instructions_prompt(
     Returns:
         Formatted task instructions.
     """
-    lines = ["## Your Task", "", task_description, ""]
-
-    if can_ask_questions:
-        lines.append("## Asking Questions")
-        lines.append("If you need clarification, use the `ask_parent` tool.")
-        if max_questions is not None:
-            lines.append(f"You may ask up to {max_questions} questions.")
-        lines.append("Keep questions specific and essential.")
-    else:
-        lines.append("## Note")
-        lines.append("Complete this task using your best judgment.")
-        lines.append("You cannot ask the parent for clarification.")
-
-    return "\n".join(lines)
+    suffix = _task_instructions_suffix(can_ask_questions, max_questions)
+    return f"## Your Task\n\n{task_description}\n\n{suffix}"
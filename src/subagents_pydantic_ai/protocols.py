@@ -6,13 +6,37 @@ pluggable implementations for dependencies and message passing.
 
 from __future__ import annotations
 
-import asyncio
 from typing import TYPE_CHECKING, Any, Protocol, runtime_checkable
 
 if TYPE_CHECKING:
     from subagents_pydantic_ai.types import AgentMessage
 
 
+class MessageQueueProtocol(Protocol):
+    """Structural type for per-agent message queues.
+
+    Matched by both `asyncio.Queue` and the lighter
+    `SingleConsumerQueue` in `message_bus`, so bus implementations can
+    pick whichever fits their delivery model.
+    """
+
+    def put_nowait(self, message: AgentMessage) -> None:
+        """Enqueue a message without blocking."""
+        ...
+
+    def get_nowait(self) -> AgentMessage:
+        """Dequeue the oldest message, raising if empty."""
+        ...
+
+    async def get(self) -> AgentMessage:
+        """Wait for and dequeue the oldest message."""
+        ...
+
+    def empty(self) -> bool:
+        """Whether the queue has no buffered messages."""
+        ...
+
+
 @runtime_checkable
 class SubAgentDepsProtocol(Protocol):
     """Protocol for dependencies that support subagent management.
@@ -22,6 +46,14 @@ class SubAgentDepsProtocol(Protocol):
     compiled agent instances and a `clone_for_subagent` method for creating
     isolated deps for nested subagents.
 
+    Deps may additionally define an optional `with_nesting_depth(depth)`
+    method; when present, the toolset prefers it over `clone_for_subagent`
+    when dispatching a task. This is the opt-in fast path for deps whose
+    fields are large but immutable: a dataclass can implement it as
+    `dataclasses.replace(self, ...)` so each dispatch shares the config
+    objects and only rebuilds what actually differs per subagent, instead
+    of paying for a full clone every call.
+
     Example:
         ```python
         @dataclass
@@ -32,6 +64,13 @@ class SubAgentDepsProtocol(Protocol):
                 return MyDeps(
                     subagents={} if max_depth <= 0 else self.subagents,
                 )
+
+            def with_nesting_depth(self, max_depth: int) -> "MyDeps":
+                # Optional: cheap shallow snapshot instead of a clone.
+                return replace(
+                    self,
+                    subagents={} if max_depth <= 0 else self.subagents,
+                )
         ```
     """
 
@@ -142,7 +181,7 @@ class MessageBusProtocol(Protocol):
         """
         ...
 
-    def register_agent(self, agent_id: str) -> asyncio.Queue[AgentMessage]:
+    def register_agent(self, agent_id: str) -> MessageQueueProtocol:
         """Register an agent to receive messages.
 
         Args:
@@ -187,3 +226,44 @@ class MessageBusProtocol(Protocol):
             KeyError: If the agent is not registered.
         """
         ...
+
+
+# `isinstance` against a @runtime_checkable Protocol walks every member
+# with hasattr on each call — a known profiler hot spot. The answer is
+# the same for every instance of a given class, so these helpers cache
+# the verdict per concrete type and make repeated validation (e.g. deps
+# checks on every tool call) a single dict hit.
+_deps_check_cache: dict[type, bool] = {}
+_bus_check_cache: dict[type, bool] = {}
+
+
+def is_subagent_deps(obj: Any) -> bool:
+    """Check whether `obj` satisfies SubAgentDepsProtocol, cached per type.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        True if obj structurally implements the protocol.
+    """
+    cls = type(obj)
+    cached = _deps_check_cache.get(cls)
+    if cached is None:
+        cached = _deps_check_cache[cls] = isinstance(obj, SubAgentDepsProtocol)
+    return cached
+
+
+def is_message_bus(obj: Any) -> bool:
+    """Check whether `obj` satisfies MessageBusProtocol, cached per type.
+
+    Args:
+        obj: The object to check.
+
+    Returns:
+        True if obj structurally implements the protocol.
+    """
+    cls = type(obj)
+    cached = _bus_check_cache.get(cls)
+    if cached is None:
+        cached = _bus_check_cache[cls] = isinstance(obj, MessageBusProtocol)
+    return cached
@@ -0,0 +1,316 @@
+"""Redis-backed message bus for multi-process deployments.
+
+This module provides a ``RedisMessageBus`` implementing the same protocol
+as ``InMemoryMessageBus``, backed by Redis lists. Messages are delivered
+with ``LPUSH`` and consumed with ``RPOP``/``BRPOP``, and outgoing traffic
+is batched through a pipeline so a burst of N messages costs one network
+round-trip instead of N.
+
+Requires the optional ``redis`` dependency:
+
+    pip install "subagents-pydantic-ai[redis]"
+
+Example:
+    ```python
+    from subagents_pydantic_ai.message_bus import create_message_bus
+
+    bus = create_message_bus("redis", url="redis://localhost:6379")
+    bus.register_agent("worker-1")
+    await bus.send(message)
+    ...
+    await bus.aclose()
+    ```
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import itertools
+import json
+from collections.abc import Iterator
+from datetime import datetime
+from typing import Any
+
+from subagents_pydantic_ai.types import AgentMessage, MessageType
+
+
+def _serialize_message(message: AgentMessage) -> str:
+    """Serialize an AgentMessage to a JSON string for Redis storage."""
+    data = dataclasses.asdict(message)
+    data["type"] = message.type.value
+    data["timestamp"] = message.timestamp.isoformat()
+    return json.dumps(data, default=str)
+
+
+def _deserialize_message(raw: str | bytes) -> AgentMessage:
+    """Reconstruct an AgentMessage from its JSON representation."""
+    data = json.loads(raw)
+    data["type"] = MessageType(data["type"])
+    data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+    return AgentMessage(**data)
+
+
+class RedisMessageBus:
+    """Message bus backed by Redis lists, for multi-process agent setups.
+
+    Implements the ``MessageBusProtocol`` surface used by the toolset.
+    Each agent's inbox is a Redis list keyed ``{prefix}:agent:{agent_id}``;
+    question responses go to per-correlation lists so ``ask`` can block on
+    ``BRPOP`` without scanning the inbox.
+
+    ``send`` buffers messages and flushes them through a non-transactional
+    pipeline — either when ``batch_size`` messages are buffered or after
+    ``batch_timeout`` seconds, whichever comes first — so fan-out bursts
+    pay one round-trip for the whole batch. ``send_many`` flushes its
+    batch immediately in a single pipeline.
+
+    Args:
+        url: Redis connection URL.
+        key_prefix: Prefix for all Redis keys created by this bus.
+        batch_size: Flush the send buffer once this many messages queue up.
+        batch_timeout: Maximum seconds a buffered message waits for a flush.
+        redis_client: Pre-built ``redis.asyncio`` client (overrides ``url``).
+            Mainly for tests and custom connection pooling.
+    """
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        *,
+        key_prefix: str = "subagents",
+        batch_size: int = 100,
+        batch_timeout: float = 0.005,
+        redis_client: Any | None = None,
+    ) -> None:
+        if redis_client is None:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError as e:  # pragma: no cover
+                raise ImportError(
+                    "RedisMessageBus requires the 'redis' package. "
+                    "Install it with: pip install redis"
+                ) from e
+
+            redis_client = aioredis.from_url(url)
+
+        self._redis = redis_client
+        self._prefix = key_prefix
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout
+        self._registered: set[str] = set()
+        self._pending: list[AgentMessage] = []
+        self._flush_task: asyncio.Task[None] | None = None
+        self._id_counter: Iterator[int] = itertools.count(1)
+
+    def _inbox_key(self, agent_id: str) -> str:
+        return f"{self._prefix}:agent:{agent_id}"
+
+    def _response_key(self, correlation_id: int | str) -> str:
+        return f"{self._prefix}:resp:{correlation_id}"
+
+    def register_agent(self, agent_id: str) -> None:
+        """Register an agent to receive messages.
+
+        Args:
+            agent_id: Unique identifier for the agent.
+
+        Raises:
+            ValueError: If agent_id is already registered on this bus.
+        """
+        if agent_id in self._registered:
+            raise ValueError(f"Agent '{agent_id}' is already registered")
+        self._registered.add(agent_id)
+
+    def unregister_agent(self, agent_id: str) -> None:
+        """Unregister an agent from the message bus.
+
+        Args:
+            agent_id: The agent to unregister.
+        """
+        self._registered.discard(agent_id)
+
+    def is_registered(self, agent_id: str) -> bool:
+        """Check if an agent is registered on this bus instance."""
+        return agent_id in self._registered
+
+    def registered_agents(self) -> list[str]:
+        """Get list of agent IDs registered on this bus instance."""
+        return list(self._registered)
+
+    async def send(self, message: AgentMessage) -> None:
+        """Send a message, batching it into the next pipeline flush.
+
+        Args:
+            message: The message to send.
+
+        Raises:
+            KeyError: If the receiver is not registered.
+        """
+        if message.receiver not in self._registered:
+            raise KeyError(f"Agent '{message.receiver}' is not registered")
+
+        self._pending.append(message)
+        if len(self._pending) >= self._batch_size:
+            await self._flush()
+        elif self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._delayed_flush())
+
+    async def send_many(self, messages: list[AgentMessage]) -> None:
+        """Send a batch of messages in a single pipeline round-trip.
+
+        Args:
+            messages: The messages to send.
+
+        Raises:
+            KeyError: If any receiver is not registered. No messages are
+                delivered in that case (receivers are validated up front).
+        """
+        for message in messages:
+            if message.receiver not in self._registered:
+                raise KeyError(f"Agent '{message.receiver}' is not registered")
+
+        self._pending.extend(messages)
+        await self._flush()
+
+    async def _delayed_flush(self) -> None:
+        """Flush the send buffer after the batch timeout elapses."""
+        await asyncio.sleep(self._batch_timeout)
+        await self._flush()
+
+    async def _flush(self) -> None:
+        """Push all buffered messages through one non-transactional pipeline."""
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for message in batch:
+                pipe.lpush(self._inbox_key(message.receiver), _serialize_message(message))
+            await pipe.execute()
+
+    async def ask(
+        self,
+        sender: str,
+        receiver: str,
+        question: Any,
+        task_id: str,
+        timeout: float = 30.0,
+    ) -> AgentMessage:
+        """Send a question and block until the response arrives.
+
+        The response is delivered to a dedicated per-correlation list so
+        the ``BRPOP`` wait doesn't interfere with normal inbox traffic.
+
+        Args:
+            sender: ID of the asking agent.
+            receiver: ID of the agent to ask.
+            question: The question payload.
+            task_id: Task ID for correlation.
+            timeout: Maximum time to wait in seconds.
+
+        Returns:
+            The response message.
+
+        Raises:
+            asyncio.TimeoutError: If no response within timeout.
+            KeyError: If the receiver is not registered.
+        """
+        if receiver not in self._registered:
+            raise KeyError(f"Agent '{receiver}' is not registered")
+
+        correlation_id = next(self._id_counter)
+        message = AgentMessage(
+            type=MessageType.QUESTION,
+            sender=sender,
+            receiver=receiver,
+            payload=question,
+            task_id=task_id,
+            correlation_id=correlation_id,
+        )
+        self._pending.append(message)
+        await self._flush()
+
+        response_key = self._response_key(correlation_id)
+        try:
+            result = await self._redis.brpop([response_key], timeout=timeout)
+        finally:
+            await self._redis.delete(response_key)
+
+        if result is None:
+            raise asyncio.TimeoutError(
+                f"No response to question {correlation_id} from '{receiver}'"
+            )
+
+        _key, raw = result
+        return _deserialize_message(raw)
+
+    async def answer(self, original: AgentMessage, answer: Any) -> None:
+        """Answer a previously received question.
+
+        Args:
+            original: The original question message.
+            answer: The answer payload.
+
+        Raises:
+            KeyError: If the original sender is not registered and the
+                response must fall back to normal inbox delivery.
+        """
+        response = AgentMessage(
+            type=MessageType.ANSWER,
+            sender=original.receiver,
+            receiver=original.sender,
+            payload=answer,
+            task_id=original.task_id,
+            correlation_id=original.correlation_id,
+        )
+
+        if original.correlation_id is not None:
+            await self._redis.lpush(
+                self._response_key(original.correlation_id),
+                _serialize_message(response),
+            )
+        else:
+            await self.send(response)
+
+    async def get_messages(
+        self,
+        agent_id: str,
+        timeout: float = 0.0,
+    ) -> list[AgentMessage]:
+        """Get pending messages for an agent.
+
+        Args:
+            agent_id: The agent to get messages for.
+            timeout: Maximum time to wait for a message (0 = no wait).
+
+        Returns:
+            List of pending messages (may be empty).
+
+        Raises:
+            KeyError: If the agent is not registered.
+        """
+        if agent_id not in self._registered:
+            raise KeyError(f"Agent '{agent_id}' is not registered")
+
+        inbox = self._inbox_key(agent_id)
+        messages: list[AgentMessage] = []
+
+        if timeout > 0:
+            result = await self._redis.brpop([inbox], timeout=timeout)
+            if result is None:
+                return messages
+            messages.append(_deserialize_message(result[1]))
+
+        while True:
+            raw = await self._redis.rpop(inbox)
+            if raw is None:
+                return messages
+            messages.append(_deserialize_message(raw))
+
+    async def aclose(self) -> None:
+        """Flush pending messages and close the Redis connection."""
+        if self._flush_task is not None and not self._flush_task.done():
+            self._flush_task.cancel()
+        await self._flush()
+        await self._redis.aclose()
@@ -12,16 +12,19 @@ from typing import Any
 from subagents_pydantic_ai.types import CompiledSubAgent, SubAgentConfig
 
 
-@dataclass
+@dataclass(slots=True)
 class DynamicAgentRegistry:
     """Registry for dynamically created agents.
 
     Provides storage and management for agents created at runtime.
     Used by the agent factory toolset to track created agents.
 
+    All state lives in a single name -> CompiledSubAgent dict: the
+    compiled record already carries the agent, its config, and the
+    descriptive fields, so separate agent/config dicts would just
+    triple every mutation and the per-agent memory cost.
+
     Attributes:
-        agents: Dictionary mapping agent names to Agent instances.
-        configs: Dictionary mapping agent names to their configurations.
         max_agents: Maximum number of agents allowed (optional limit).
 
     Example:
@@ -42,10 +45,21 @@ class DynamicAgentRegistry:
         ```
     """
 
-    agents: dict[str, Any] = field(default_factory=dict)
-    configs: dict[str, SubAgentConfig] = field(default_factory=dict)
     _compiled: dict[str, CompiledSubAgent] = field(default_factory=dict)
     max_agents: int | None = None
+    _summary_cache: str | None = field(default=None, init=False, repr=False)
+    _names_cache: tuple[str, ...] | None = field(default=None, init=False, repr=False)
+    _configs_cache: tuple[SubAgentConfig, ...] | None = field(default=None, init=False, repr=False)
+    _compiled_cache: tuple[CompiledSubAgent, ...] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    def _invalidate_caches(self) -> None:
+        """Drop all derived snapshots after a mutation."""
+        self._summary_cache = None
+        self._names_cache = None
+        self._configs_cache = None
+        self._compiled_cache = None
 
     def register(
         self,
@@ -63,23 +77,73 @@ class DynamicAgentRegistry:
         """
         name = config["name"]
 
-        if name in self.agents:
+        if name in self._compiled:
             raise ValueError(f"Agent '{name}' already exists")
 
-        if self.max_agents and len(self.agents) >= self.max_agents:
+        # `is not None` rather than truthiness: max_agents=0 is a valid
+        # limit meaning "no agents allowed", not "unlimited".
+        limit = self.max_agents
+        if limit is not None and len(self._compiled) >= limit:
             raise ValueError(
-                f"Maximum number of agents ({self.max_agents}) reached. "
+                f"Maximum number of agents ({limit}) reached. "
                 f"Remove an agent before creating a new one."
             )
 
-        self.agents[name] = agent
-        self.configs[name] = config
         self._compiled[name] = CompiledSubAgent(
             name=name,
             description=config["description"],
             agent=agent,
             config=config,
         )
+        self._invalidate_caches()
+
+    def bulk_register(
+        self,
+        entries: list[tuple[SubAgentConfig, Any]],
+    ) -> None:
+        """Register several agents in one pass.
+
+        Validates the whole batch up front (duplicates and the
+        max_agents limit are checked once, not per agent), then builds
+        the compiled records in a single dict update. Populating a
+        registry from config this way avoids the per-item limit checks
+        and incremental dict growth of repeated `register` calls.
+
+        Args:
+            entries: (config, agent) pairs to register.
+
+        Raises:
+            ValueError: If any name already exists, names repeat within
+                the batch, or the batch would exceed max_agents. No
+                agents are registered on failure.
+        """
+        names = [config["name"] for config, _ in entries]
+
+        seen: set[str] = set()
+        for name in names:
+            if name in self._compiled or name in seen:
+                raise ValueError(f"Agent '{name}' already exists")
+            seen.add(name)
+
+        limit = self.max_agents
+        if limit is not None and len(self._compiled) + len(entries) > limit:
+            raise ValueError(
+                f"Maximum number of agents ({limit}) reached. "
+                f"Remove an agent before creating a new one."
+            )
+
+        self._compiled.update(
+            {
+                config["name"]: CompiledSubAgent(
+                    name=config["name"],
+                    description=config["description"],
+                    agent=agent,
+                    config=config,
+                )
+                for config, agent in entries
+            }
+        )
+        self._invalidate_caches()
 
     def get(self, name: str) -> Any | None:
         """Get an agent by name.
@@ -90,7 +154,8 @@ class DynamicAgentRegistry:
         Returns:
             The Agent instance, or None if not found.
         """
-        return self.agents.get(name)
+        compiled = self._compiled.get(name)
+        return compiled.agent if compiled is not None else None
 
     def get_config(self, name: str) -> SubAgentConfig | None:
         """Get an agent's configuration by name.
@@ -101,7 +166,8 @@ class DynamicAgentRegistry:
         Returns:
             The SubAgentConfig, or None if not found.
         """
-        return self.configs.get(name)
+        compiled = self._compiled.get(name)
+        return compiled.config if compiled is not None else None
 
     def get_compiled(self, name: str) -> CompiledSubAgent | None:
         """Get a compiled agent by name.
@@ -123,21 +189,26 @@ class DynamicAgentRegistry:
         Returns:
             True if agent was removed, False if not found.
         """
-        if name not in self.agents:
+        # Single hash lookup: pop both tests membership and deletes
+        if self._compiled.pop(name, None) is None:
             return False
 
-        del self.agents[name]
-        del self.configs[name]
-        del self._compiled[name]
+        self._invalidate_caches()
         return True
 
     def list_agents(self) -> list[str]:
         """Get list of all registered agent names.
 
+        The names are snapshotted into a shared tuple on first call
+        after a mutation, so repeated listing costs one copy of the
+        cached tuple rather than a dict iteration.
+
         Returns:
             List of agent names.
         """
-        return list(self.agents.keys())
+        if self._names_cache is None:
+            self._names_cache = tuple(self._compiled)
+        return list(self._names_cache)
 
     def list_configs(self) -> list[SubAgentConfig]:
         """Get list of all agent configurations.
@@ -145,7 +216,9 @@ class DynamicAgentRegistry:
         Returns:
             List of SubAgentConfig for all registered agents.
         """
-        return list(self.configs.values())
+        if self._configs_cache is None:
+            self._configs_cache = tuple(compiled.config for compiled in self._compiled.values())
+        return list(self._configs_cache)
 
     def list_compiled(self) -> list[CompiledSubAgent]:
         """Get list of all compiled agents.
@@ -153,7 +226,17 @@ class DynamicAgentRegistry:
         Returns:
             List of CompiledSubAgent for all registered agents.
         """
-        return list(self._compiled.values())
+        if self._compiled_cache is None:
+            self._compiled_cache = tuple(self._compiled.values())
+        return list(self._compiled_cache)
+
+    def __contains__(self, name: str) -> bool:
+        """Support `name in registry` with a single CONTAINS_OP."""
+        return name in self._compiled
+
+    def __len__(self) -> int:
+        """Support `len(registry)` without a method call."""
+        return len(self._compiled)
 
     def exists(self, name: str) -> bool:
         """Check if an agent exists.
@@ -164,7 +247,7 @@ class DynamicAgentRegistry:
         Returns:
             True if agent exists, False otherwise.
         """
-        return name in self.agents
+        return name in self._compiled
 
     def count(self) -> int:
         """Get the number of registered agents.
@@ -172,26 +255,37 @@ class DynamicAgentRegistry:
         Returns:
             Number of agents in the registry.
         """
-        return len(self.agents)
+        return len(self._compiled)
 
     def clear(self) -> None:
         """Remove all agents from the registry."""
-        self.agents.clear()
-        self.configs.clear()
         self._compiled.clear()
+        self._invalidate_caches()
 
     def get_summary(self) -> str:
         """Get a formatted summary of all registered agents.
 
+        The rendered string is cached until the registry next mutates —
+        a stable registry embedded into every system prompt costs one
+        attribute read per call instead of a rebuild.
+
         Returns:
             Multi-line string describing all agents.
         """
-        if not self.agents:
-            return "No dynamically created agents."
-
-        lines = [f"Dynamic Agents ({len(self.agents)}):"]
-        for name, config in self.configs.items():
-            model = config.get("model", "default")
-            lines.append(f"- {name} [{model}]: {config['description']}")
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        if not self._compiled:
+            summary = "No dynamically created agents."
+        else:
+            listing = "\n".join(
+                [
+                    f"- {name} [{compiled.config.get('model', 'default')}]: "
+                    f"{compiled.config['description']}"
+                    for name, compiled in self._compiled.items()
+                ]
+            )
+            summary = f"Dynamic Agents ({len(self._compiled)}):\n{listing}"
 
-        return "\n".join(lines)
+        self._summary_cache = summary
+        return summary
@@ -8,8 +8,12 @@ execution modes, with automatic mode selection based on task characteristics.
 from __future__ import annotations
 
 import asyncio
-import uuid
+import contextvars
+import os
+import time
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Literal
 
 from pydantic_ai import Agent, RunContext
@@ -112,9 +116,7 @@ def _compile_subagent(
     # 3. Default: create plain pydantic-ai Agent
     model = config.get("model", default_model)
 
-    toolsets: list[Any] = []
-    ask_parent_toolset = _create_ask_parent_toolset()
-    toolsets.append(ask_parent_toolset)
+    toolsets: list[Any] = [_ASK_PARENT_TOOLSET]
 
     if config.get("toolsets"):
         toolsets.extend(config["toolsets"])
@@ -136,6 +138,36 @@ def _compile_subagent(
     )
 
 
+@dataclass(slots=True)
+class _SubagentState:
+    """Per-run wiring that lets `ask_parent` reach back to the parent side.
+
+    Attached to the subagent's deps as ``_subagent_state``. Slotted
+    attribute access replaces the previous ``dict.get`` chain, which
+    `ask_parent` walked on every question.
+
+    Attributes:
+        ask_callback: Sync-mode answerer (the ``ask_user`` callback).
+        task_manager: Async-mode task manager holding the answer future.
+        task_id: ID of the task this subagent is running.
+    """
+
+    ask_callback: AskUserCallback | None = None
+    task_manager: TaskManager | None = None
+    task_id: str | None = None
+
+
+_subagent_state_var: contextvars.ContextVar[_SubagentState | None] = contextvars.ContextVar(
+    "_subagent_state", default=None
+)
+"""Ambient per-run wiring for `ask_parent`.
+
+Bound around each subagent run so `ask_parent` reads its state with one
+O(1) ContextVar lookup instead of a getattr probe on deps. The deps
+attribute is kept as a fallback for callers that attach state directly
+(custom agents, tests)."""
+
+
 def _create_ask_parent_toolset() -> FunctionToolset[Any]:
     """Create toolset with ask_parent tool for subagent communication."""
     toolset: FunctionToolset[Any] = FunctionToolset(id="ask_parent")
@@ -154,16 +186,18 @@ def _create_ask_parent_toolset() -> FunctionToolset[Any]:
         Returns:
             The parent's answer.
         """
-        # Try _subagent_state on deps (async mode)
-        state = getattr(ctx.deps, "_subagent_state", None)
+        # Ambient state first, then _subagent_state on deps (direct callers)
+        state = _subagent_state_var.get()
+        if state is None:
+            state = getattr(ctx.deps, "_subagent_state", None)
         if state is not None:
-            ask_callback = state.get("ask_callback")
+            ask_callback = state.ask_callback
             if ask_callback:
                 result: str = await ask_callback(question)
                 return result
 
-            _task_manager = state.get("task_manager")
-            _task_id = state.get("task_id")
+            _task_manager = state.task_manager
+            _task_id = state.task_id
 
             if _task_manager and _task_id:
                 handle = _task_manager.get_handle(_task_id)
@@ -202,6 +236,56 @@ def _create_ask_parent_toolset() -> FunctionToolset[Any]:
     return toolset
 
 
+# The ask_parent tool is stateless — everything per-run lives on
+# ctx.deps._subagent_state — so one toolset instance is shared by every
+# compiled subagent instead of rebuilding it per compile.
+_ASK_PARENT_TOOLSET: FunctionToolset[Any] = _create_ask_parent_toolset()
+
+
+# Pre-fetched status members for hot-path checks. Enum members are
+# singletons, so identity comparison is safe and skips the attribute
+# walk plus __eq__ dispatch that `handle.status == TaskStatus.X` pays
+# in polling loops. TaskHandle normalizes string statuses to members
+# at construction, so identity holds for every tracked handle.
+_STATUS_COMPLETED = TaskStatus.COMPLETED
+_STATUS_FAILED = TaskStatus.FAILED
+_STATUS_WAITING_FOR_ANSWER = TaskStatus.WAITING_FOR_ANSWER
+
+
+# Auto-mode decisions for the characteristics task() can actually vary:
+# complexity x requires_user_context x may_need_clarification (the other
+# TaskCharacteristics fields keep their defaults there). Derived from
+# decide_execution_mode itself at import, so the table cannot diverge
+# from the documented logic; dispatch replaces the dataclass build and
+# branch walk with one dict lookup. Config preference is short-circuited
+# before the lookup, so the empty config here is never consulted.
+_AUTO_MODE_TABLE: dict[tuple[str, bool, bool], Literal["sync", "async"]] = {
+    (estimated_complexity, requires_user_context, may_need_clarification): decide_execution_mode(
+        TaskCharacteristics(
+            estimated_complexity=estimated_complexity,
+            requires_user_context=requires_user_context,
+            may_need_clarification=may_need_clarification,
+        ),
+        SubAgentConfig(),
+    )
+    for estimated_complexity in ("simple", "moderate", "complex")
+    for requires_user_context in (False, True)
+    for may_need_clarification in (False, True)
+}
+
+
+@lru_cache(maxsize=64)
+def _task_tool_description(subagent_key: tuple[tuple[str, str], ...]) -> str:
+    """Build the task tool description for a (name, description) key tuple.
+
+    Memoized on content so repeated `create_subagent_toolset` calls with
+    the same subagents (e.g. per-request toolset construction) reuse one
+    assembled string instead of re-joining the listing every time.
+    """
+    listing = "\n".join(f"- {name}: {description}" for name, description in subagent_key)
+    return TASK_TOOL_DESCRIPTION.rstrip() + f"\n\nAvailable subagent types:\n{listing}"
+
+
 def create_subagent_toolset(  # noqa: C901
     subagents: list[SubAgentConfig] | None = None,
     default_model: str | Model = "openai:gpt-4.1",
@@ -286,11 +370,11 @@ def create_subagent_toolset(  # noqa: C901
     task_manager = TaskManager(message_bus=message_bus)
 
     # Build dynamic task description with available subagents
-    subagent_list = "\n".join(f"- {name}: {c.description}" for name, c in compiled.items())
-    task_description = _descs.get(
-        "task",
-        TASK_TOOL_DESCRIPTION.rstrip() + f"\n\nAvailable subagent types:\n{subagent_list}",
-    )
+    task_description = _descs.get("task")
+    if task_description is None:
+        task_description = _task_tool_description(
+            tuple((name, c.description) for name, c in compiled.items())
+        )
 
     toolset: FunctionToolset[Any] = FunctionToolset(id=id or "subagents")
 
@@ -334,48 +418,67 @@ def create_subagent_toolset(  # noqa: C901
             available = ", ".join(available_names)
             return f"Error: Unknown subagent '{subagent_type}'. Available: {available}"
 
-        config = subagent.config
         agent = subagent.agent
 
         if agent is None:
             return f"Error: Subagent '{subagent_type}' is not properly initialized"
 
-        # Create deps for subagent
+        # Create deps for subagent. Deps that expose the optional
+        # `with_nesting_depth` get a cheap shallow snapshot per dispatch
+        # instead of a full clone.
         parent_deps = ctx.deps
-        subagent_deps = parent_deps.clone_for_subagent(max_nesting_depth - 1)
+        with_depth = getattr(parent_deps, "with_nesting_depth", None)
+        if with_depth is not None:
+            subagent_deps = with_depth(max_nesting_depth - 1)
+        else:
+            subagent_deps = parent_deps.clone_for_subagent(max_nesting_depth - 1)
 
         # Build runtime toolsets from factory if provided
         runtime_toolsets = toolsets_factory(subagent_deps) if toolsets_factory else None
 
-        # Generate task ID
-        task_id = str(uuid.uuid4())[:8]
-
         # Resolve mode if "auto"
         if mode == "auto":
-            characteristics = TaskCharacteristics(
-                estimated_complexity=complexity or config.get("typical_complexity", "moderate"),
-                requires_user_context=requires_user_context
-                or config.get("typically_needs_context", False),
-                may_need_clarification=may_need_clarification,
-            )
-            resolved_mode = decide_execution_mode(characteristics, config)
+            if subagent.preferred_mode != "auto":
+                # Config preference always wins in decide_execution_mode, so
+                # skip building TaskCharacteristics when one is pinned.
+                resolved_mode = subagent.preferred_mode
+            else:
+                resolved_mode = _AUTO_MODE_TABLE[
+                    (
+                        complexity or subagent.typical_complexity,
+                        requires_user_context or subagent.typically_needs_context,
+                        may_need_clarification,
+                    )
+                ]
         else:
             resolved_mode = mode
 
         if resolved_mode == "sync":
+            # Lightweight path: sync runs never touch the task manager or
+            # the bus (ask_parent resolves through the callback), so no
+            # task ID is generated and no bus wiring is set up.
             return await _run_sync(
                 agent=agent,
-                config=config,
+                subagent=subagent,
                 description=description,
                 deps=subagent_deps,
-                task_id=task_id,
+                task_id="",
                 extra_toolsets=runtime_toolsets,
                 ask_user=ask_user,
             )
         else:
+            # Generate task ID
+            # os.urandom(4).hex() gives the same 8 hex chars as the old
+            # str(uuid.uuid4())[:8] without building and formatting a full
+            # UUID per dispatch. 4 random bytes can collide across a long
+            # session, so regenerate while the id is still tracked.
+            task_id = os.urandom(4).hex()
+            while task_id in task_manager.records:
+                task_id = os.urandom(4).hex()
+
             return await _run_async(
                 agent=agent,
-                config=config,
+                subagent=subagent,
                 description=description,
                 deps=subagent_deps,
                 task_id=task_id,
@@ -400,29 +503,41 @@ def create_subagent_toolset(  # noqa: C901
         if handle is None:
             return f"Error: Task '{task_id}' not found"
 
-        status_info = [
-            f"Task: {task_id}",
-            f"Subagent: {handle.subagent_name}",
-            f"Status: {handle.status}",
-            f"Description: {handle.description}",
-        ]
+        # One f-string per terminal state instead of a list build + join:
+        # check_task is polled in tight loops while tasks run, so the
+        # per-call allocations add up.
+        status = handle.status
+        header = (
+            f"Task: {task_id}\n"
+            f"Subagent: {handle.subagent_name}\n"
+            f"Status: {status.value}\n"
+            f"Description: {handle.description}"
+        )
 
-        if handle.status == TaskStatus.COMPLETED:
-            status_info.append(f"Result: {handle.result}")
+        if status is _STATUS_COMPLETED:
             if handle.usage is not None:
                 u = handle.usage
                 inp = getattr(u, "input_tokens", 0)
                 out = getattr(u, "output_tokens", 0)
-                status_info.append(f"Usage: {inp + out} tokens ({inp} in / {out} out)")
-        elif handle.status == TaskStatus.FAILED:
-            status_info.append(f"Error: {handle.error}")
-        elif handle.status == TaskStatus.WAITING_FOR_ANSWER:
-            status_info.append(f"Question: {handle.pending_question}")
-        elif handle.started_at:
-            elapsed = (datetime.now() - handle.started_at).total_seconds()
-            status_info.append(f"Running for: {elapsed:.1f}s")
-
-        return "\n".join(status_info)
+                return (
+                    f"{header}\nResult: {handle.result}\n"
+                    f"Usage: {inp + out} tokens ({inp} in / {out} out)"
+                )
+            return f"{header}\nResult: {handle.result}"
+        if status is _STATUS_FAILED:
+            return f"{header}\nError: {handle.error}"
+        if status is _STATUS_WAITING_FOR_ANSWER:
+            return f"{header}\nQuestion: {handle.pending_question}"
+        if handle.started_at:
+            # Prefer the monotonic stamp: one float subtraction, no
+            # datetime allocation, robust against wall-clock changes.
+            started_mono = getattr(handle, "monotonic_started_at", None)
+            if started_mono is not None:
+                elapsed = time.monotonic() - started_mono
+            else:
+                elapsed = (datetime.now() - handle.started_at).total_seconds()
+            return f"{header}\nRunning for: {elapsed:.1f}s"
+        return header
 
     @toolset.tool(description=_descs.get("answer_subagent", ANSWER_SUBAGENT_DESCRIPTION))
     async def answer_subagent(
@@ -441,8 +556,11 @@ def create_subagent_toolset(  # noqa: C901
         if handle is None:
             return f"Error: Task '{task_id}' not found"
 
-        if handle.status != TaskStatus.WAITING_FOR_ANSWER:
-            return f"Error: Task '{task_id}' is not waiting for an answer (status: {handle.status})"
+        if handle.status is not _STATUS_WAITING_FOR_ANSWER:
+            return (
+                f"Error: Task '{task_id}' is not waiting for an answer "
+                f"(status: {handle.status.value})"
+            )
 
         # Resolve the answer future that ask_parent is waiting on
         future = task_manager.get_answer_future(task_id)
@@ -466,8 +584,8 @@ def create_subagent_toolset(  # noqa: C901
         for tid in active_ids:
             handle = task_manager.get_handle(tid)
             if handle:  # pragma: no branch
-                desc = handle.description[:50]
-                lines.append(f"- {tid}: {handle.subagent_name} ({handle.status}) - {desc}...")
+                desc = handle._desc_short
+                lines.append(f"- {tid}: {handle.subagent_name} ({handle.status.value}) - {desc}...")
 
         return "\n".join(lines)
 
@@ -510,13 +628,13 @@ def create_subagent_toolset(  # noqa: C901
                 lines.append(f"- {tid}: not found")
                 continue
             status = handle.status
-            if status == "completed":
+            if status is _STATUS_COMPLETED:
                 result_preview = (handle.result or "")[:2000]
                 lines.append(f"- {tid} ({handle.subagent_name}): COMPLETED\n{result_preview}")
-            elif status == "failed":
+            elif status is _STATUS_FAILED:
                 lines.append(f"- {tid} ({handle.subagent_name}): FAILED - {handle.error}")
             else:
-                lines.append(f"- {tid} ({handle.subagent_name}): {status}")
+                lines.append(f"- {tid} ({handle.subagent_name}): {status.value}")
 
         return "Task results:\n" + "\n\n".join(lines)
 
@@ -579,9 +697,46 @@ def create_subagent_toolset(  # noqa: C901
     return toolset
 
 
+async def _execute(
+    agent: Any,
+    subagent: CompiledSubAgent,
+    description: str,
+    deps: Any,
+    extra_toolsets: list[Any] | None,
+) -> tuple[str | None, str | None, Any]:
+    """Build the task prompt and run the subagent.
+
+    Shared by `_run_sync` and `_run_async` so the prompt assembly and
+    error handling live in one place (and `run_task` closes over fewer
+    variables). Cancellation propagates — only regular exceptions are
+    converted to an error string.
+
+    Returns:
+        ``(output, error, usage)``: exactly one of output/error is set;
+        usage is the run's RunUsage when the result exposes one.
+    """
+    prompt = get_task_instructions_prompt(
+        description,
+        can_ask_questions=subagent.can_ask_questions,
+        max_questions=subagent.max_questions,
+    )
+
+    run_kwargs: dict[str, Any] = {"deps": deps}
+    if extra_toolsets:
+        run_kwargs["toolsets"] = extra_toolsets
+
+    try:
+        result = await agent.run(prompt, **run_kwargs)
+        output = _serialize_output(result.output)
+        usage = result.usage() if hasattr(result, "usage") else None
+    except Exception as e:
+        return None, str(e), None
+    return output, None, usage
+
+
 async def _run_sync(
     agent: Any,
-    config: SubAgentConfig,
+    subagent: CompiledSubAgent,
     description: str,
     deps: Any,
     task_id: str,
@@ -592,48 +747,46 @@ async def _run_sync(
 
     Args:
         agent: The pydantic-ai Agent instance.
-        config: Subagent configuration.
+        subagent: Compiled subagent with pre-resolved config options.
         description: Task description.
         deps: Dependencies for the subagent.
-        task_id: Unique task identifier.
+        task_id: Task identifier. Sync runs are not tracked, so the
+            dispatcher passes "" here; kept for signature symmetry.
         extra_toolsets: Additional toolsets to pass to agent.run().
         ask_user: Optional callback for `ask_parent` in sync mode. When
             provided, it is attached to the cloned subagent deps via
-            ``_subagent_state["ask_callback"]`` so `ask_parent` resolves to
+            ``_subagent_state.ask_callback`` so `ask_parent` resolves to
             it. The parent agent cannot answer directly in sync mode because
             its run loop is blocked here.
 
     Returns:
         The subagent's response.
     """
-    can_ask = config.get("can_ask_questions", True)
-    max_questions = config.get("max_questions")
-
     if ask_user is not None:
-        # Reuse the async-mode `_subagent_state["ask_callback"]` path so
+        # Reuse the async-mode `_subagent_state.ask_callback` path so
         # `ask_parent` has a single resolution order across both modes.
-        deps._subagent_state = {"ask_callback": ask_user}
-
-    prompt = get_task_instructions_prompt(
-        description,
-        can_ask_questions=can_ask,
-        max_questions=max_questions,
-    )
-
-    run_kwargs: dict[str, Any] = {"deps": deps}
-    if extra_toolsets:
-        run_kwargs["toolsets"] = extra_toolsets
-
+        state = _SubagentState(ask_callback=ask_user)
+        deps._subagent_state = state
+    else:
+        state = None
+
+    # Bind the ambient state only when there is state to bind — an unset
+    # var costs nothing and ask_parent falls through to the deps probe.
+    token = _subagent_state_var.set(state) if state is not None else None
     try:
-        result = await agent.run(prompt, **run_kwargs)
-        return _serialize_output(result.output)
-    except Exception as e:
-        return f"Error executing task: {e}"
+        output, error, _usage = await _execute(agent, subagent, description, deps, extra_toolsets)
+    finally:
+        if token is not None:
+            _subagent_state_var.reset(token)
+
+    if error is not None:
+        return f"Error executing task: {error}"
+    return output or ""
 
 
 async def _run_async(
     agent: Any,
-    config: SubAgentConfig,
+    subagent: CompiledSubAgent,
     description: str,
     deps: Any,
     task_id: str,
@@ -646,7 +799,7 @@ async def _run_async(
 
     Args:
         agent: The pydantic-ai Agent instance.
-        config: Subagent configuration.
+        subagent: Compiled subagent with pre-resolved config options.
         description: Task description.
         deps: Dependencies for the subagent.
         task_id: Unique task identifier.
@@ -661,52 +814,41 @@ async def _run_async(
     # Create task handle
     handle = TaskHandle(
         task_id=task_id,
-        subagent_name=config["name"],
+        subagent_name=subagent.name,
         description=description,
         status=TaskStatus.PENDING,
         priority=priority,
     )
 
-    # Register subagent for messaging
+    # Register subagent for messaging. Membership check instead of
+    # try/except ValueError — no exception construction on re-dispatch.
     agent_id = f"subagent-{task_id}"
-    try:
+    if not message_bus.is_registered(agent_id):
         message_bus.register_agent(agent_id)
-    except ValueError:
-        pass  # Already registered
 
     # Inject _subagent_state on deps so ask_parent can communicate with parent
-    deps._subagent_state = {
-        "task_manager": task_manager,
-        "task_id": task_id,
-    }
+    state = _SubagentState(task_manager=task_manager, task_id=task_id)
+    deps._subagent_state = state
 
     async def run_task() -> None:
         """Execute the task and update handle."""
-        can_ask = config.get("can_ask_questions", True)
-        max_questions = config.get("max_questions")
-
-        prompt = get_task_instructions_prompt(
-            description,
-            can_ask_questions=can_ask,
-            max_questions=max_questions,
-        )
-
-        run_kwargs: dict[str, Any] = {"deps": deps}
-        if extra_toolsets:
-            run_kwargs["toolsets"] = extra_toolsets
-
+        # The task runs in its own context copy, so the bind stays
+        # confined to this subagent's run.
+        _subagent_state_var.set(state)
         try:
-            result = await agent.run(prompt, **run_kwargs)
-            handle.result = _serialize_output(result.output)
-            if hasattr(result, "usage"):
-                handle.usage = result.usage()
-            handle.status = TaskStatus.COMPLETED
+            output, error, usage = await _execute(
+                agent, subagent, description, deps, extra_toolsets
+            )
+            if error is None:
+                handle.result = output
+                handle.usage = usage
+                handle.status = TaskStatus.COMPLETED
+            else:
+                handle.status = TaskStatus.FAILED
+                handle.error = error
         except asyncio.CancelledError:
             handle.status = TaskStatus.CANCELLED
             handle.error = "Task was cancelled"
-        except Exception as e:
-            handle.status = TaskStatus.FAILED
-            handle.error = str(e)
         finally:
             handle.completed_at = datetime.now()
             message_bus.unregister_agent(agent_id)
@@ -719,7 +861,7 @@ async def _run_async(
     return (
         f"Task started in background.\n"
         f"Task ID: {task_id}\n"
-        f"Subagent: {config['name']}\n"
+        f"Subagent: {subagent.name}\n"
         f"Use check_task('{task_id}') to check status."
     )
 
@@ -6,7 +6,7 @@ including configuration types, message types, and task management types.
 
 from __future__ import annotations
 
-import uuid
+import os
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
 from datetime import datetime
@@ -93,7 +93,7 @@ class TaskPriority(str, Enum):
     """Critical priority task, process immediately."""
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskCharacteristics:
     """Characteristics that help decide execution mode.
 
@@ -225,11 +225,16 @@ class SubAgentConfig(TypedDict, total=False):
 
 
 def _generate_message_id() -> str:
-    """Generate a unique message ID."""
-    return str(uuid.uuid4())
+    """Generate a unique message ID.
+
+    Message IDs only need uniqueness for tracing, not UUID semantics:
+    16 random bytes as hex skips UUID object construction and dash
+    formatting on a path hit for every bus message.
+    """
+    return os.urandom(16).hex()
 
 
-@dataclass
+@dataclass(slots=True)
 class AgentMessage:
     """Message passed between agents via the message bus.
 
@@ -241,7 +246,9 @@ class AgentMessage:
         task_id: Associated task ID for correlation
         id: Unique message identifier for tracing/debugging
         timestamp: When the message was created
-        correlation_id: ID for request-response correlation
+        correlation_id: ID for request-response correlation. The in-memory
+            bus uses cheap monotonic integers; string IDs remain supported
+            for custom/distributed implementations.
     """
 
     type: MessageType
@@ -251,10 +258,10 @@ class AgentMessage:
     task_id: str
     id: str = field(default_factory=_generate_message_id)
     timestamp: datetime = field(default_factory=datetime.now)
-    correlation_id: str | None = None
+    correlation_id: int | str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class TaskHandle:
     """Handle for managing a background task.
 
@@ -288,26 +295,67 @@ class TaskHandle:
     pending_question: str | None = None
     usage: Any = None
     """Token usage from the subagent run (``RunUsage`` from pydantic-ai)."""
-
-
-@dataclass
+    monotonic_started_at: float | None = None
+    """time.monotonic() captured when execution started. Elapsed-time math
+    uses this instead of datetime subtraction — cheaper and immune to wall
+    clock adjustments; `started_at` stays for display."""
+
+    _desc_short: str = field(init=False, repr=False)
+    """First 50 characters of `description`, precomputed so task listings
+    don't re-slice (and re-allocate) it on every poll."""
+
+    def __post_init__(self) -> None:
+        # Accept plain strings (the enums are str subclasses) but store
+        # the member itself, so status checks can rely on identity and
+        # rendering on `.value`.
+        if not isinstance(self.status, TaskStatus):
+            self.status = TaskStatus(self.status)
+        if not isinstance(self.priority, TaskPriority):
+            self.priority = TaskPriority(self.priority)
+        description = self.description
+        self._desc_short = description if len(description) <= 50 else description[:50]
+
+
+@dataclass(slots=True)
 class CompiledSubAgent:
     """A pre-compiled subagent ready for use.
 
     After processing SubAgentConfig, the toolset creates a CompiledSubAgent
     that includes the actual agent instance.
 
+    The dispatch-relevant config options are resolved once at construction
+    into plain attributes, so the per-task hot path reads them directly
+    instead of repeating ``config.get(..., default)`` on every dispatch.
+
     Attributes:
         name: Unique identifier for the subagent.
         description: Brief description of the subagent's purpose.
         agent: The actual agent instance.
         config: The original configuration used to create this agent.
+        can_ask_questions: Resolved ``config["can_ask_questions"]``.
+        max_questions: Resolved ``config["max_questions"]``.
+        preferred_mode: Resolved ``config["preferred_mode"]``.
+        typical_complexity: Resolved ``config["typical_complexity"]``.
+        typically_needs_context: Resolved ``config["typically_needs_context"]``.
     """
 
     name: str
     description: str
     config: SubAgentConfig
     agent: object | None = None  # Agent instance - typed as object to avoid circular imports
+    can_ask_questions: bool = field(init=False)
+    max_questions: int | None = field(init=False)
+    preferred_mode: ExecutionMode = field(init=False)
+    typical_complexity: Literal["simple", "moderate", "complex"] = field(init=False)
+    typically_needs_context: bool = field(init=False)
+
+    def __post_init__(self) -> None:
+        config = self.config
+        self.can_ask_questions = config.get("can_ask_questions", True)
+        self.max_questions = config.get("max_questions")
+        self.preferred_mode = config.get("preferred_mode", "auto")
+        self.typical_complexity = config.get("typical_complexity", "moderate")
+        self.typically_needs_context = config.get("typically_needs_context", False)
 
 
 def decide_execution_mode(
@@ -2,20 +2,37 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import pytest
 
-from subagents_pydantic_ai import (
-    DynamicAgentRegistry,
-    InMemoryMessageBus,
-    SubAgentConfig,
-    TaskManager,
-)
+if TYPE_CHECKING:
+    from subagents_pydantic_ai import (
+        DynamicAgentRegistry,
+        InMemoryMessageBus,
+        SubAgentConfig,
+        TaskManager,
+    )
+
+# The subagents_pydantic_ai imports live inside the fixture bodies (with the
+# TYPE_CHECKING block above for checkers) so pytest collection doesn't pay
+# for importing the package — and pydantic_ai behind it — for test files
+# that never request these fixtures.
+
 
+def pytest_sessionstart(session: pytest.Session) -> None:
+    """Warm the package import once per session (and per xdist worker).
 
-@dataclass
+    Keeps the cost of importing pydantic_ai out of whichever test happens
+    to run first, so per-test timings stay honest and parallel workers all
+    pay it up front instead of serializing on the first factory test.
+    """
+    import subagents_pydantic_ai  # noqa: F401
+
+
+@dataclass(slots=True)
 class MockDeps:
     """Mock dependencies for testing."""
 
@@ -32,6 +49,13 @@ class MockDeps:
         )
 
 
+@dataclass(slots=True)
+class MockRunContext:
+    """Mock run context for testing."""
+
+    deps: MockDeps
+
+
 @pytest.fixture
 def mock_deps() -> MockDeps:
     """Create mock dependencies."""
@@ -39,26 +63,65 @@ def mock_deps() -> MockDeps:
 
 
 @pytest.fixture
-def message_bus() -> InMemoryMessageBus:
-    """Create an in-memory message bus."""
+def mock_ctx() -> MockRunContext:
+    """Create a run context wrapping fresh mock deps."""
+    return MockRunContext(deps=MockDeps())
+
+
+# The bus and task manager are constructed once per module and recycled
+# between tests via their reset() methods, instead of reallocating queues
+# and dicts for every test. Tests still get clean state; they just share
+# the container objects.
+@pytest.fixture(scope="module")
+def _message_bus_instance() -> InMemoryMessageBus:
+    """Module-shared bus instance; use the `message_bus` fixture instead."""
+    from subagents_pydantic_ai import InMemoryMessageBus
+
     return InMemoryMessageBus()
 
 
 @pytest.fixture
-def task_manager(message_bus: InMemoryMessageBus) -> TaskManager:
-    """Create a task manager with message bus."""
-    return TaskManager(message_bus=message_bus)
+def message_bus(_message_bus_instance: InMemoryMessageBus) -> Iterator[InMemoryMessageBus]:
+    """Provide a clean in-memory message bus."""
+    yield _message_bus_instance
+    _message_bus_instance.reset()
+
+
+@pytest.fixture(scope="module")
+def _task_manager_instance(_message_bus_instance: InMemoryMessageBus) -> TaskManager:
+    """Module-shared manager instance; use the `task_manager` fixture instead."""
+    from subagents_pydantic_ai import TaskManager
+
+    return TaskManager(message_bus=_message_bus_instance)
+
+
+@pytest.fixture
+def task_manager(
+    _task_manager_instance: TaskManager,
+    message_bus: InMemoryMessageBus,
+) -> Iterator[TaskManager]:
+    """Provide a clean task manager wired to the shared message bus."""
+    yield _task_manager_instance
+    _task_manager_instance.reset()
 
 
 @pytest.fixture
 def registry() -> DynamicAgentRegistry:
     """Create a dynamic agent registry."""
+    from subagents_pydantic_ai import DynamicAgentRegistry
+
     return DynamicAgentRegistry(max_agents=10)
 
 
-@pytest.fixture
+# The config fixtures below are session-scoped: they are plain data and
+# tests must treat them as read-only. The registry fixture stays
+# function-scoped on purpose — tests mutate it and it has no reset();
+# the bus/manager fixtures above get isolation from reset() instead.
+@pytest.fixture(scope="session")
 def sample_config() -> SubAgentConfig:
     """Create a sample subagent configuration."""
+    from subagents_pydantic_ai import SubAgentConfig
+
     return SubAgentConfig(
         name="test-agent",
         description="A test agent for unit tests",
@@ -69,9 +132,11 @@ def sample_config() -> SubAgentConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def researcher_config() -> SubAgentConfig:
     """Create a researcher subagent configuration."""
+    from subagents_pydantic_ai import SubAgentConfig
+
     return SubAgentConfig(
         name="researcher",
         description="Researches topics thoroughly",
@@ -80,9 +145,11 @@ def researcher_config() -> SubAgentConfig:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def simple_config() -> SubAgentConfig:
     """Create a simple subagent configuration."""
+    from subagents_pydantic_ai import SubAgentConfig
+
     return SubAgentConfig(
         name="simple-helper",
         description="Quick helper for simple tasks",
@@ -2,41 +2,59 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import asyncio
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 
 import pytest
+from conftest import MockDeps, MockRunContext
 from pydantic_ai.toolsets import FunctionToolset
 
-from subagents_pydantic_ai import DynamicAgentRegistry, create_agent_factory_toolset
+from subagents_pydantic_ai import DynamicAgentRegistry, create_agent_factory_toolset, factory
 
+_LONG_INSTRUCTIONS = "A" * 1000
 
-@dataclass
-class MockDeps:
-    """Mock dependencies for testing."""
 
-    subagents: dict[str, Any] = field(default_factory=dict)
+@pytest.fixture
+def factory_toolset(registry: DynamicAgentRegistry) -> FunctionToolset[Any]:
+    """A factory toolset with default options, bound to the test's registry."""
+    return create_agent_factory_toolset(registry=registry)
 
-    def clone_for_subagent(self, max_depth: int = 0) -> MockDeps:
-        return MockDeps(subagents={} if max_depth <= 0 else self.subagents.copy())
 
+@pytest.fixture
+async def registry_with_agent(
+    registry: DynamicAgentRegistry,
+    factory_toolset: FunctionToolset[Any],
+    mock_ctx: MockRunContext,
+) -> DynamicAgentRegistry:
+    """A registry already holding "test-agent", so tests skip the setup call."""
+    await factory_toolset.tools["create_agent"].function(
+        mock_ctx,
+        name="test-agent",
+        description="A test agent for testing",
+        instructions="You are a test agent that tests things.",
+        can_ask_questions=False,
+    )
+    return registry
 
-@dataclass
-class MockRunContext:
-    """Mock run context for testing."""
 
-    deps: MockDeps
+@pytest.fixture(autouse=True)
+def mock_agent_class(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Swap factory.Agent for a mock once per test instead of per with-block."""
+    # The code under test only stores the created agent, so the return
+    # value can be a bare sentinel instead of a full MagicMock.
+    mock = MagicMock(return_value=object())
+    monkeypatch.setattr(factory, "Agent", mock)
+    return mock
 
 
 class TestCreateAgentFactoryToolset:
     """Tests for create_agent_factory_toolset."""
 
-    def test_creates_toolset(self, registry: DynamicAgentRegistry):
+    def test_creates_toolset(self, factory_toolset: FunctionToolset[Any]):
         """Test toolset creation."""
-        toolset = create_agent_factory_toolset(registry=registry)
 
-        tool_names = list(toolset.tools.keys())
+        tool_names = list(factory_toolset.tools.keys())
         assert "create_agent" in tool_names
         assert "list_agents" in tool_names
         assert "remove_agent" in tool_names
@@ -59,83 +77,66 @@ class TestCreateAgentFactoryToolset:
         assert registry.max_agents == 5
 
     @pytest.mark.asyncio
-    async def test_create_agent_success(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_success(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        registry: DynamicAgentRegistry,
+        mock_ctx: MockRunContext,
+    ):
         """Test successful agent creation."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-
-        ctx = MockRunContext(deps=MockDeps())
+        create_tool = factory_toolset.tools["create_agent"]
 
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="A test agent",
-                instructions="Do testing",
-            )
+        result = await create_tool.function(
+            mock_ctx,
+            name="test-agent",
+            description="A test agent",
+            instructions="Do testing",
+        )
 
         assert "created successfully" in result
         assert registry.exists("test-agent")
 
     @pytest.mark.asyncio
-    async def test_create_agent_invalid_name(self, registry: DynamicAgentRegistry):
-        """Test agent creation with invalid name."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-
-        ctx = MockRunContext(deps=MockDeps())
+    @pytest.mark.parametrize("name", ["", "test agent"])
+    async def test_create_agent_invalid_name(
+        self, factory_toolset: FunctionToolset[Any], mock_ctx: MockRunContext, name: str
+    ):
+        """Test agent creation with invalid name (empty, spaces)."""
+        create_tool = factory_toolset.tools["create_agent"]
 
-        # Empty name
         result = await create_tool.function(
-            ctx,
-            name="",
+            mock_ctx,
+            name=name,
             description="Test",
             instructions="Test",
         )
         assert "Error" in result
 
-        # Name with spaces
+    @pytest.mark.asyncio
+    async def test_create_agent_duplicate(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        registry_with_agent: DynamicAgentRegistry,
+        mock_ctx: MockRunContext,
+    ):
+        """Test creating duplicate agent fails."""
+        create_tool = factory_toolset.tools["create_agent"]
+
+        # Try to create duplicate of the prebuilt "test-agent"
         result = await create_tool.function(
-            ctx,
-            name="test agent",
+            mock_ctx,
+            name="test-agent",
             description="Test",
             instructions="Test",
         )
-        assert "Error" in result
-
-    @pytest.mark.asyncio
-    async def test_create_agent_duplicate(self, registry: DynamicAgentRegistry):
-        """Test creating duplicate agent fails."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-
-            # Create first agent
-            await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
-
-            # Try to create duplicate
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
 
         assert "Error" in result
         assert "already exists" in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_disallowed_model(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_disallowed_model(
+        self, registry: DynamicAgentRegistry, mock_ctx: MockRunContext
+    ):
         """Test creating agent with disallowed model."""
         toolset = create_agent_factory_toolset(
             registry=registry,
@@ -143,9 +144,8 @@ class TestCreateAgentFactoryToolset:
         )
         create_tool = toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
         result = await create_tool.function(
-            ctx,
+            mock_ctx,
             name="test-agent",
             description="Test",
             instructions="Test",
@@ -156,7 +156,9 @@ class TestCreateAgentFactoryToolset:
         assert "not allowed" in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_with_capabilities(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_with_capabilities(
+        self, registry: DynamicAgentRegistry, mock_agent_class: MagicMock, mock_ctx: MockRunContext
+    ):
         """Test creating agent with capabilities."""
 
         def mock_capability_factory(deps: MockDeps) -> list[FunctionToolset[Any]]:
@@ -176,19 +178,13 @@ class TestCreateAgentFactoryToolset:
         )
         create_tool = toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent = MagicMock()
-            mock_agent_class.return_value = mock_agent
-
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-                capabilities=["filesystem"],
-            )
+        result = await create_tool.function(
+            mock_ctx,
+            name="test-agent",
+            description="Test",
+            instructions="Test",
+            capabilities=["filesystem"],
+        )
 
         assert "created successfully" in result
         assert "filesystem" in result
@@ -198,7 +194,9 @@ class TestCreateAgentFactoryToolset:
         assert call_kwargs.kwargs.get("toolsets") is not None
 
     @pytest.mark.asyncio
-    async def test_create_agent_invalid_capability(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_invalid_capability(
+        self, registry: DynamicAgentRegistry, mock_ctx: MockRunContext
+    ):
         """Test creating agent with invalid capability."""
         toolset = create_agent_factory_toolset(
             registry=registry,
@@ -208,9 +206,8 @@ class TestCreateAgentFactoryToolset:
         )
         create_tool = toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
         result = await create_tool.function(
-            ctx,
+            mock_ctx,
             name="test-agent",
             description="Test",
             instructions="Test",
@@ -221,7 +218,9 @@ class TestCreateAgentFactoryToolset:
         assert "Unknown capabilities" in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_with_toolsets_factory(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_with_toolsets_factory(
+        self, registry: DynamicAgentRegistry, mock_agent_class: MagicMock, mock_ctx: MockRunContext
+    ):
         """Test creating agent with toolsets_factory."""
 
         def mock_factory(deps: MockDeps) -> list[FunctionToolset[Any]]:
@@ -234,18 +233,12 @@ class TestCreateAgentFactoryToolset:
         )
         create_tool = toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent = MagicMock()
-            mock_agent_class.return_value = mock_agent
-
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
+        result = await create_tool.function(
+            mock_ctx,
+            name="test-agent",
+            description="Test",
+            instructions="Test",
+        )
 
         assert "created successfully" in result
         # Verify Agent was constructed with toolsets from factory
@@ -254,108 +247,85 @@ class TestCreateAgentFactoryToolset:
         assert call_kwargs.kwargs.get("toolsets") is not None
 
     @pytest.mark.asyncio
-    async def test_list_agents_empty(self, registry: DynamicAgentRegistry):
+    async def test_list_agents_empty(
+        self, factory_toolset: FunctionToolset[Any], mock_ctx: MockRunContext
+    ):
         """Test listing agents when empty."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        list_tool = toolset.tools["list_agents"]
+        list_tool = factory_toolset.tools["list_agents"]
 
-        ctx = MockRunContext(deps=MockDeps())
-        result = await list_tool.function(ctx)
+        result = await list_tool.function(mock_ctx)
 
         assert "No dynamically created agents" in result
 
     @pytest.mark.asyncio
-    async def test_list_agents_with_agents(self, registry: DynamicAgentRegistry):
+    async def test_list_agents_with_agents(
+        self, factory_toolset: FunctionToolset[Any], mock_ctx: MockRunContext
+    ):
         """Test listing agents when some exist."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-        list_tool = toolset.tools["list_agents"]
+        create_tool = factory_toolset.tools["create_agent"]
+        list_tool = factory_toolset.tools["list_agents"]
 
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-
-            await create_tool.function(
-                ctx,
+        # The two creations are independent, so let their awaits overlap
+        await asyncio.gather(
+            create_tool.function(
+                mock_ctx,
                 name="agent-1",
                 description="First agent",
                 instructions="Do stuff",
-            )
-            await create_tool.function(
-                ctx,
+            ),
+            create_tool.function(
+                mock_ctx,
                 name="agent-2",
                 description="Second agent",
                 instructions="Do more stuff",
-            )
+            ),
+        )
 
-        result = await list_tool.function(ctx)
+        result = await list_tool.function(mock_ctx)
 
         assert "agent-1" in result
         assert "agent-2" in result
         assert "First agent" in result
 
     @pytest.mark.asyncio
-    async def test_remove_agent_success(self, registry: DynamicAgentRegistry):
+    async def test_remove_agent_success(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        registry_with_agent: DynamicAgentRegistry,
+        mock_ctx: MockRunContext,
+    ):
         """Test removing agent successfully."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-        remove_tool = toolset.tools["remove_agent"]
-
-        ctx = MockRunContext(deps=MockDeps())
+        remove_tool = factory_toolset.tools["remove_agent"]
 
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-
-            # Create agent
-            await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
-
-        # Remove agent
-        result = await remove_tool.function(ctx, "test-agent")
+        result = await remove_tool.function(mock_ctx, "test-agent")
 
         assert "removed" in result
-        assert not registry.exists("test-agent")
+        assert not registry_with_agent.exists("test-agent")
 
     @pytest.mark.asyncio
-    async def test_remove_agent_not_found(self, registry: DynamicAgentRegistry):
-        """Test removing non-existent agent."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        remove_tool = toolset.tools["remove_agent"]
+    @pytest.mark.parametrize("tool_name", ["remove_agent", "get_agent_info"])
+    async def test_unknown_agent_not_found(
+        self, factory_toolset: FunctionToolset[Any], mock_ctx: MockRunContext, tool_name: str
+    ):
+        """Tools that look up an agent report an error for unknown names."""
+        tool = factory_toolset.tools[tool_name]
 
-        ctx = MockRunContext(deps=MockDeps())
-        result = await remove_tool.function(ctx, "nonexistent")
+        result = await tool.function(mock_ctx, "nonexistent")
 
         assert "Error" in result
         assert "not found" in result
 
     @pytest.mark.asyncio
-    async def test_get_agent_info_success(self, registry: DynamicAgentRegistry):
+    async def test_get_agent_info_success(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        registry_with_agent: DynamicAgentRegistry,
+        mock_ctx: MockRunContext,
+    ):
         """Test getting agent info successfully."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-        info_tool = toolset.tools["get_agent_info"]
-
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
+        info_tool = factory_toolset.tools["get_agent_info"]
 
-            # Create agent
-            await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="A test agent for testing",
-                instructions="You are a test agent that tests things.",
-                can_ask_questions=False,
-            )
-
-        # Get info
-        result = await info_tool.function(ctx, "test-agent")
+        result = await info_tool.function(mock_ctx, "test-agent")
 
         assert "test-agent" in result
         assert "A test agent for testing" in result
@@ -363,119 +333,111 @@ class TestCreateAgentFactoryToolset:
         assert "You are a test agent" in result
 
     @pytest.mark.asyncio
-    async def test_get_agent_info_not_found(self, registry: DynamicAgentRegistry):
-        """Test getting info for non-existent agent."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        info_tool = toolset.tools["get_agent_info"]
-
-        ctx = MockRunContext(deps=MockDeps())
-        result = await info_tool.function(ctx, "nonexistent")
-
-        assert "Error" in result
-        assert "not found" in result
-
-    @pytest.mark.asyncio
-    async def test_get_agent_info_long_instructions(self, registry: DynamicAgentRegistry):
-        """Test getting info for agent with long instructions."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-        info_tool = toolset.tools["get_agent_info"]
-
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-
-            # Create agent with long instructions
-            long_instructions = "A" * 1000
-            await create_tool.function(
-                ctx,
-                name="verbose-agent",
-                description="Verbose agent",
-                instructions=long_instructions,
-            )
+    @pytest.mark.parametrize(
+        "length,expect_truncated",
+        [(1000, True), (501, True), (500, False)],
+    )
+    async def test_get_agent_info_long_instructions(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        mock_ctx: MockRunContext,
+        length: int,
+        expect_truncated: bool,
+    ):
+        """Test instruction truncation around the 500-character boundary."""
+        create_tool = factory_toolset.tools["create_agent"]
+        info_tool = factory_toolset.tools["get_agent_info"]
+
+        # Create agent with long instructions (sliced from one shared string)
+        await create_tool.function(
+            mock_ctx,
+            name="verbose-agent",
+            description="Verbose agent",
+            instructions=_LONG_INSTRUCTIONS[:length],
+        )
 
         # Get info
-        result = await info_tool.function(ctx, "verbose-agent")
+        result = await info_tool.function(mock_ctx, "verbose-agent")
 
-        # Should truncate instructions
-        assert "..." in result
-        assert len(result) < len(long_instructions) + 200
+        if expect_truncated:
+            assert "..." in result
+            assert len(result) < length + 200
+        else:
+            assert "..." not in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_max_reached(self):
+    async def test_create_agent_max_reached(self, mock_ctx: MockRunContext):
         """Test creating agent when max limit reached."""
         registry = DynamicAgentRegistry(max_agents=1)
         toolset = create_agent_factory_toolset(registry=registry, max_agents=1)
         create_tool = toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
-
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-
-            # Create first agent
-            await create_tool.function(
-                ctx,
-                name="agent-1",
-                description="First",
-                instructions="First",
-            )
+        # Create first agent
+        await create_tool.function(
+            mock_ctx,
+            name="agent-1",
+            description="First",
+            instructions="First",
+        )
 
-            # Try to create second agent
-            result = await create_tool.function(
-                ctx,
-                name="agent-2",
-                description="Second",
-                instructions="Second",
-            )
+        # Try to create second agent
+        result = await create_tool.function(
+            mock_ctx,
+            name="agent-2",
+            description="Second",
+            instructions="Second",
+        )
 
         assert "Error" in result
         assert "Maximum" in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_value_error(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_value_error(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        mock_agent_class: MagicMock,
+        mock_ctx: MockRunContext,
+    ):
         """Test handling of ValueError during agent creation."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
-
-        ctx = MockRunContext(deps=MockDeps())
+        create_tool = factory_toolset.tools["create_agent"]
 
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.side_effect = ValueError("Invalid configuration")
+        mock_agent_class.side_effect = ValueError("Invalid configuration")
 
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
+        result = await create_tool.function(
+            mock_ctx,
+            name="test-agent",
+            description="Test",
+            instructions="Test",
+        )
 
         assert "Error" in result
         assert "Invalid configuration" in result
 
     @pytest.mark.asyncio
-    async def test_create_agent_generic_exception(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_generic_exception(
+        self,
+        factory_toolset: FunctionToolset[Any],
+        mock_agent_class: MagicMock,
+        mock_ctx: MockRunContext,
+    ):
         """Test handling of generic exception during agent creation."""
-        toolset = create_agent_factory_toolset(registry=registry)
-        create_tool = toolset.tools["create_agent"]
+        create_tool = factory_toolset.tools["create_agent"]
 
-        ctx = MockRunContext(deps=MockDeps())
+        mock_agent_class.side_effect = RuntimeError("Something went wrong")
 
-        with patch("subagents_pydantic_ai.factory.Agent") as mock_agent_class:
-            mock_agent_class.side_effect = RuntimeError("Something went wrong")
-
-            result = await create_tool.function(
-                ctx,
-                name="test-agent",
-                description="Test",
-                instructions="Test",
-            )
+        result = await create_tool.function(
+            mock_ctx,
+            name="test-agent",
+            description="Test",
+            instructions="Test",
+        )
 
         assert "Error creating agent" in result
         assert "Something went wrong" in result
 
-    async def test_create_agent_with_default_agent_factory(self, registry: DynamicAgentRegistry):
+    async def test_create_agent_with_default_agent_factory(
+        self, registry: DynamicAgentRegistry, mock_ctx: MockRunContext
+    ):
         """default_agent_factory is used instead of Agent() when provided."""
         mock_agent = MagicMock()
         factory = MagicMock(return_value=mock_agent)
@@ -485,10 +447,8 @@ class TestCreateAgentFactoryToolset:
             default_agent_factory=factory,
         )
         create_tool = toolset.tools["create_agent"]
-        ctx = MockRunContext(deps=MockDeps())
-
         result = await create_tool.function(
-            ctx,
+            mock_ctx,
             name="custom-agent",
             description="Custom",
             instructions="Do things",
@@ -7,7 +7,7 @@ import asyncio
 import pytest
 
 from subagents_pydantic_ai import InMemoryMessageBus, TaskManager, create_message_bus
-from subagents_pydantic_ai.types import AgentMessage, MessageType, TaskHandle
+from subagents_pydantic_ai.types import AgentMessage, MessageType, TaskHandle, TaskPriority
 
 
 class TestInMemoryMessageBus:
@@ -36,6 +36,33 @@ class TestInMemoryMessageBus:
         """Test unregistering non-existent agent doesn't raise."""
         message_bus.unregister_agent("nonexistent")  # Should not raise
 
+    @pytest.mark.asyncio
+    async def test_unregister_cancels_pending_asks(self, message_bus: InMemoryMessageBus):
+        """Asks waiting on an unregistered agent fail fast, not at timeout."""
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        ask_task = asyncio.create_task(
+            message_bus.ask("parent", "worker", "question", "task-1", timeout=30.0)
+        )
+        await asyncio.sleep(0.01)  # let the ask register its future
+
+        message_bus.unregister_agent("worker")
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(ask_task, timeout=1.0)
+
+    def test_unregister_cancels_asks_without_running_loop(self, message_bus: InMemoryMessageBus):
+        """Pending asks are cancelled inline when no loop is running."""
+        message_bus.register_agent("worker")
+        loop = asyncio.new_event_loop()
+        try:
+            future: asyncio.Future = loop.create_future()
+            message_bus._asks_by_receiver["worker"] = {future}
+
+            message_bus.unregister_agent("worker")
+            assert future.cancelled()
+        finally:
+            loop.close()
+
     def test_registered_agents(self, message_bus: InMemoryMessageBus):
         """Test listing registered agents."""
         message_bus.register_agent("agent-1")
@@ -179,6 +206,32 @@ class TestInMemoryMessageBus:
         assert len(received_messages) == 1
         assert received_messages[0].payload == {"data": "test"}
 
+    @pytest.mark.asyncio
+    async def test_multiple_handlers_notified_concurrently(self, message_bus: InMemoryMessageBus):
+        """Test send dispatches to several handlers via the gather path."""
+        message_bus.register_agent("receiver")
+        seen: list[str] = []
+
+        async def handler_1(msg: AgentMessage):
+            seen.append("first")
+
+        async def handler_2(msg: AgentMessage):
+            seen.append("second")
+
+        message_bus.add_handler(handler_1)
+        message_bus.add_handler(handler_2)
+
+        message = AgentMessage(
+            type=MessageType.TASK_ASSIGNED,
+            sender="sender",
+            receiver="receiver",
+            payload={},
+            task_id="task-1",
+        )
+        await message_bus.send(message)
+
+        assert sorted(seen) == ["first", "second"]
+
     def test_remove_handler(self, message_bus: InMemoryMessageBus):
         """Test removing handlers."""
 
@@ -227,8 +280,7 @@ class TestInMemoryMessageBus:
             task_id="task-2",
         )
 
-        await message_bus.send(msg1)
-        await message_bus.send(msg2)
+        await message_bus.send_many([msg1, msg2])
 
         messages = await message_bus.get_messages("agent", timeout=0.0)
         assert len(messages) == 2
@@ -260,6 +312,28 @@ class TestInMemoryMessageBus:
         assert len(messages) == 1
         assert messages[0].payload == {"delayed": True}
 
+    @pytest.mark.asyncio
+    async def test_get_messages_with_timeout_already_buffered(
+        self, message_bus: InMemoryMessageBus
+    ):
+        """Test a blocking poll skips the waiter when messages are buffered."""
+        message_bus.register_agent("agent")
+        message_bus.register_agent("sender")
+        await message_bus.send(
+            AgentMessage(
+                type=MessageType.TASK_ASSIGNED,
+                sender="sender",
+                receiver="agent",
+                payload={"buffered": True},
+                task_id="task-1",
+            )
+        )
+
+        messages = await message_bus.get_messages("agent", timeout=1.0)
+
+        assert len(messages) == 1
+        assert messages[0].payload == {"buffered": True}
+
     @pytest.mark.asyncio
     async def test_get_messages_timeout_expires(self, message_bus: InMemoryMessageBus):
         """Test get_messages returns empty on timeout."""
@@ -274,6 +348,108 @@ class TestInMemoryMessageBus:
             await message_bus.get_messages("nonexistent")
 
 
+class TestSendMany:
+    """Tests for InMemoryMessageBus.send_many batching."""
+
+    @pytest.mark.asyncio
+    async def test_send_many_delivers_grouped(self, message_bus: InMemoryMessageBus):
+        """Test send_many delivers a batch to multiple receivers."""
+        queue_1 = message_bus.register_agent("worker-1")
+        queue_2 = message_bus.register_agent("worker-2")
+
+        await message_bus.send_many(
+            [
+                AgentMessage(
+                    type=MessageType.TASK_ASSIGNED,
+                    sender="parent",
+                    receiver=receiver,
+                    payload={"id": i},
+                    task_id=f"task-{i}",
+                )
+                for i, receiver in enumerate(["worker-1", "worker-2", "worker-1"])
+            ]
+        )
+
+        assert queue_1.qsize() == 2
+        assert queue_2.qsize() == 1
+
+    @pytest.mark.asyncio
+    async def test_send_many_validates_receivers_first(self, message_bus: InMemoryMessageBus):
+        """Test send_many fails fast without partial delivery."""
+        queue = message_bus.register_agent("worker")
+
+        messages = [
+            AgentMessage(
+                type=MessageType.TASK_ASSIGNED,
+                sender="parent",
+                receiver=receiver,
+                payload={},
+                task_id="task-1",
+            )
+            for receiver in ["worker", "ghost"]
+        ]
+        with pytest.raises(KeyError, match="not registered"):
+            await message_bus.send_many(messages)
+
+        assert queue.qsize() == 0
+
+    @pytest.mark.asyncio
+    async def test_send_many_batch_handler_called_once(self, message_bus: InMemoryMessageBus):
+        """Test a batch-aware handler sees the whole batch in one call."""
+        message_bus.register_agent("worker")
+        calls: list[list[AgentMessage]] = []
+
+        async def handler(batch):
+            calls.append(batch)
+
+        handler.__batch__ = True
+        message_bus.add_handler(handler)
+
+        await message_bus.send_many(
+            [
+                AgentMessage(
+                    type=MessageType.TASK_ASSIGNED,
+                    sender="parent",
+                    receiver="worker",
+                    payload={"id": i},
+                    task_id=f"task-{i}",
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert len(calls) == 1
+        assert len(calls[0]) == 3
+
+    @pytest.mark.asyncio
+    async def test_send_many_plain_handler_called_per_message(
+        self, message_bus: InMemoryMessageBus
+    ):
+        """Test a non-batch handler is invoked once per message."""
+        message_bus.register_agent("worker")
+        seen: list[AgentMessage] = []
+
+        async def handler(msg: AgentMessage):
+            seen.append(msg)
+
+        message_bus.add_handler(handler)
+
+        await message_bus.send_many(
+            [
+                AgentMessage(
+                    type=MessageType.TASK_ASSIGNED,
+                    sender="parent",
+                    receiver="worker",
+                    payload={"id": i},
+                    task_id=f"task-{i}",
+                )
+                for i in range(2)
+            ]
+        )
+
+        assert [msg.task_id for msg in seen] == ["task-0", "task-1"]
+
+
 class TestCreateMessageBus:
     """Tests for create_message_bus factory function."""
 
@@ -290,7 +466,7 @@ class TestCreateMessageBus:
     def test_unknown_backend_raises(self):
         """Test unknown backend raises error."""
         with pytest.raises(ValueError, match="Unknown message bus backend"):
-            create_message_bus("redis")
+            create_message_bus("carrier-pigeon")
 
 
 class TestTaskManager:
@@ -456,6 +632,75 @@ class TestTaskManager:
         # Handle is kept for status queries
         assert "task-1" in task_manager.handles
 
+    @pytest.mark.asyncio
+    async def test_auto_cleanup_with_status_ttl(self, message_bus: InMemoryMessageBus):
+        """Test automatic cleanup when status_ttl_seconds is set."""
+        task_manager = TaskManager(message_bus=message_bus, status_ttl_seconds=0.05)
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="pending",
+        )
+
+        async def quick_task():
+            return "done"
+
+        task = task_manager.create_task("task-1", quick_task(), handle)
+        await task
+        await asyncio.sleep(0)  # Let done callbacks run
+
+        # Task and cancel event are released immediately on completion
+        assert "task-1" not in task_manager.tasks
+        assert "task-1" not in task_manager._cancel_events
+        # Handle survives until the TTL expires
+        assert "task-1" in task_manager.handles
+
+        await asyncio.sleep(0.1)
+        assert "task-1" not in task_manager.handles
+
+    @pytest.mark.asyncio
+    async def test_auto_cleanup_without_handle_skips_ttl_timer(
+        self, message_bus: InMemoryMessageBus
+    ):
+        """Test completion cleanup drops the whole record when the handle is gone."""
+        task_manager = TaskManager(message_bus=message_bus, status_ttl_seconds=0.05)
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="pending",
+        )
+
+        task = task_manager.create_task("task-1", asyncio.sleep(0.01), handle)
+        del task_manager.handles["task-1"]
+        await task
+        await asyncio.sleep(0)  # Let done callbacks run
+
+        # Nothing left to keep for status queries — no eviction timer armed
+        assert "task-1" not in task_manager.records
+
+    @pytest.mark.asyncio
+    async def test_handle_eviction_tolerates_manual_cleanup(self, message_bus: InMemoryMessageBus):
+        """Test the TTL timer is a no-op when the handle was dropped early."""
+        task_manager = TaskManager(message_bus=message_bus, status_ttl_seconds=0.05)
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="pending",
+        )
+
+        task = task_manager.create_task("task-1", asyncio.sleep(0), handle)
+        await task
+        await asyncio.sleep(0)  # Let done callbacks run; eviction timer is armed
+        assert "task-1" in task_manager.handles
+
+        del task_manager.handles["task-1"]  # record is now empty and removed
+
+        await asyncio.sleep(0.1)  # The timer fires on a missing record
+        assert "task-1" not in task_manager.records
+
     @pytest.mark.asyncio
     async def test_list_active_tasks(self, task_manager: TaskManager):
         """Test listing active tasks."""
@@ -559,9 +804,9 @@ class TestInMemoryMessageBusAnswerEdgeCases:
 
         ask_task = asyncio.create_task(do_ask())
 
-        # Wait for the question to arrive
-        await asyncio.sleep(0.05)
-        msg = await receiver_queue.get()
+        # The queue.get resolves as soon as the ask task's send runs —
+        # no wall-clock sleep needed, just a bounded wait.
+        msg = await asyncio.wait_for(receiver_queue.get(), timeout=1.0)
 
         # Answer the question
         await message_bus.answer(msg, "first answer")
@@ -579,9 +824,9 @@ class TestInMemoryMessageBusAnswerEdgeCases:
         message_bus.register_agent("agent")
         message_bus.register_agent("sender")
 
-        # Send multiple messages
-        for i in range(3):
-            await message_bus.send(
+        # Send multiple messages in one batch
+        await message_bus.send_many(
+            [
                 AgentMessage(
                     type=MessageType.TASK_ASSIGNED,
                     sender="sender",
@@ -589,7 +834,9 @@ class TestInMemoryMessageBusAnswerEdgeCases:
                     payload={"id": i},
                     task_id=f"task-{i}",
                 )
-            )
+                for i in range(3)
+            ]
+        )
 
         # Get all messages - this will drain the queue
         messages = await message_bus.get_messages("agent", timeout=0.0)
@@ -668,9 +915,9 @@ class TestTaskManagerBranchCoverage:
             )
         )
 
-        # Wait for question to arrive
-        await asyncio.sleep(0.05)
-        msg = await receiver_queue.get()
+        # The queue.get resolves as soon as the ask task's send runs —
+        # no wall-clock sleep needed, just a bounded wait.
+        msg = await asyncio.wait_for(receiver_queue.get(), timeout=1.0)
 
         # Get the future for this correlation_id
         future = message_bus._pending_questions.get(msg.correlation_id)
@@ -694,3 +941,887 @@ class TestTaskManagerBranchCoverage:
         # The ask should complete with the first answer
         response = await ask_task
         assert response.payload == "first answer"
+
+    @pytest.mark.asyncio
+    async def test_soft_cancel_reuses_existing_event(self, task_manager: TaskManager):
+        """Test soft_cancel sets a previously allocated event instead of replacing it."""
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="running",
+        )
+        task_manager.create_task("task-1", asyncio.sleep(1), handle)
+        event = task_manager.get_cancel_event("task-1")
+        assert event is not None and not event.is_set()
+
+        result = await task_manager.soft_cancel("task-1")
+
+        assert result is True
+        assert task_manager._cancel_events["task-1"] is event
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_record_view_delete_missing_field_raises(self, task_manager: TaskManager):
+        """Test deleting an unset field raises KeyError even if the record exists."""
+        task_manager.handles["task-1"] = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+        )
+
+        with pytest.raises(KeyError):
+            del task_manager.tasks["task-1"]
+
+    @pytest.mark.asyncio
+    async def test_record_view_delete_drops_empty_record(self, task_manager: TaskManager):
+        """Test deleting the last populated field removes the record itself."""
+        task = asyncio.create_task(asyncio.sleep(0))
+        task_manager.tasks["task-1"] = task
+
+        del task_manager.tasks["task-1"]
+
+        assert "task-1" not in task_manager.records
+        await task
+
+    @pytest.mark.asyncio
+    async def test_record_view_iteration_and_length(self, task_manager: TaskManager):
+        """Test views iterate and count only records with their field set."""
+        task = asyncio.create_task(asyncio.sleep(0))
+        task_manager.tasks["task-1"] = task
+        task_manager.handles["task-2"] = TaskHandle(
+            task_id="task-2",
+            subagent_name="worker",
+            description="test",
+        )
+
+        assert list(task_manager.tasks) == ["task-1"]
+        assert len(task_manager.tasks) == 1
+        assert list(task_manager.handles) == ["task-2"]
+        await task
+
+    @pytest.mark.asyncio
+    async def test_cleanup_unknown_task_is_noop(self, task_manager: TaskManager):
+        """Test cleanup_task tolerates ids it has never seen."""
+        task_manager.cleanup_task("nonexistent")  # Should not raise
+
+    @pytest.mark.asyncio
+    async def test_cleanup_drops_record_without_handle(self, task_manager: TaskManager):
+        """Test cleanup removes the whole record when no handle is kept."""
+        task = asyncio.create_task(asyncio.sleep(0))
+        task_manager.tasks["task-1"] = task
+        await task
+
+        task_manager.cleanup_task("task-1")
+
+        assert "task-1" not in task_manager.records
+
+
+class TestMessagePool:
+    """Tests for the opt-in AgentMessage freelist."""
+
+    def test_pool_disabled_by_default(self):
+        """Test release is a no-op and acquire allocates when pooling is off."""
+        from subagents_pydantic_ai import message_bus as mb
+
+        mb._MSG_POOL.clear()
+        msg = mb._acquire_message(
+            type=MessageType.TASK_UPDATE,
+            sender="a",
+            receiver="b",
+            payload=None,
+            task_id="task-1",
+        )
+        mb._release_message(msg)
+        assert len(mb._MSG_POOL) == 0
+
+    def test_pool_recycles_with_fresh_identity(self, monkeypatch):
+        """Test recycled messages get new id/timestamp and updated fields."""
+        from subagents_pydantic_ai import message_bus as mb
+
+        monkeypatch.setattr(mb, "_POOL_ENABLED", True)
+        mb._MSG_POOL.clear()
+
+        first = mb._acquire_message(
+            type=MessageType.QUESTION,
+            sender="a",
+            receiver="b",
+            payload="q",
+            task_id="task-1",
+            correlation_id=1,
+        )
+        old_id = first.id
+        mb._release_message(first)
+        assert len(mb._MSG_POOL) == 1
+
+        second = mb._acquire_message(
+            type=MessageType.ANSWER,
+            sender="b",
+            receiver="a",
+            payload="ans",
+            task_id="task-2",
+        )
+        assert second is first  # Same instance, recycled
+        assert second.type == MessageType.ANSWER
+        assert second.sender == "b"
+        assert second.payload == "ans"
+        assert second.task_id == "task-2"
+        assert second.correlation_id is None
+        assert second.id != old_id
+
+        mb._MSG_POOL.clear()
+
+
+class TestBuildMessage:
+    """Tests for build_message and the ambient task-ID context."""
+
+    def test_explicit_task_id_wins(self):
+        """Test an explicit task_id overrides the ambient one."""
+        from subagents_pydantic_ai.message_bus import _current_task_id, build_message
+
+        token = _current_task_id.set("ambient-task")
+        try:
+            msg = build_message(
+                MessageType.TASK_UPDATE, "a", "b", {"n": 1}, task_id="explicit-task"
+            )
+        finally:
+            _current_task_id.reset(token)
+
+        assert msg.task_id == "explicit-task"
+
+    def test_defaults_to_empty_without_context(self):
+        """Test task_id falls back to empty string outside any task."""
+        from subagents_pydantic_ai.message_bus import build_message
+
+        msg = build_message(MessageType.TASK_UPDATE, "a", "b", None)
+        assert msg.task_id == ""
+
+    @pytest.mark.asyncio
+    async def test_picks_up_task_id_inside_managed_task(self, task_manager: TaskManager):
+        """Test coroutines run via create_task see their task_id ambiently."""
+        from subagents_pydantic_ai.message_bus import _current_task_id, build_message
+
+        handle = TaskHandle(
+            task_id="task-ctx",
+            subagent_name="worker",
+            description="test",
+            status="pending",
+        )
+
+        async def worker():
+            return build_message(MessageType.TASK_UPDATE, "worker", "parent", "hi")
+
+        task = task_manager.create_task("task-ctx", worker(), handle)
+        msg = await task
+
+        assert msg.task_id == "task-ctx"
+        # The binding must not leak into the caller's context
+        assert _current_task_id.get() is None
+
+
+class TestSingleConsumerQueue:
+    """Tests for the lightweight single-consumer queue."""
+
+    def test_put_and_get_nowait(self):
+        """Test FIFO ordering and empty/qsize bookkeeping."""
+        from subagents_pydantic_ai.message_bus import SingleConsumerQueue
+
+        queue = SingleConsumerQueue()
+        assert queue.empty()
+
+        queue.put_nowait("first")
+        queue.put_nowait("second")
+        assert queue.qsize() == 2
+
+        assert queue.get_nowait() == "first"
+        assert queue.get_nowait() == "second"
+        assert queue.empty()
+
+    def test_get_nowait_empty_raises(self):
+        """Test get_nowait raises QueueEmpty like asyncio.Queue."""
+        from subagents_pydantic_ai.message_bus import SingleConsumerQueue
+
+        queue = SingleConsumerQueue()
+        with pytest.raises(asyncio.QueueEmpty):
+            queue.get_nowait()
+
+    @pytest.mark.asyncio
+    async def test_get_waits_for_message(self):
+        """Test get blocks until a producer puts a message."""
+        from subagents_pydantic_ai.message_bus import SingleConsumerQueue
+
+        queue = SingleConsumerQueue()
+
+        async def producer():
+            await asyncio.sleep(0.01)
+            queue.put_nowait("hello")
+
+        asyncio.get_running_loop().create_task(producer())
+        assert await queue.get() == "hello"
+
+    def test_bulk_drain_compatible(self):
+        """Test _drain_queue_fast drains it like an asyncio.Queue."""
+        from subagents_pydantic_ai.message_bus import SingleConsumerQueue, _drain_queue_fast
+
+        queue = SingleConsumerQueue()
+        for n in range(3):
+            queue.put_nowait(n)
+
+        messages: list = []
+        _drain_queue_fast(queue, messages)
+        assert messages == [0, 1, 2]
+        assert queue.empty()
+        assert not queue._event.is_set()
+
+    def test_bulk_drain_falls_back_for_foreign_queues(self):
+        """Test _drain_queue_fast drains an asyncio.Queue one message at a time."""
+        from subagents_pydantic_ai.message_bus import _drain_queue_fast
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for n in range(3):
+            queue.put_nowait(n)
+
+        messages: list = []
+        _drain_queue_fast(queue, messages)
+        assert messages == [0, 1, 2]
+        assert queue.empty()
+
+    def test_bus_hands_out_single_consumer_mailboxes(self):
+        """Test register_agent returns the lightweight queue type."""
+        from subagents_pydantic_ai.message_bus import SingleConsumerQueue
+
+        bus = InMemoryMessageBus()
+        queue = bus.register_agent("agent-1")
+        assert isinstance(queue, SingleConsumerQueue)
+
+
+class TestAskBatcher:
+    """Tests for the question-coalescing AskBatcher."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_questions_batched(self, message_bus: InMemoryMessageBus):
+        """Test questions in the same window share one round-trip."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_wait=0.01)
+
+        received: list = []
+
+        async def responder():
+            while True:
+                messages = await message_bus.get_messages("worker", timeout=0.5)
+                if messages:
+                    received.append(messages[0])
+                    questions = messages[0].payload
+                    await message_bus.answer(messages[0], [f"answer to {q}" for q in questions])
+                    return
+
+        responder_task = asyncio.create_task(responder())
+        answers = await asyncio.gather(
+            batcher.ask("first?", "task-1"),
+            batcher.ask("second?", "task-2"),
+        )
+        await responder_task
+
+        assert answers == ["answer to first?", "answer to second?"]
+        assert len(received) == 1  # One bus round-trip for both questions
+        assert received[0].payload == ["first?", "second?"]
+
+    @pytest.mark.asyncio
+    async def test_solitary_question_single_shot(self, message_bus: InMemoryMessageBus):
+        """Test a batch of one keeps the plain payload shape."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_wait=0.01)
+
+        async def responder():
+            while True:
+                messages = await message_bus.get_messages("worker", timeout=0.5)
+                if messages:
+                    assert messages[0].payload == "only question?"
+                    await message_bus.answer(messages[0], "only answer")
+                    return
+
+        responder_task = asyncio.create_task(responder())
+        answer = await batcher.ask("only question?", "task-1")
+        await responder_task
+
+        assert answer == "only answer"
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_immediate_flush(self, message_bus: InMemoryMessageBus):
+        """Test reaching max_batch_size flushes without waiting for the timer."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_batch_size=2, max_wait=5.0)
+
+        async def responder():
+            while True:
+                messages = await message_bus.get_messages("worker", timeout=0.5)
+                if messages:
+                    await message_bus.answer(messages[0], [q.upper() for q in messages[0].payload])
+                    return
+
+        responder_task = asyncio.create_task(responder())
+        answers = await asyncio.wait_for(
+            asyncio.gather(batcher.ask("a?", "task-1"), batcher.ask("b?", "task-2")),
+            timeout=1.0,
+        )
+        await responder_task
+
+        assert answers == ["A?", "B?"]
+
+    @pytest.mark.asyncio
+    async def test_timeout_propagates_to_all_askers(self, message_bus: InMemoryMessageBus):
+        """Test every queued asker sees the round-trip failure."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_wait=0.01, timeout=0.05)
+
+        results = await asyncio.gather(
+            batcher.ask("a?", "task-1"),
+            batcher.ask("b?", "task-2"),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, asyncio.TimeoutError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_flush_with_nothing_pending_is_noop(self, message_bus: InMemoryMessageBus):
+        """Test a flush racing an earlier one finds nothing to send."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_wait=0.01)
+
+        await batcher._flush()  # nothing queued; must not hit the bus
+
+        assert (await message_bus.get_messages("worker")) == []
+
+    @pytest.mark.asyncio
+    async def test_flush_skips_already_resolved_futures(self, message_bus: InMemoryMessageBus):
+        """Test flush leaves futures resolved by a cancelled asker alone."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        batcher = AskBatcher(message_bus, "parent", "worker", max_wait=5.0)
+
+        loop = asyncio.get_running_loop()
+        done_future: asyncio.Future = loop.create_future()
+        done_future.set_result("stale")
+        batcher._pending = [("solo?", "task-1", done_future)]
+
+        async def responder():
+            while True:
+                messages = await message_bus.get_messages("worker", timeout=0.5)
+                if messages:
+                    await message_bus.answer(messages[0], "fresh")
+                    return
+
+        responder_task = asyncio.create_task(responder())
+        await batcher._flush()
+        await responder_task
+
+        assert done_future.result() == "stale"
+
+        # Same guard on the multi-question path
+        done_future = loop.create_future()
+        done_future.set_result("stale")
+        live_future: asyncio.Future = loop.create_future()
+        batcher._pending = [("a?", "task-1", done_future), ("b?", "task-2", live_future)]
+
+        async def batch_responder():
+            while True:
+                messages = await message_bus.get_messages("worker", timeout=0.5)
+                if messages:
+                    await message_bus.answer(messages[0], [q.upper() for q in messages[0].payload])
+                    return
+
+        responder_task = asyncio.create_task(batch_responder())
+        await batcher._flush()
+        await responder_task
+
+        assert done_future.result() == "stale"
+        assert live_future.result() == "B?"
+
+    @pytest.mark.asyncio
+    async def test_flush_failure_skips_already_resolved_futures(
+        self, message_bus: InMemoryMessageBus
+    ):
+        """Test a failed round-trip only fails the still-waiting futures."""
+        from subagents_pydantic_ai.message_bus import AskBatcher
+
+        message_bus.register_agent("parent")
+        batcher = AskBatcher(message_bus, "parent", "ghost", max_wait=5.0)
+
+        loop = asyncio.get_running_loop()
+        done_future: asyncio.Future = loop.create_future()
+        done_future.set_result("stale")
+        live_future: asyncio.Future = loop.create_future()
+        batcher._pending = [("a?", "task-1", done_future), ("b?", "task-2", live_future)]
+
+        await batcher._flush()  # "ghost" is not registered; ask raises
+
+        assert done_future.result() == "stale"
+        with pytest.raises(KeyError, match="not registered"):
+            live_future.result()
+
+
+class TestPriorityDispatch:
+    """Tests for max_concurrency-bounded priority dispatch."""
+
+    @staticmethod
+    def _handle(task_id: str, priority: TaskPriority = TaskPriority.NORMAL) -> TaskHandle:
+        return TaskHandle(
+            task_id=task_id,
+            subagent_name="worker",
+            description="test",
+            priority=priority,
+        )
+
+    @pytest.mark.asyncio
+    async def test_unbounded_starts_immediately(self, task_manager: TaskManager):
+        """Default manager keeps fire-and-forget semantics."""
+
+        async def work():
+            await asyncio.sleep(0)
+
+        task = task_manager.create_task("task-1", work(), self._handle("task-1"))
+
+        assert task is not None
+        assert task_manager.get_handle("task-1").status == "running"
+        await task
+
+    @pytest.mark.asyncio
+    async def test_bounded_queues_overflow(self, message_bus: InMemoryMessageBus):
+        """Tasks beyond the bound stay pending until a slot frees."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        async def quick():
+            return None
+
+        first = tm.create_task("task-1", blocker(), self._handle("task-1"))
+        second = tm.create_task("task-2", quick(), self._handle("task-2"))
+
+        assert first is not None
+        assert second is None
+        assert tm.get_handle("task-2").status == "pending"
+
+        release.set()
+        await first
+        await asyncio.sleep(0)
+
+        assert tm.get_handle("task-2").status in ("running", "completed")
+
+    @pytest.mark.asyncio
+    async def test_higher_priority_dispatches_first(self, message_bus: InMemoryMessageBus):
+        """A CRITICAL task queued after a LOW one starts before it."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def blocker():
+            await release.wait()
+
+        def tracked(name: str):
+            async def work():
+                started.append(name)
+
+            return work()
+
+        blocking = tm.create_task("task-0", blocker(), self._handle("task-0"))
+        tm.create_task("low", tracked("low"), self._handle("low", TaskPriority.LOW))
+        tm.create_task("crit", tracked("crit"), self._handle("crit", TaskPriority.CRITICAL))
+
+        release.set()
+        await blocking
+        for _ in range(4):
+            await asyncio.sleep(0)
+
+        assert started == ["crit", "low"]
+
+    @pytest.mark.asyncio
+    async def test_hard_cancel_queued_task(self, message_bus: InMemoryMessageBus):
+        """Cancelling a queued task drops it before it ever starts."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def blocker():
+            await release.wait()
+
+        async def work():
+            started.append("queued")
+
+        blocking = tm.create_task("task-0", blocker(), self._handle("task-0"))
+        tm.create_task("task-1", work(), self._handle("task-1"))
+
+        assert await tm.hard_cancel("task-1") is True
+        assert tm.get_handle("task-1").status == "cancelled"
+
+        release.set()
+        await blocking
+        await asyncio.sleep(0)
+
+        assert started == []
+
+    @pytest.mark.asyncio
+    async def test_soft_cancel_queued_task(self, message_bus: InMemoryMessageBus):
+        """Soft-cancelling a queued task cancels it outright."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        release = asyncio.Event()
+        started: list[str] = []
+
+        async def blocker():
+            await release.wait()
+
+        async def work():
+            started.append("queued")
+
+        blocking = tm.create_task("task-0", blocker(), self._handle("task-0"))
+        tm.create_task("task-1", work(), self._handle("task-1"))
+
+        assert await tm.soft_cancel("task-1") is True
+        assert tm.get_handle("task-1").status == "cancelled"
+
+        release.set()
+        await blocking
+        await asyncio.sleep(0)
+
+        assert started == []
+
+    @pytest.mark.asyncio
+    async def test_soft_cancel_many_queued_task(self, message_bus: InMemoryMessageBus):
+        """Batch soft-cancel handles queued tasks like soft_cancel does."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        release = asyncio.Event()
+
+        async def blocker():
+            await release.wait()
+
+        async def work():
+            pass
+
+        blocking = tm.create_task("task-0", blocker(), self._handle("task-0"))
+        tm.create_task("task-1", work(), self._handle("task-1"))
+
+        results = await tm.soft_cancel_many(["task-1", "missing"])
+        assert results == {"task-1": True, "missing": False}
+        assert tm.get_handle("task-1").status == "cancelled"
+
+        release.set()
+        await blocking
+
+
+class TestTaskManagerShutdown:
+    """Tests for TaskManager.shutdown."""
+
+    @pytest.mark.asyncio
+    async def test_shutdown_cancels_running_and_queued(self, message_bus: InMemoryMessageBus):
+        """Running tasks are cancelled and awaited; queued ones never start."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        started: list[str] = []
+
+        async def blocker():
+            started.append("running")
+            await asyncio.sleep(30)
+
+        async def queued():
+            started.append("queued")
+
+        def handle(task_id: str) -> TaskHandle:
+            return TaskHandle(task_id=task_id, subagent_name="worker", description="test")
+
+        running = tm.create_task("task-0", blocker(), handle("task-0"))
+        tm.create_task("task-1", queued(), handle("task-1"))
+        await asyncio.sleep(0)
+
+        await tm.shutdown()
+
+        assert started == ["running"]
+        assert running.cancelled()
+        assert tm.get_handle("task-1").status == "cancelled"
+
+    @pytest.mark.asyncio
+    async def test_shutdown_leaves_already_cancelled_queued_status(
+        self, message_bus: InMemoryMessageBus
+    ):
+        """A queued task hard-cancelled beforehand keeps its final status."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+
+        def handle(task_id: str) -> TaskHandle:
+            return TaskHandle(task_id=task_id, subagent_name="worker", description="test")
+
+        tm.create_task("task-0", asyncio.sleep(30), handle("task-0"))
+        tm.create_task("task-1", asyncio.sleep(0), handle("task-1"))
+        await tm.hard_cancel("task-1")
+        completed_at = tm.get_handle("task-1").completed_at
+
+        await tm.shutdown()
+
+        assert tm.get_handle("task-1").completed_at == completed_at
+
+    @pytest.mark.asyncio
+    async def test_shutdown_idle_manager(self, message_bus: InMemoryMessageBus):
+        """Shutdown on a manager with nothing running returns immediately."""
+        tm = TaskManager(message_bus=message_bus)
+        await tm.shutdown()  # Should not raise
+
+
+class TestReceiveContextManager:
+    """Tests for InMemoryMessageBus.receive."""
+
+    @pytest.mark.asyncio
+    async def test_receive_yields_message(self, message_bus: InMemoryMessageBus):
+        """receive() hands out one message and releases it on exit."""
+        message_bus.register_agent("receiver")
+        await message_bus.send(
+            AgentMessage(
+                type=MessageType.TASK_ASSIGNED,
+                sender="sender",
+                receiver="receiver",
+                payload={"data": "test"},
+                task_id="task-1",
+            )
+        )
+
+        async with message_bus.receive("receiver") as msg:
+            assert msg.payload == {"data": "test"}
+
+    @pytest.mark.asyncio
+    async def test_receive_unregistered_raises(self, message_bus: InMemoryMessageBus):
+        """receive() for an unknown agent raises before waiting."""
+        with pytest.raises(KeyError, match="not registered"):
+            async with message_bus.receive("nonexistent"):
+                pass
+
+
+class TestCancelEventPool:
+    """Tests for TaskManager's cancel-event free-list."""
+
+    @pytest.mark.asyncio
+    async def test_event_reused_after_cleanup(self, task_manager: TaskManager):
+        """cleanup_task recycles the event for the next task."""
+        handle = TaskHandle(task_id="task-1", subagent_name="worker", description="test")
+        task_manager.create_task("task-1", asyncio.sleep(0), handle)
+        event = task_manager.get_cancel_event("task-1")
+        assert event is not None
+        await asyncio.sleep(0.01)
+        task_manager.cleanup_task("task-1")
+
+        handle2 = TaskHandle(task_id="task-2", subagent_name="worker", description="test")
+        task_manager.create_task("task-2", asyncio.sleep(0), handle2)
+        recycled = task_manager.get_cancel_event("task-2")
+        assert recycled is event
+        assert not recycled.is_set()
+        await asyncio.sleep(0.01)
+
+
+class TestSoftCancelMany:
+    """Tests for TaskManager.soft_cancel_many batch cancellation."""
+
+    @staticmethod
+    def _handle(task_id: str, subagent_name: str = "worker") -> TaskHandle:
+        return TaskHandle(
+            task_id=task_id,
+            subagent_name=subagent_name,
+            description="test",
+            status="running",
+        )
+
+    @pytest.mark.asyncio
+    async def test_mixed_found_and_missing(self, task_manager: TaskManager):
+        """Found tasks are cancelled; unknown IDs report False."""
+        for task_id in ("task-1", "task-2"):
+            task_manager.create_task(task_id, asyncio.sleep(1), self._handle(task_id))
+
+        results = await task_manager.soft_cancel_many(["task-1", "missing", "task-2"])
+
+        assert results == {"task-1": True, "missing": False, "task-2": True}
+        assert task_manager._cancel_events["task-1"].is_set()
+        assert task_manager._cancel_events["task-2"].is_set()
+
+    @pytest.mark.asyncio
+    async def test_already_done_task(self, task_manager: TaskManager):
+        """A finished but not yet cleaned-up task still reports True."""
+        task = task_manager.create_task("task-1", asyncio.sleep(0), self._handle("task-1"))
+        assert task is not None
+        await task
+
+        results = await task_manager.soft_cancel_many(["task-1"])
+        assert results == {"task-1": True}
+
+    @pytest.mark.asyncio
+    async def test_reuses_existing_cancel_event(self, task_manager: TaskManager):
+        """A previously allocated cancel event is set, not replaced."""
+        task_manager.create_task("task-1", asyncio.sleep(1), self._handle("task-1"))
+        event = task_manager.get_cancel_event("task-1")
+        assert event is not None and not event.is_set()
+
+        results = await task_manager.soft_cancel_many(["task-1"])
+
+        assert results == {"task-1": True}
+        assert task_manager._cancel_events["task-1"] is event
+        assert event.is_set()
+
+    @pytest.mark.asyncio
+    async def test_cleaned_up_task_reports_false(self, task_manager: TaskManager):
+        """After cleanup_task the task is no longer cancellable."""
+        task = task_manager.create_task("task-1", asyncio.sleep(0), self._handle("task-1"))
+        assert task is not None
+        await task
+        task_manager.cleanup_task("task-1")
+
+        results = await task_manager.soft_cancel_many(["task-1"])
+        assert results == {"task-1": False}
+
+    @pytest.mark.asyncio
+    async def test_cancel_requests_delivered_in_one_batch(
+        self, task_manager: TaskManager, message_bus: InMemoryMessageBus
+    ):
+        """Registered subagents get their CANCEL_REQUEST messages batched."""
+        queue = message_bus.register_agent("worker")
+        for task_id in ("task-1", "task-2"):
+            task_manager.create_task(task_id, asyncio.sleep(1), self._handle(task_id))
+
+        results = await task_manager.soft_cancel_many(["task-1", "task-2"])
+
+        assert results == {"task-1": True, "task-2": True}
+        assert queue.qsize() == 2
+        for _ in range(2):
+            msg = queue.get_nowait()
+            assert msg.type == MessageType.CANCEL_REQUEST
+            assert msg.payload == {"reason": "soft_cancel"}
+
+    @pytest.mark.asyncio
+    async def test_events_reused_from_pool(self, task_manager: TaskManager):
+        """Batch cancellation draws cancel events from the free-list."""
+        handle = self._handle("task-1")
+        task = task_manager.create_task("task-1", asyncio.sleep(0), handle)
+        assert task is not None
+        event = task_manager.get_cancel_event("task-1")
+        await task
+        task_manager.cleanup_task("task-1")
+
+        task_manager.create_task("task-2", asyncio.sleep(1), self._handle("task-2"))
+        results = await task_manager.soft_cancel_many(["task-2"])
+
+        assert results == {"task-2": True}
+        recycled = task_manager._cancel_events["task-2"]
+        assert recycled is event
+        assert recycled.is_set()
+
+
+class TestMarkInactive:
+    """Tests for TaskManager.mark_inactive early retirement."""
+
+    @pytest.mark.asyncio
+    async def test_mark_inactive_drops_from_active_listing(self, task_manager: TaskManager):
+        """A retired task leaves list_active_tasks but keeps its handle."""
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="running",
+        )
+        task_manager.create_task("task-1", asyncio.sleep(1), handle)
+        assert "task-1" in task_manager.list_active_tasks()
+
+        task_manager.mark_inactive("task-1")
+
+        assert "task-1" not in task_manager.list_active_tasks()
+        assert task_manager.get_handle("task-1") is handle
+
+
+class TestReset:
+    """Tests for TaskManager.reset recycling a live manager."""
+
+    @pytest.mark.asyncio
+    async def test_stale_done_callbacks_ignored(self, message_bus: InMemoryMessageBus):
+        """Tasks cancelled by reset must not corrupt the slot count."""
+        tm = TaskManager(message_bus=message_bus, max_concurrency=1)
+        handle = TaskHandle(
+            task_id="task-1",
+            subagent_name="worker",
+            description="test",
+            status="running",
+        )
+        tm.create_task("task-1", asyncio.sleep(10), handle)
+        assert tm._running == 1
+
+        tm.reset()
+        await asyncio.sleep(0.01)  # the cancelled task's done-callback fires here
+
+        assert tm._running == 0
+
+        # The concurrency bound still holds on the recycled manager
+        handle2 = TaskHandle(
+            task_id="task-2",
+            subagent_name="worker",
+            description="test",
+            status="running",
+        )
+        tm.create_task("task-2", asyncio.sleep(10), handle2)
+        assert tm._running == 1
+
+        handle3 = TaskHandle(
+            task_id="task-3",
+            subagent_name="worker",
+            description="test",
+            status="pending",
+        )
+        assert tm.create_task("task-3", asyncio.sleep(0), handle3) is None  # queued
+
+        tm.reset()
+
+    @pytest.mark.asyncio
+    async def test_reset_cancels_answer_futures(self, message_bus: InMemoryMessageBus):
+        """Pending answer futures are cancelled so they never leak warnings."""
+        tm = TaskManager(message_bus=message_bus)
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[str] = loop.create_future()
+        tm.set_answer_future("task-1", future)
+        resolved: asyncio.Future[str] = loop.create_future()
+        resolved.set_result("done")
+        tm.set_answer_future("task-2", resolved)
+
+        tm.reset()
+
+        assert future.cancelled()
+        assert resolved.result() == "done"  # already-done futures are left alone
+        assert tm.get_answer_future("task-1") is None
+
+    @pytest.mark.asyncio
+    async def test_bus_reset_cancels_pending_asks(self, message_bus: InMemoryMessageBus):
+        """Bus reset cancels outstanding ask futures before dropping them."""
+        message_bus.register_agent("parent")
+        message_bus.register_agent("worker")
+        ask_task = asyncio.create_task(
+            message_bus.ask("parent", "worker", "question", "task-1", timeout=30.0)
+        )
+        await asyncio.sleep(0.01)  # let the ask register its future
+
+        resolved: asyncio.Future = asyncio.get_running_loop().create_future()
+        resolved.set_result("done")
+        message_bus._pending_questions["corr-done"] = resolved
+
+        message_bus.reset()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(ask_task, timeout=1.0)
+        assert resolved.result() == "done"  # already-done futures are left alone
+        assert not message_bus._pending_questions
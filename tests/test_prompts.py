@@ -205,3 +205,64 @@ class TestGetTaskInstructionsPrompt:
 
         # Should not mention the limit since questions are disabled
         assert "up to 5" not in result
+
+
+class TestPromptMemoization:
+    """Tests for prompt-builder caching."""
+
+    def test_subagent_prompt_is_cached_by_content(self):
+        """Test equal (but distinct) config lists share one cached string."""
+
+        def make() -> list[SubAgentConfig]:
+            return [
+                SubAgentConfig(
+                    name="researcher",
+                    description="Researches topics",
+                    instructions="Do research",
+                )
+            ]
+
+        first = get_subagent_system_prompt(make())
+        second = get_subagent_system_prompt(make())
+
+        assert first is second
+
+    def test_task_instructions_are_cached(self):
+        """Test repeated identical calls reuse the assembled string."""
+        first = get_task_instructions_prompt("Do the thing", max_questions=2)
+        second = get_task_instructions_prompt("Do the thing", max_questions=2)
+
+        assert first is second
+
+
+class TestRenderedSectionDeduplication:
+    """Tests for the rendered_sections tracker."""
+
+    def test_section_emitted_once(self):
+        """Test a second render with the same tracker returns empty."""
+        configs = [
+            SubAgentConfig(
+                name="worker",
+                description="Does work",
+                instructions="Work hard",
+            )
+        ]
+        rendered: set[str] = set()
+
+        first = get_subagent_system_prompt(configs, rendered_sections=rendered)
+        second = get_subagent_system_prompt(configs, rendered_sections=rendered)
+
+        assert "**worker**" in first
+        assert second == ""
+        assert rendered == {"available_subagents"}
+
+    def test_no_tracker_renders_every_call(self):
+        """Test behavior is unchanged when no tracker is passed."""
+        configs = [
+            SubAgentConfig(
+                name="worker",
+                description="Does work",
+                instructions="Work hard",
+            )
+        ]
+        assert get_subagent_system_prompt(configs) == get_subagent_system_prompt(configs)
@@ -83,3 +83,29 @@ class TestMessageBusProtocol:
 
         bus = InvalidBus()
         assert not isinstance(bus, MessageBusProtocol)
+
+
+class TestCachedProtocolChecks:
+    """Tests for the per-type cached protocol checkers."""
+
+    def test_is_subagent_deps(self):
+        """Test the cached deps check matches isinstance."""
+        from subagents_pydantic_ai.protocols import is_subagent_deps
+
+        class NotDeps:
+            pass
+
+        assert is_subagent_deps(ValidDeps())
+        assert is_subagent_deps(ValidDeps())  # Cached path
+        assert not is_subagent_deps(NotDeps())
+
+    def test_is_message_bus(self):
+        """Test the cached bus check matches isinstance."""
+        from subagents_pydantic_ai.protocols import is_message_bus
+
+        class NotBus:
+            pass
+
+        assert is_message_bus(InMemoryMessageBus())
+        assert is_message_bus(InMemoryMessageBus())  # Cached path
+        assert not is_message_bus(NotBus())
@@ -0,0 +1,317 @@
+"""Tests for the Redis-backed message bus.
+
+Uses a minimal in-memory fake of the `redis.asyncio` client surface the
+bus relies on (lpush/rpop/brpop/delete/pipeline), so no Redis server is
+required.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from subagents_pydantic_ai.redis_bus import (
+    RedisMessageBus,
+    _deserialize_message,
+    _serialize_message,
+)
+from subagents_pydantic_ai.types import AgentMessage, MessageType
+
+
+class FakePipeline:
+    """Collects commands and applies them to the fake store on execute."""
+
+    def __init__(self, store: dict[str, list[str]]):
+        self._store = store
+        self._commands: list[tuple[str, str]] = []
+
+    async def __aenter__(self) -> FakePipeline:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        pass
+
+    def lpush(self, key: str, value: str) -> None:
+        self._commands.append((key, value))
+
+    async def execute(self) -> None:
+        for key, value in self._commands:
+            self._store.setdefault(key, []).insert(0, value)
+        self._commands.clear()
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis.asyncio client used by the bus."""
+
+    def __init__(self):
+        self.store: dict[str, list[str]] = {}
+        self.closed = False
+
+    def pipeline(self, transaction: bool = True) -> FakePipeline:
+        return FakePipeline(self.store)
+
+    async def lpush(self, key: str, value: str) -> None:
+        self.store.setdefault(key, []).insert(0, value)
+
+    async def rpop(self, key: str) -> str | None:
+        values = self.store.get(key)
+        if not values:
+            return None
+        return values.pop()
+
+    async def brpop(self, keys: list[str], timeout: float = 0) -> tuple[str, str] | None:
+        deadline = asyncio.get_running_loop().time() + timeout
+        while True:
+            for key in keys:
+                value = await self.rpop(key)
+                if value is not None:
+                    return (key, value)
+            if asyncio.get_running_loop().time() >= deadline:
+                return None
+            await asyncio.sleep(0.005)
+
+    async def delete(self, key: str) -> None:
+        self.store.pop(key, None)
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@pytest.fixture
+def fake_redis() -> FakeRedis:
+    """Create a fake Redis client."""
+    return FakeRedis()
+
+
+@pytest.fixture
+def redis_bus(fake_redis: FakeRedis) -> RedisMessageBus:
+    """Create a Redis bus backed by the fake client."""
+    return RedisMessageBus(redis_client=fake_redis, batch_size=4, batch_timeout=0.01)
+
+
+def make_message(receiver: str = "worker", **kwargs: Any) -> AgentMessage:
+    """Create a test message."""
+    defaults: dict[str, Any] = {
+        "type": MessageType.TASK_UPDATE,
+        "sender": "parent",
+        "receiver": receiver,
+        "payload": {"status": "working"},
+        "task_id": "task-1",
+    }
+    defaults.update(kwargs)
+    return AgentMessage(**defaults)
+
+
+class TestSerialization:
+    def test_round_trip(self):
+        """Test messages survive serialize/deserialize."""
+        msg = make_message(correlation_id=7)
+        restored = _deserialize_message(_serialize_message(msg))
+
+        assert restored.type == msg.type
+        assert restored.sender == msg.sender
+        assert restored.receiver == msg.receiver
+        assert restored.payload == msg.payload
+        assert restored.task_id == msg.task_id
+        assert restored.id == msg.id
+        assert restored.timestamp == msg.timestamp
+        assert restored.correlation_id == 7
+
+
+class TestRedisMessageBus:
+    def test_register_agent(self, redis_bus: RedisMessageBus):
+        """Test agent registration."""
+        redis_bus.register_agent("worker")
+        assert redis_bus.is_registered("worker")
+        assert "worker" in redis_bus.registered_agents()
+
+    def test_register_duplicate_raises(self, redis_bus: RedisMessageBus):
+        """Test duplicate registration raises."""
+        redis_bus.register_agent("worker")
+        with pytest.raises(ValueError, match="already registered"):
+            redis_bus.register_agent("worker")
+
+    def test_unregister_agent(self, redis_bus: RedisMessageBus):
+        """Test agent unregistration."""
+        redis_bus.register_agent("worker")
+        redis_bus.unregister_agent("worker")
+        assert not redis_bus.is_registered("worker")
+
+    @pytest.mark.asyncio
+    async def test_send_unregistered_raises(self, redis_bus: RedisMessageBus):
+        """Test send to unregistered agent raises KeyError."""
+        with pytest.raises(KeyError, match="not registered"):
+            await redis_bus.send(make_message("ghost"))
+
+    @pytest.mark.asyncio
+    async def test_send_and_get_messages(self, redis_bus: RedisMessageBus):
+        """Test messages are delivered after the batch flush."""
+        redis_bus.register_agent("worker")
+        await redis_bus.send(make_message(payload={"n": 1}))
+        await redis_bus.send(make_message(payload={"n": 2}))
+        await asyncio.sleep(0.05)  # Wait for the delayed flush
+
+        messages = await redis_bus.get_messages("worker")
+        assert [m.payload["n"] for m in messages] == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_send_many_flushes_immediately(self, redis_bus: RedisMessageBus):
+        """Test send_many delivers in one pipeline without waiting."""
+        redis_bus.register_agent("worker")
+        await redis_bus.send_many([make_message(payload={"n": i}) for i in range(3)])
+
+        messages = await redis_bus.get_messages("worker")
+        assert [m.payload["n"] for m in messages] == [0, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_send_many_validates_receivers_first(self, redis_bus: RedisMessageBus):
+        """Test send_many fails fast without partial delivery."""
+        redis_bus.register_agent("worker")
+        with pytest.raises(KeyError, match="ghost"):
+            await redis_bus.send_many([make_message("worker"), make_message("ghost")])
+
+        assert await redis_bus.get_messages("worker") == []
+
+    @pytest.mark.asyncio
+    async def test_batch_size_triggers_flush(self, redis_bus: RedisMessageBus):
+        """Test reaching batch_size flushes without waiting for the timeout."""
+        redis_bus.register_agent("worker")
+        for i in range(4):  # batch_size=4 in fixture
+            await redis_bus.send(make_message(payload={"n": i}))
+
+        messages = await redis_bus.get_messages("worker")
+        assert len(messages) == 4
+
+    @pytest.mark.asyncio
+    async def test_get_messages_unregistered_raises(self, redis_bus: RedisMessageBus):
+        """Test get_messages for unregistered agent raises."""
+        with pytest.raises(KeyError, match="not registered"):
+            await redis_bus.get_messages("ghost")
+
+    @pytest.mark.asyncio
+    async def test_get_messages_with_timeout(self, redis_bus: RedisMessageBus):
+        """Test get_messages waits for the first message."""
+        redis_bus.register_agent("worker")
+
+        async def later():
+            await asyncio.sleep(0.02)
+            await redis_bus.send_many([make_message()])
+
+        asyncio.create_task(later())
+        messages = await redis_bus.get_messages("worker", timeout=1.0)
+        assert len(messages) == 1
+
+    @pytest.mark.asyncio
+    async def test_get_messages_timeout_empty(self, redis_bus: RedisMessageBus):
+        """Test get_messages returns empty list on timeout."""
+        redis_bus.register_agent("worker")
+        messages = await redis_bus.get_messages("worker", timeout=0.02)
+        assert messages == []
+
+    @pytest.mark.asyncio
+    async def test_ask_and_answer(self, redis_bus: RedisMessageBus):
+        """Test request-response flow through response lists."""
+        redis_bus.register_agent("parent")
+        redis_bus.register_agent("worker")
+
+        async def responder():
+            messages: list[AgentMessage] = []
+            while not messages:
+                messages = await redis_bus.get_messages("worker")
+                await asyncio.sleep(0.005)
+            await redis_bus.answer(messages[0], "the answer")
+
+        asyncio.create_task(responder())
+        response = await redis_bus.ask("parent", "worker", "question?", "task-1", timeout=1.0)
+
+        assert response.type == MessageType.ANSWER
+        assert response.payload == "the answer"
+        assert response.receiver == "parent"
+
+    @pytest.mark.asyncio
+    async def test_ask_unregistered_raises(self, redis_bus: RedisMessageBus):
+        """Test ask to unregistered agent raises."""
+        with pytest.raises(KeyError, match="not registered"):
+            await redis_bus.ask("parent", "ghost", "question?", "task-1")
+
+    @pytest.mark.asyncio
+    async def test_ask_timeout(self, redis_bus: RedisMessageBus):
+        """Test ask raises TimeoutError when no answer arrives."""
+        redis_bus.register_agent("worker")
+        with pytest.raises(asyncio.TimeoutError):
+            await redis_bus.ask("parent", "worker", "question?", "task-1", timeout=0.02)
+
+    @pytest.mark.asyncio
+    async def test_answer_without_correlation_goes_to_inbox(self, redis_bus: RedisMessageBus):
+        """Test answer falls back to inbox delivery without correlation_id."""
+        redis_bus.register_agent("parent")
+        original = make_message(
+            "worker",
+            type=MessageType.QUESTION,
+            sender="parent",
+            correlation_id=None,
+        )
+
+        await redis_bus.answer(original, "fallback answer")
+        await asyncio.sleep(0.05)
+
+        messages = await redis_bus.get_messages("parent")
+        assert len(messages) == 1
+        assert messages[0].payload == "fallback answer"
+
+    @pytest.mark.asyncio
+    async def test_aclose_flushes_and_closes(
+        self, redis_bus: RedisMessageBus, fake_redis: FakeRedis
+    ):
+        """Test aclose flushes pending messages and closes the client."""
+        redis_bus.register_agent("worker")
+        await redis_bus.send(make_message())
+        await redis_bus.aclose()
+
+        assert fake_redis.closed
+        assert len(fake_redis.store["subagents:agent:worker"]) == 1
+
+    async def test_aclose_with_nothing_pending(
+        self, redis_bus: RedisMessageBus, fake_redis: FakeRedis
+    ):
+        """Test aclose with no buffered messages or flush timer just closes."""
+        await redis_bus.aclose()
+
+        assert fake_redis.closed
+        assert fake_redis.store == {}
+
+    def test_default_client_built_from_url(
+        self, monkeypatch: pytest.MonkeyPatch, fake_redis: FakeRedis
+    ):
+        """Test the bus builds its own client from the URL when none is given."""
+        import sys
+        import types
+
+        urls: list[str] = []
+
+        def from_url(url: str) -> FakeRedis:
+            urls.append(url)
+            return fake_redis
+
+        aio_module = types.ModuleType("redis.asyncio")
+        aio_module.from_url = from_url  # type: ignore[attr-defined]
+        redis_module = types.ModuleType("redis")
+        redis_module.asyncio = aio_module  # type: ignore[attr-defined]
+        monkeypatch.setitem(sys.modules, "redis", redis_module)
+        monkeypatch.setitem(sys.modules, "redis.asyncio", aio_module)
+
+        bus = RedisMessageBus("redis://example:6379/2")
+
+        assert urls == ["redis://example:6379/2"]
+        assert bus._redis is fake_redis
+
+
+class TestCreateMessageBusRedis:
+    def test_factory_creates_redis_bus(self, fake_redis: FakeRedis):
+        """Test create_message_bus supports the redis backend."""
+        from subagents_pydantic_ai.message_bus import create_message_bus
+
+        bus = create_message_bus("redis", redis_client=fake_redis)
+        assert isinstance(bus, RedisMessageBus)
@@ -233,6 +233,18 @@ class TestDynamicAgentRegistry:
         assert "researcher [gpt-4]: Researches topics" in summary
         assert "writer [default]: Writes content" in summary
 
+    def test_max_agents_zero_blocks_registration(self):
+        """Test max_agents=0 forbids any registration instead of meaning unlimited."""
+        registry = DynamicAgentRegistry(max_agents=0)
+        config = SubAgentConfig(
+            name="test-agent",
+            description="A test agent",
+            instructions="Do tests",
+        )
+
+        with pytest.raises(ValueError, match="Maximum number of agents"):
+            registry.register(config, MockAgent("test-agent"))
+
     def test_no_max_agents_limit(self):
         """Test registry with no max_agents limit."""
         registry = DynamicAgentRegistry()  # No max_agents
@@ -247,3 +259,145 @@ class TestDynamicAgentRegistry:
             registry.register(config, MockAgent(f"agent-{i}"))
 
         assert registry.count() == 100
+
+
+class TestSummaryCaching:
+    """Tests for get_summary caching."""
+
+    def test_summary_cached_until_mutation(self, registry: DynamicAgentRegistry):
+        """Test repeated calls reuse the rendered string, mutations bust it."""
+        config = SubAgentConfig(
+            name="researcher",
+            description="Researches topics",
+            instructions="Do research",
+        )
+        registry.register(config, MockAgent("researcher"))
+
+        first = registry.get_summary()
+        assert registry.get_summary() is first
+
+        registry.remove("researcher")
+        assert registry.get_summary() == "No dynamically created agents."
+
+    def test_summary_refreshed_after_register(self, registry: DynamicAgentRegistry):
+        """Test a new registration shows up in the next summary."""
+        assert registry.get_summary() == "No dynamically created agents."
+
+        config = SubAgentConfig(
+            name="writer",
+            description="Writes content",
+            instructions="Write stuff",
+        )
+        registry.register(config, MockAgent("writer"))
+
+        assert "writer" in registry.get_summary()
+
+
+class TestBulkRegister:
+    """Tests for bulk_register."""
+
+    def _entries(self, count: int) -> list:
+        return [
+            (
+                SubAgentConfig(
+                    name=f"agent-{i}",
+                    description=f"Agent {i}",
+                    instructions="Do stuff",
+                ),
+                MockAgent(f"agent-{i}"),
+            )
+            for i in range(count)
+        ]
+
+    def test_bulk_register(self, registry: DynamicAgentRegistry):
+        """Test registering a batch in one call."""
+        registry.bulk_register(self._entries(3))
+
+        assert registry.count() == 3
+        assert registry.get("agent-1") is not None
+        assert registry.get_config("agent-2") is not None
+
+    def test_bulk_register_duplicate_raises(self, registry: DynamicAgentRegistry):
+        """Test a duplicate anywhere in the batch registers nothing."""
+        entries = self._entries(2)
+        registry.register(entries[1][0], entries[1][1])
+
+        with pytest.raises(ValueError, match="already exists"):
+            registry.bulk_register(entries)
+
+        assert not registry.exists("agent-0")
+
+    def test_bulk_register_respects_max_agents(self):
+        """Test the limit is checked against the whole batch."""
+        registry = DynamicAgentRegistry(max_agents=2)
+
+        with pytest.raises(ValueError, match="Maximum number of agents"):
+            registry.bulk_register(self._entries(3))
+
+        assert registry.count() == 0
+
+
+class TestListSnapshots:
+    """Tests for the cached list_* snapshots."""
+
+    def test_list_agents_reflects_mutations(self, registry: DynamicAgentRegistry):
+        """Test the cached snapshot is refreshed after register/remove."""
+        config = SubAgentConfig(
+            name="test-agent",
+            description="A test agent",
+            instructions="Do tests",
+        )
+        registry.register(config, MockAgent("test-agent"))
+
+        assert registry.list_agents() == ["test-agent"]
+        assert registry.list_agents() == ["test-agent"]  # Cached path
+
+        registry.remove("test-agent")
+        assert registry.list_agents() == []
+
+    def test_list_results_are_independent(self, registry: DynamicAgentRegistry):
+        """Test each call returns a list the caller may mutate freely."""
+        config = SubAgentConfig(
+            name="test-agent",
+            description="A test agent",
+            instructions="Do tests",
+        )
+        registry.register(config, MockAgent("test-agent"))
+
+        first = registry.list_agents()
+        first.append("bogus")
+
+        assert registry.list_agents() == ["test-agent"]
+
+    def test_list_configs_and_compiled_cached(self, registry: DynamicAgentRegistry):
+        """Test repeated config/compiled listings reuse the snapshot."""
+        config = SubAgentConfig(
+            name="test-agent",
+            description="A test agent",
+            instructions="Do tests",
+        )
+        registry.register(config, MockAgent("test-agent"))
+
+        assert registry.list_configs() == registry.list_configs()  # Cached path
+        assert registry.list_compiled() == registry.list_compiled()  # Cached path
+        assert registry.list_configs()[0]["name"] == "test-agent"
+        assert registry.list_compiled()[0].name == "test-agent"
+
+
+class TestContainerDunders:
+    """Tests for `in` and `len` support."""
+
+    def test_contains_and_len(self, registry: DynamicAgentRegistry):
+        """Test the dunders mirror exists/count."""
+        assert len(registry) == 0
+        assert "test-agent" not in registry
+
+        config = SubAgentConfig(
+            name="test-agent",
+            description="A test agent",
+            instructions="Do tests",
+        )
+        registry.register(config, MockAgent("test-agent"))
+
+        assert "test-agent" in registry
+        assert len(registry) == 1
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import json
 
+import pytest
+
 from subagents_pydantic_ai.spec import SubAgentSpec
 from subagents_pydantic_ai.types import SubAgentConfig
 
@@ -332,3 +334,22 @@ class TestSubAgentSpecImport:
         import subagents_pydantic_ai
 
         assert "SubAgentSpec" in subagents_pydantic_ai.__all__
+
+
+class TestLazyExports:
+    """Tests for the PEP 562 lazy loading of package exports."""
+
+    def test_unknown_attribute_raises(self):
+        """Unknown names raise AttributeError like an eager module would."""
+        import subagents_pydantic_ai
+
+        with pytest.raises(AttributeError, match="nonexistent"):
+            subagents_pydantic_ai.nonexistent  # noqa: B018
+
+    def test_dir_lists_lazy_symbols(self):
+        """dir() exposes lazy exports before they are first accessed."""
+        import subagents_pydantic_ai
+
+        listing = dir(subagents_pydantic_ai)
+        assert "TaskManager" in listing
+        assert "SubAgentSpec" in listing
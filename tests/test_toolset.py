@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -15,6 +15,7 @@ from subagents_pydantic_ai.toolset import (
     _create_general_purpose_config,
     _run_async,
     _run_sync,
+    _SubagentState,
 )
 from subagents_pydantic_ai.types import CompiledSubAgent, TaskPriority, TaskStatus
 
@@ -29,12 +30,21 @@ class MockDeps:
         return MockDeps(subagents={} if max_depth <= 0 else self.subagents.copy())
 
 
+def _compiled(config: SubAgentConfig) -> CompiledSubAgent:
+    """Wrap a config the way _compile_subagent would, without building an agent."""
+    return CompiledSubAgent(
+        name=config["name"],
+        description=config["description"],
+        config=config,
+    )
+
+
 @dataclass
 class MockRunContext:
     """Mock run context for testing."""
 
     deps: MockDeps
-    _subagent_state: dict[str, Any] | None = None
+    _subagent_state: _SubagentState | None = None
 
 
 class MockUsage:
@@ -83,7 +93,16 @@ class TestCreateGeneralPurposeConfig:
 class TestCompileSubagent:
     """Tests for _compile_subagent."""
 
-    def test_compile_with_default_model(self):
+    @pytest.fixture
+    def mock_agent_class(self, monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+        """Swap toolset.Agent for a mock via one attribute set, not a patch block."""
+        # The code under test only stores the created agent, so the return
+        # value can be a bare sentinel instead of a full MagicMock.
+        mock = MagicMock(return_value=object())
+        monkeypatch.setattr("subagents_pydantic_ai.toolset.Agent", mock)
+        return mock
+
+    def test_compile_with_default_model(self, mock_agent_class: MagicMock):
         """Test compiling subagent with default model."""
         from subagents_pydantic_ai.toolset import _compile_subagent
 
@@ -93,16 +112,14 @@ class TestCompileSubagent:
             instructions="Test instructions",
         )
 
-        with patch("subagents_pydantic_ai.toolset.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-            compiled = _compile_subagent(config, "openai:gpt-4")
+        compiled = _compile_subagent(config, "openai:gpt-4")
 
-            assert compiled.name == "test-agent"
-            assert compiled.description == "Test agent"
-            assert compiled.agent is not None
-            assert compiled.config == config
+        assert compiled.name == "test-agent"
+        assert compiled.description == "Test agent"
+        assert compiled.agent is not None
+        assert compiled.config == config
 
-    def test_compile_with_custom_model(self):
+    def test_compile_with_custom_model(self, mock_agent_class: MagicMock):
         """Test compiling subagent with custom model."""
         from subagents_pydantic_ai.toolset import _compile_subagent
 
@@ -113,15 +130,13 @@ class TestCompileSubagent:
             model="openai:gpt-3.5-turbo",
         )
 
-        with patch("subagents_pydantic_ai.toolset.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-            compiled = _compile_subagent(config, "openai:gpt-4")
+        compiled = _compile_subagent(config, "openai:gpt-4")
 
-            assert compiled.agent is not None
-            # Should use config's model, not default
-            mock_agent_class.assert_called_once()
-            call_kwargs = mock_agent_class.call_args
-            assert call_kwargs[0][0] == "openai:gpt-3.5-turbo"
+        assert compiled.agent is not None
+        # Should use config's model, not default
+        mock_agent_class.assert_called_once()
+        call_kwargs = mock_agent_class.call_args
+        assert call_kwargs[0][0] == "openai:gpt-3.5-turbo"
 
     def test_compile_with_model_object(self):
         """Test compiling subagent with a Model object instead of string."""
@@ -141,7 +156,7 @@ class TestCompileSubagent:
         assert compiled.name == "test-agent"
         assert compiled.agent is not None
 
-    def test_compile_with_model_object_in_config(self):
+    def test_compile_with_model_object_in_config(self, mock_agent_class: MagicMock):
         """Test compiling subagent with a Model object in SubAgentConfig."""
         from pydantic_ai.models.test import TestModel
 
@@ -155,16 +170,14 @@ class TestCompileSubagent:
             model=test_model,
         )
 
-        with patch("subagents_pydantic_ai.toolset.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-            compiled = _compile_subagent(config, "openai:gpt-4")
+        compiled = _compile_subagent(config, "openai:gpt-4")
 
-            assert compiled.agent is not None
-            # Should use config's Model object, not default string
-            call_args = mock_agent_class.call_args
-            assert call_args[0][0] is test_model
+        assert compiled.agent is not None
+        # Should use config's Model object, not default string
+        call_args = mock_agent_class.call_args
+        assert call_args[0][0] is test_model
 
-    def test_compile_with_custom_toolsets(self):
+    def test_compile_with_custom_toolsets(self, mock_agent_class: MagicMock):
         """Test compiling subagent with custom toolsets."""
         from pydantic_ai.toolsets import FunctionToolset
 
@@ -183,18 +196,15 @@ class TestCompileSubagent:
             toolsets=[custom_toolset],
         )
 
-        with patch("subagents_pydantic_ai.toolset.Agent") as mock_agent_class:
-            mock_agent = MagicMock()
-            mock_agent_class.return_value = mock_agent
-            compiled = _compile_subagent(config, "openai:gpt-4")
+        compiled = _compile_subagent(config, "openai:gpt-4")
 
-            assert compiled.agent is not None
-            # Should pass both ask_parent and custom toolset via constructor
-            call_kwargs = mock_agent_class.call_args
-            passed_toolsets = call_kwargs.kwargs.get("toolsets", [])
-            assert len(passed_toolsets) == 2
+        assert compiled.agent is not None
+        # Should pass both ask_parent and custom toolset via constructor
+        call_kwargs = mock_agent_class.call_args
+        passed_toolsets = call_kwargs.kwargs.get("toolsets", [])
+        assert len(passed_toolsets) == 2
 
-    def test_compile_with_agent_kwargs(self):
+    def test_compile_with_agent_kwargs(self, mock_agent_class: MagicMock):
         """Test compiling subagent with agent_kwargs (e.g., builtin_tools)."""
         from subagents_pydantic_ai.toolset import _compile_subagent
 
@@ -205,15 +215,13 @@ class TestCompileSubagent:
             agent_kwargs={"retries": 3, "result_retries": 2},
         )
 
-        with patch("subagents_pydantic_ai.toolset.Agent") as mock_agent_class:
-            mock_agent_class.return_value = MagicMock()
-            _compile_subagent(config, "openai:gpt-4")
+        _compile_subagent(config, "openai:gpt-4")
 
-            # Verify agent_kwargs were passed
-            mock_agent_class.assert_called_once()
-            call_kwargs = mock_agent_class.call_args
-            assert call_kwargs.kwargs.get("retries") == 3
-            assert call_kwargs.kwargs.get("result_retries") == 2
+        # Verify agent_kwargs were passed
+        mock_agent_class.assert_called_once()
+        call_kwargs = mock_agent_class.call_args
+        assert call_kwargs.kwargs.get("retries") == 3
+        assert call_kwargs.kwargs.get("result_retries") == 2
 
     def test_compile_with_prebuilt_agent(self):
         """Pre-built agent in config is used as-is, skipping default creation."""
@@ -287,6 +295,27 @@ class TestCreateAskParentToolset:
         assert "Error" in result
         assert "no communication channel" in result
 
+    @pytest.mark.asyncio
+    async def test_ask_parent_reads_ambient_state(self):
+        """Test ask_parent resolves state from the ContextVar binding."""
+        from subagents_pydantic_ai.toolset import _subagent_state_var
+
+        toolset = _create_ask_parent_toolset()
+        ask_parent_tool = toolset.tools["ask_parent"]
+
+        async def mock_callback(q: str) -> str:
+            return f"Answer to: {q}"
+
+        token = _subagent_state_var.set(_SubagentState(ask_callback=mock_callback))
+        try:
+            # Deps carry no _subagent_state — the var alone must resolve it.
+            ctx = MockRunContext(deps=MockDeps())
+            result = await ask_parent_tool.function(ctx, "what is 2+2?")
+        finally:
+            _subagent_state_var.reset(token)
+
+        assert result == "Answer to: what is 2+2?"
+
     @pytest.mark.asyncio
     async def test_ask_parent_with_callback(self):
         """Test ask_parent with callback."""
@@ -298,7 +327,7 @@ class TestCreateAskParentToolset:
             return f"Answer to: {q}"
 
         deps = MockDeps()
-        deps._subagent_state = {"ask_callback": mock_callback}
+        deps._subagent_state = _SubagentState(ask_callback=mock_callback)
         ctx = MockRunContext(deps=deps)
 
         result = await ask_parent_tool.function(ctx, "what is 2+2?")
@@ -345,10 +374,7 @@ class TestCreateAskParentToolset:
         tm.handles["task-123"] = handle
 
         deps = MockDeps()
-        deps._subagent_state = {
-            "task_manager": tm,
-            "task_id": "task-123",
-        }
+        deps._subagent_state = _SubagentState(task_manager=tm, task_id="task-123")
         ctx = MockRunContext(deps=deps)
 
         # Setup answer in background — resolve the future
@@ -393,6 +419,22 @@ class TestCreateSubagentToolset:
             assert "soft_cancel_task" in toolset.tools
             assert "hard_cancel_task" in toolset.tools
 
+    def test_custom_task_description_skips_build(self):
+        """Test a caller-supplied task description bypasses the dynamic build."""
+        config = SubAgentConfig(
+            name="general-purpose",
+            description="General purpose agent",
+            instructions="Help with tasks",
+        )
+
+        with patch(
+            "subagents_pydantic_ai.toolset._compile_subagent",
+            return_value=_make_mock_compiled_subagent(config),
+        ):
+            toolset = create_subagent_toolset(descriptions={"task": "Custom task tool."})
+
+            assert toolset.tools["task"].description == "Custom task tool."
+
     def test_creates_toolset_with_subagents(self):
         """Test creating toolset with custom subagents."""
         config = SubAgentConfig(
@@ -686,7 +728,7 @@ class TestRunSync:
 
         result = await _run_sync(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -709,7 +751,7 @@ class TestRunSync:
 
         result = await _run_sync(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -743,7 +785,7 @@ class TestRunSync:
 
         await _run_sync(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=deps,
             task_id="task-123",
@@ -751,7 +793,7 @@ class TestRunSync:
         )
 
         state = captured["deps"]._subagent_state
-        assert state["ask_callback"] is ask_user
+        assert state.ask_callback is ask_user
 
     @pytest.mark.asyncio
     async def test_run_sync_no_ask_user_does_not_touch_deps(self):
@@ -767,7 +809,7 @@ class TestRunSync:
 
         await _run_sync(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=deps,
             task_id="task-123",
@@ -798,7 +840,7 @@ class TestRunAsync:
 
         result = await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -831,7 +873,7 @@ class TestRunAsync:
 
         await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -870,7 +912,7 @@ class TestRunAsync:
 
         await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-456",
@@ -922,6 +964,50 @@ class TestToolsetIntegration:
 
             assert result == "Sync result"
 
+    @pytest.mark.asyncio
+    async def test_task_prefers_with_nesting_depth(self):
+        """task() uses the optional cheap snapshot over clone_for_subagent."""
+
+        @dataclass
+        class SnapshotDeps(MockDeps):
+            depth_calls: list[int] = field(default_factory=list)
+
+            def with_nesting_depth(self, max_depth: int) -> SnapshotDeps:
+                self.depth_calls.append(max_depth)
+                return replace(self, subagents={} if max_depth <= 0 else self.subagents)
+
+        config = SubAgentConfig(
+            name="helper",
+            description="Helps with tasks",
+            instructions="Help with things",
+        )
+
+        with (
+            patch(
+                "subagents_pydantic_ai.toolset._compile_subagent",
+                return_value=_make_mock_compiled_subagent(config),
+            ),
+            patch(
+                "subagents_pydantic_ai.toolset._run_sync",
+                new_callable=AsyncMock,
+                return_value="Sync result",
+            ),
+        ):
+            toolset = create_subagent_toolset(
+                subagents=[config],
+                include_general_purpose=False,
+                max_nesting_depth=2,
+            )
+
+            task_tool = toolset.tools["task"]
+
+            deps = SnapshotDeps()
+            ctx = MockRunContext(deps=deps)
+            result = await task_tool.function(ctx, "do something", "helper", "sync")
+
+            assert result == "Sync result"
+            assert deps.depth_calls == [1]
+
     @pytest.mark.asyncio
     async def test_task_sync_forwards_ask_user(self):
         """create_subagent_toolset threads ask_user into _run_sync calls."""
@@ -989,6 +1075,55 @@ class TestToolsetIntegration:
 
             assert "Task started" in result
 
+    @pytest.mark.asyncio
+    async def test_task_id_regenerated_on_collision(self):
+        """Test a colliding task ID is regenerated while still tracked."""
+        from subagents_pydantic_ai.types import TaskHandle
+
+        config = SubAgentConfig(
+            name="worker",
+            description="Does work",
+            instructions="Work on things",
+        )
+
+        async def fake_run_async(**kwargs: Any) -> str:
+            # Track the ID like the real dispatch would, so a later call
+            # with the same random bytes has to regenerate.
+            task_id = kwargs["task_id"]
+            kwargs["task_manager"].handles[task_id] = TaskHandle(
+                task_id=task_id,
+                subagent_name="worker",
+                description="test",
+            )
+            return f"Task started. ID: {task_id}"
+
+        with (
+            patch(
+                "subagents_pydantic_ai.toolset._compile_subagent",
+                return_value=_make_mock_compiled_subagent(config),
+            ),
+            patch(
+                "subagents_pydantic_ai.toolset._run_async",
+                side_effect=fake_run_async,
+            ),
+            patch(
+                "subagents_pydantic_ai.toolset.os.urandom",
+                side_effect=[b"\x00\x00\x00\x00", b"\x00\x00\x00\x00", b"\x00\x00\x00\x01"],
+            ),
+        ):
+            toolset = create_subagent_toolset(
+                subagents=[config],
+                include_general_purpose=False,
+            )
+            task_tool = toolset.tools["task"]
+            ctx = MockRunContext(deps=MockDeps())
+
+            first = await task_tool.function(ctx, "do something", "worker", "async")
+            second = await task_tool.function(ctx, "do more", "worker", "async")
+
+            assert "00000000" in first
+            assert "00000001" in second
+
 
 class TestAutoModeSelection:
     """Tests for auto-mode selection in task tool."""
@@ -1304,7 +1439,7 @@ class TestRunAsyncWithPriority:
 
         result = await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -1335,7 +1470,7 @@ class TestRunAsyncWithPriority:
 
         await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-456",
@@ -1370,10 +1505,7 @@ class TestAskParentEdgeCases:
         tm.handles["task-123"] = handle
 
         deps = MockDeps()
-        deps._subagent_state = {
-            "task_manager": tm,
-            "task_id": "task-123",
-        }
+        deps._subagent_state = _SubagentState(task_manager=tm, task_id="task-123")
         ctx = MockRunContext(deps=deps)
 
         # Patch wait_for to raise TimeoutError immediately
@@ -1390,10 +1522,7 @@ class TestAskParentEdgeCases:
         ask_parent_tool = toolset.tools["ask_parent"]
 
         deps = MockDeps()
-        deps._subagent_state = {
-            "task_manager": None,
-            "task_id": None,
-        }
+        deps._subagent_state = _SubagentState()
         ctx = MockRunContext(deps=deps)
 
         result = await ask_parent_tool.function(ctx, "question")
@@ -1412,10 +1541,7 @@ class TestAskParentEdgeCases:
         # Don't add any handle — task_id "missing-task" won't be found
 
         deps = MockDeps()
-        deps._subagent_state = {
-            "task_manager": tm,
-            "task_id": "missing-task",
-        }
+        deps._subagent_state = _SubagentState(task_manager=tm, task_id="missing-task")
         ctx = MockRunContext(deps=deps)
 
         result = await ask_parent_tool.function(ctx, "question")
@@ -2046,7 +2172,7 @@ class TestRunAsyncEdgeCases:
         # This should not fail even though agent is already registered
         result = await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-123",
@@ -2075,7 +2201,7 @@ class TestRunAsyncEdgeCases:
 
         await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="do the thing",
             deps=MockDeps(),
             task_id="task-cancel",
@@ -2219,6 +2345,68 @@ class TestCheckTaskStatusBranches:
             assert "running" in status.lower()
             assert "Running for:" in status
 
+    @pytest.mark.asyncio
+    async def test_check_task_elapsed_time_prefers_monotonic_stamp(self):
+        """Test elapsed time uses the monotonic stamp when the dispatch set one."""
+        import time
+        from datetime import datetime
+
+        from subagents_pydantic_ai import InMemoryMessageBus
+        from subagents_pydantic_ai.message_bus import TaskManager
+        from subagents_pydantic_ai.types import TaskHandle, TaskStatus
+
+        config = SubAgentConfig(
+            name="worker",
+            description="Worker",
+            instructions="Work",
+        )
+
+        mock_compiled = CompiledSubAgent(
+            name=config["name"],
+            description=config["description"],
+            config=config,
+            agent=MagicMock(),
+        )
+
+        message_bus = InMemoryMessageBus()
+        task_manager = TaskManager(message_bus=message_bus)
+
+        # A handle the dispatch path stamped with the monotonic clock
+        handle = TaskHandle(
+            task_id="test-task-mono",
+            subagent_name="worker",
+            description="test task",
+            status=TaskStatus.RUNNING,
+            started_at=datetime.now(),
+            monotonic_started_at=time.monotonic() - 2.0,
+        )
+        task_manager.handles["test-task-mono"] = handle
+
+        with (
+            patch(
+                "subagents_pydantic_ai.toolset._compile_subagent",
+                return_value=mock_compiled,
+            ),
+            patch(
+                "subagents_pydantic_ai.toolset.TaskManager",
+                return_value=task_manager,
+            ),
+            patch(
+                "subagents_pydantic_ai.toolset.InMemoryMessageBus",
+                return_value=message_bus,
+            ),
+        ):
+            toolset = create_subagent_toolset(
+                subagents=[config],
+                include_general_purpose=False,
+            )
+
+            check_tool = toolset.tools["check_task"]
+            ctx = MockRunContext(deps=MockDeps())
+
+            status = await check_tool.function(ctx, "test-task-mono")
+            assert "Running for: 2." in status
+
     @pytest.mark.asyncio
     async def test_check_task_pending_without_started_at(self):
         """Test check_task for pending task without started_at."""
@@ -2676,7 +2864,7 @@ class TestUsageTracking:
 
         await _run_async(
             agent=mock_agent,
-            config=config,
+            subagent=_compiled(config),
             description="test",
             deps=MockDeps(),
             task_id="bare-1",
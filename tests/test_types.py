@@ -477,3 +477,13 @@ class TestTaskHandleExtended:
             priority=TaskPriority.HIGH,
         )
         assert handle.priority == TaskPriority.HIGH
+
+    def test_handle_coerces_plain_string_priority(self):
+        """Test a priority given as a plain string is stored as the enum member."""
+        handle = TaskHandle(
+            task_id="task-123",
+            subagent_name="researcher",
+            description="Research Python",
+            priority="high",
+        )
+        assert handle.priority is TaskPriority.HIGH